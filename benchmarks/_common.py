@@ -0,0 +1,35 @@
+"""
+Small helpers shared by the benchmark scripts found in this directory. These
+scripts aren't part of the test-suite; run them directly, e.g:
+
+    $ python benchmarks/bench_linked_list.py
+"""
+import os
+import sys
+import time
+
+# make `extra` importable when running the scripts from a source checkout
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def timed(func, *args, **kwargs):
+    """
+    Runs the given function once and returns a tuple of its result along with
+    the elapsed wall-clock time in seconds.
+    """
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def report(title, rows, header=("n", "seconds")):
+    """
+    Prints the given rows as a simple aligned table under the given title.
+    """
+    print(f"\n{title}")
+    widths = [
+        max(len(str(row[i])) for row in [header] + list(rows))
+        for i in range(len(header))
+    ]
+    for row in [header] + list(rows):
+        print("  ".join(str(col).rjust(w) for col, w in zip(row, widths)))
@@ -0,0 +1,127 @@
+"""
+Benchmarks the iterative search, insert and min/max paths of `BST()` against
+the recursive versions they replaced, on a tree of 1M random keys. Both
+versions run over the very same tree, only its class gets switched.
+
+It also shows that a degenerate tree (built from sorted keys) deeper than the
+recursion limit can only be searched by the iterative version.
+"""
+import random
+import sys
+import warnings
+
+from _common import timed, report
+
+from extra.trees.bst import BST
+
+
+class RecursiveBST(BST):
+    """
+    The previous recursive implementation, kept here as the baseline.
+    """
+
+    def _get_max_node(self, start_node):
+        if start_node.get_right() is None:
+            return start_node
+        return self._get_max_node(start_node.get_right())
+
+    def _get_min_node(self, start_node):
+        if start_node.get_left() is None:
+            return start_node
+        return self._get_min_node(start_node.get_left())
+
+    def _search(self, find_val, start_node):
+        if find_val == start_node.get_data():
+            return start_node
+        elif find_val < start_node.get_data():
+            if start_node.get_left():
+                return self._search(find_val, start_node.get_left())
+            return start_node
+        else:
+            if start_node.get_right():
+                return self._search(find_val, start_node.get_right())
+            return start_node
+
+    def _insert_node(self, start_node, inserted_node):
+        value = inserted_node.get_data()
+        if value == start_node.get_data():
+            warnings.warn(f"`{value}` already exists", UserWarning)
+            return start_node
+        elif value < start_node.get_data():
+            if start_node.get_left():
+                return self._insert_node(start_node.get_left(), inserted_node)
+            start_node.set_left(inserted_node)
+        else:
+            if start_node.get_right():
+                return self._insert_node(start_node.get_right(), inserted_node)
+            start_node.set_right(inserted_node)
+        self._length += 1
+        return inserted_node
+
+
+def search_all(tree, values):
+    for value in values:
+        value in tree
+
+
+def insert_all(tree, values):
+    for value in values:
+        tree.insert(value)
+
+
+def get_min_max(tree, times):
+    for _ in range(times):
+        tree.get_min()
+        tree.get_max()
+
+
+def per_op(seconds, count):
+    return f"{seconds / count * 1e6:.2f}"
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    n, m = 1_000_000, 100_000
+    keys = rng.sample(range(4 * n), n)
+    tree = BST(keys)
+    probes = rng.sample(keys, m)
+    new_keys = [rng.random() for _ in range(m)]
+
+    rows = []
+    for name, cls in [("recursive", RecursiveBST), ("iterative", BST)]:
+        tree.__class__ = cls
+        _, search_time = timed(search_all, tree, probes)
+        _, insert_time = timed(insert_all, tree, new_keys)
+        _, min_max_time = timed(get_min_max, tree, m)
+        for value in new_keys:
+            tree.remove(value)
+        rows.append(
+            (
+                name,
+                per_op(search_time, m),
+                per_op(insert_time, m),
+                per_op(min_max_time, 2 * m),
+            )
+        )
+    report(
+        f"BST of {n} random keys: microseconds per operation",
+        rows,
+        header=("version", "search", "insert", "get_min/get_max"),
+    )
+
+    rows = []
+    length = 2 * sys.getrecursionlimit()
+    for name, cls in [("recursive", RecursiveBST), ("iterative", BST)]:
+        tree = BST(range(length))
+        tree.__class__ = cls
+        try:
+            _, elapsed = timed(search_all, tree, [length - 1])
+            result = f"{elapsed * 1e3:.2f} ms"
+        except RecursionError:
+            result = "RecursionError"
+        rows.append((name, result))
+    report(
+        f"Degenerate BST of {length} sorted keys: searching the deepest key",
+        rows,
+        header=("version", "result"),
+    )
@@ -0,0 +1,42 @@
+"""
+Benchmarks bulk-loading balanced trees out of `n` sorted keys using
+`from_sorted()` against inserting the keys one by one through the
+constructor.
+
+Inserting sorted keys one by one into a plain `BST()` builds a degenerate tree
+in quadratic time, so it's only measured for small inputs. The same goes for
+`Treap()` whose few distinct priorities make sorted insertions slow too.
+"""
+from _common import timed, report
+
+from extra.trees.bst import BST
+from extra.trees.avl import AVL
+from extra.trees.red_black_tree import RedBlackTree
+from extra.trees.treap import Treap
+
+
+# the biggest input to be inserted one by one for each class
+MAX_INSERTED = {
+    BST: 10_000,
+    AVL: 1_000_000,
+    RedBlackTree: 1_000_000,
+    Treap: 10_000,
+}
+
+
+if __name__ == "__main__":
+    for tree_class in [BST, AVL, RedBlackTree, Treap]:
+        rows = []
+        for n in [1_000, 10_000, 100_000, 1_000_000]:
+            keys = list(range(n))
+            _, from_sorted_time = timed(tree_class.from_sorted, keys)
+            insert_time = "-"
+            if n <= MAX_INSERTED[tree_class]:
+                _, insert_time = timed(tree_class, keys)
+                insert_time = f"{insert_time:.3f}"
+            rows.append((n, insert_time, f"{from_sorted_time:.3f}"))
+        report(
+            f"{tree_class.__name__}: building from n sorted keys",
+            rows,
+            header=("n", "insert x n (s)", "from_sorted (s)"),
+        )
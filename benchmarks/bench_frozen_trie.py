@@ -0,0 +1,89 @@
+"""
+Benchmarks the memory taken by `Trie()` and `RadixTrie()` holding random
+dictionary-like words against their frozen versions created by `freeze()`,
+along with the time taken by lookups and auto-completion in both of them.
+
+The number of words can be passed as the first argument, e.g:
+
+    $ python benchmarks/bench_frozen_trie.py 2000000
+"""
+import sys
+import random
+import string
+import tracemalloc
+
+from _common import timed, report
+
+from extra.trees.trie import Trie
+from extra.trees.radix_trie import RadixTrie
+
+
+def build(trie_class, words):
+    trie = trie_class()
+    for word in words:
+        trie.insert(word)
+    return trie
+
+
+def lookup_all(trie, queries):
+    for query in queries:
+        query in trie
+        trie.has_prefix(query)
+
+
+def complete_all(trie, prefixes):
+    for prefix in prefixes:
+        trie.auto_complete(prefix, k=10)
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    words = [
+        "".join(
+            rng.choice(string.ascii_lowercase)
+            for _ in range(rng.randint(3, 12))
+        )
+        for _ in range(n)
+    ]
+    queries = [rng.choice(words) for _ in range(100_000)]
+    prefixes = [word[:2] for word in queries[:1_000]]
+    rows = []
+    for trie_class in [Trie, RadixTrie]:
+        tracemalloc.start()
+        trie = build(trie_class, words)
+        trie_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        frozen = trie.freeze()
+        frozen_memory = len(frozen.to_bytes())
+        _, trie_lookup = timed(lookup_all, trie, queries)
+        _, frozen_lookup = timed(lookup_all, frozen, queries)
+        _, trie_complete = timed(complete_all, trie, prefixes)
+        _, frozen_complete = timed(complete_all, frozen, prefixes)
+        rows.append(
+            [
+                trie_class.__name__,
+                len(trie),
+                f"{trie_memory / 2 ** 20:.1f}",
+                f"{frozen_memory / 2 ** 20:.1f}",
+                f"{trie_lookup:.2f}",
+                f"{frozen_lookup:.2f}",
+                f"{trie_complete:.2f}",
+                f"{frozen_complete:.2f}",
+            ]
+        )
+    report(
+        f"{n} words: memory in MiB, 100000 lookups and 1000 top-10 "
+        + "completions in seconds",
+        rows,
+        header=(
+            "class",
+            "nodes",
+            "memory",
+            "frozen memory",
+            "lookups",
+            "frozen lookups",
+            "top-10",
+            "frozen top-10",
+        ),
+    )
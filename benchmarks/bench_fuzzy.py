@@ -0,0 +1,79 @@
+"""
+Benchmarks finding the words within an edit distance of one and two from
+misspelled tokens in a `RadixTrie()` of random dictionary-like words. Walking
+the trie once with `search_fuzzy()` is compared against generating every
+variant of the token with single insertions, deletions or substitutions and
+looking each of them up using `in`.
+"""
+import random
+import string
+
+from _common import timed, report
+
+from extra.trees.radix_trie import RadixTrie
+
+
+def get_variants(word, alphabet=string.ascii_lowercase):
+    splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+    variants = {left + right[1:] for left, right in splits if right}
+    variants |= {
+        left + ch + right[1:] for left, right in splits if right
+        for ch in alphabet
+    }
+    variants |= {
+        left + ch + right for left, right in splits for ch in alphabet
+    }
+    return variants
+
+
+def lookup_variants(rt, tokens, max_distance):
+    for token in tokens:
+        variants = {token}
+        for _ in range(max_distance):
+            variants = set().union(*map(get_variants, variants))
+        [variant for variant in variants if variant in rt]
+
+
+def search_all(rt, tokens, max_distance):
+    for token in tokens:
+        rt.search_fuzzy(token, max_distance)
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    rows = []
+    for n in [10_000, 100_000, 1_000_000]:
+        words = [
+            "".join(
+                rng.choice(string.ascii_lowercase)
+                for _ in range(rng.randint(3, 12))
+            )
+            for _ in range(n)
+        ]
+        rt = RadixTrie()
+        for word in words:
+            rt.insert(word)
+        tokens = []
+        for word in rng.sample(words, 200):
+            i = rng.randrange(len(word))
+            tokens.append(
+                word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1:]
+            )
+        for max_distance, times in [(1, 200), (2, 10)]:
+            _, variants_time = timed(
+                lookup_variants, rt, tokens[:times], max_distance
+            )
+            _, fuzzy_time = timed(search_all, rt, tokens[:times], max_distance)
+            rows.append(
+                [
+                    n,
+                    max_distance,
+                    f"{variants_time / times * 1e3:.3f}",
+                    f"{fuzzy_time / times * 1e3:.3f}",
+                ]
+            )
+    report(
+        "milliseconds per token",
+        rows,
+        header=("words", "distance", "look up variants", "search_fuzzy()"),
+    )
@@ -0,0 +1,72 @@
+"""
+Benchmarks a `GeneralizedSuffixTrie()` over a corpus of short random
+documents: the time taken to add all of them, the memory it retains per
+character, then the time of locating patterns with `get_occurrences()` and of
+`get_longest_common_substring()`.
+"""
+import gc
+import random
+import tracemalloc
+
+from _common import timed, report
+
+from extra.trees.generalized_suffix_trie import GeneralizedSuffixTrie
+
+
+def measure_memory(docs):
+    gc.collect()
+    tracemalloc.start()
+    gst = GeneralizedSuffixTrie(docs)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del gst
+    return current
+
+
+def locate_all(gst, patterns):
+    for pattern in patterns:
+        gst.get_occurrences(pattern)
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    rows = []
+    for num_docs in [1_000, 10_000, 100_000]:
+        docs = [
+            "".join(rng.choice("abcdefghijklmnop ") for _ in range(40))
+            for _ in range(num_docs)
+        ]
+        total_length = num_docs * 40
+        patterns = [
+            doc[idx: idx + 6]
+            for doc, idx in (
+                (rng.choice(docs), rng.randrange(34)) for _ in range(10_000)
+            )
+        ]
+        gst, add_time = timed(GeneralizedSuffixTrie, docs)
+        _, locate_time = timed(locate_all, gst, patterns)
+        _, lcs_time = timed(gst.get_longest_common_substring, k=2)
+        # tracing memory is slow, so skip it for the biggest corpus
+        bytes_per_char = "-"
+        if num_docs <= 10_000:
+            bytes_per_char = f"{measure_memory(docs) / total_length:.0f}"
+        rows.append(
+            (
+                num_docs,
+                f"{add_time:.2f}",
+                bytes_per_char,
+                f"{locate_time / len(patterns) * 1e6:.2f}",
+                f"{lcs_time:.2f}",
+            )
+        )
+    report(
+        "GeneralizedSuffixTrie() of documents of 40 characters",
+        rows,
+        header=(
+            "documents",
+            "add (s)",
+            "bytes/char",
+            "get_occurrences (us)",
+            "LCS k=2 (s)",
+        ),
+    )
@@ -0,0 +1,108 @@
+"""
+Benchmarks building a `MinHeap()` / `MaxHeap()` out of `n` random samples
+using the bottom-up `heapify()` against the previous approach which inserted
+the samples one by one.
+
+It also benchmarks a timer-wheel like workload where every insertion is
+followed by the cancellation (removal) of a random pending value, with and
+without the positions index (`indexed=True`).
+
+Finally, it benchmarks iterating over and representing a heap straight from
+the list-shaped heap against going through its tree-shaped version.
+"""
+import random
+
+from _common import timed, report
+
+from extra.trees.min_heap import MinHeap
+from extra.trees.max_heap import MaxHeap
+
+
+def build_by_insert(heap_class, values):
+    heap = heap_class()
+    for value in values:
+        heap.insert(value)
+    return heap
+
+
+def iterate(iterable):
+    for _ in iterable:
+        pass
+
+
+def insert_and_cancel(heap, values, cancelled):
+    for value, cancel in zip(values, cancelled):
+        heap.insert(value)
+        heap.remove(cancel)
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    for heap_class in [MinHeap, MaxHeap]:
+        rows = []
+        for n in [10_000, 100_000, 1_000_000, 5_000_000]:
+            values = [rng.random() for _ in range(n)]
+            _, heapify_time = timed(heap_class.heapify, values)
+            insert_time = "-"
+            if n <= 1_000_000:
+                _, insert_time = timed(build_by_insert, heap_class, values)
+                insert_time = f"{insert_time:.3f}"
+            rows.append((n, f"{heapify_time:.3f}", insert_time))
+        report(
+            f"{heap_class.__name__}: building from n random floats",
+            rows,
+            header=("n", "heapify (s)", "insert x n (s)"),
+        )
+
+    rows = []
+    for n in [1_000, 10_000, 50_000]:
+        pending = [rng.random() for _ in range(n)]
+        values = [rng.random() for _ in range(n)]
+        # every cancelled value is pending at the time of its cancellation
+        pool = list(pending)
+        cancelled = []
+        for value in values:
+            pool.append(value)
+            cancelled.append(pool.pop(rng.randrange(len(pool))))
+        times = []
+        for indexed in [True, False]:
+            heap = MinHeap.heapify(pending, indexed=indexed)
+            _, elapsed = timed(insert_and_cancel, heap, values, cancelled)
+            times.append(f"{elapsed:.3f}")
+        rows.append((n, *times))
+    report(
+        "MinHeap: n pending values, n x (insert() + remove())",
+        rows,
+        header=("n", "indexed (s)", "not indexed (s)"),
+    )
+
+    rows = []
+    for n in [10_000, 100_000, 1_000_000]:
+        heap = MinHeap.heapify([rng.random() for _ in range(n)])
+        _, iter_time = timed(iterate, heap)
+        _, tree_iter_time = timed(lambda: iterate(heap._transform()))
+        _, repr_time = timed(repr, heap)
+        repr_tree_time = "-"
+        if n <= 100_000:
+            _, repr_tree_time = timed(lambda: repr(heap._transform()))
+            repr_tree_time = f"{repr_tree_time:.3f}"
+        rows.append(
+            (
+                n,
+                f"{iter_time:.3f}",
+                f"{tree_iter_time:.3f}",
+                f"{repr_time:.3f}",
+                repr_tree_time,
+            )
+        )
+    report(
+        "MinHeap: iterating over / representing n random floats",
+        rows,
+        header=(
+            "n",
+            "iter (s)",
+            "iter tree (s)",
+            "repr (s)",
+            "repr tree (s)",
+        ),
+    )
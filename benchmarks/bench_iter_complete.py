@@ -0,0 +1,53 @@
+"""
+Benchmarks retrieving the first 20 completions of one-letter prefixes from a
+`RadixTrie()` holding random terms. The lazy `iter_complete()` generator is
+compared against `auto_complete()`, which builds the list of all completions
+before the first one can be shown.
+"""
+import random
+import string
+from itertools import islice
+
+from _common import timed, report
+
+from extra.trees.radix_trie import RadixTrie
+
+
+def first_eager(rt, prefixes, count):
+    for prefix in prefixes:
+        rt.auto_complete(prefix)[:count]
+
+
+def first_lazy(rt, prefixes, count):
+    for prefix in prefixes:
+        list(islice(rt.iter_complete(prefix), count))
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    count = 20
+    rows = []
+    for n in [10_000, 100_000, 1_000_000]:
+        rt = RadixTrie()
+        for _ in range(n):
+            rt.insert(
+                "".join(
+                    rng.choice(string.ascii_lowercase)
+                    for _ in range(rng.randint(3, 12))
+                )
+            )
+        prefixes = list(string.ascii_lowercase)
+        _, eager_time = timed(first_eager, rt, prefixes, count)
+        _, lazy_time = timed(first_lazy, rt, prefixes, count)
+        rows.append(
+            [
+                n,
+                f"{eager_time / len(prefixes) * 1e3:.3f}",
+                f"{lazy_time / len(prefixes) * 1e3:.3f}",
+            ]
+        )
+    report(
+        f"first {count} completions of a one-letter prefix: milliseconds",
+        rows,
+        header=("terms", "auto_complete", "iter_complete"),
+    )
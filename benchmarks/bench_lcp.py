@@ -0,0 +1,68 @@
+"""
+Benchmarks batches of `get_lowest_common_ancestor()` and `lcp()` queries
+between random suffixes of a `SuffixTrie()`. The constant-time queries answered
+from a sparse table over the LCP array are compared against the previous
+approach which joined the labels of the ancestors of both leaf nodes and
+compared them, which is only possible with the "radix_trie" engine.
+"""
+import random
+
+from _common import timed, report
+
+from extra.trees.radix_trie import get_lcp
+from extra.trees.suffix_trie import SuffixTrie
+
+
+def ancestors_lca_all(st, pairs):
+    for i, j in pairs:
+        get_lcp(
+            st._get_ancestors_data(st._leaf_nodes[i]),
+            st._get_ancestors_data(st._leaf_nodes[j]),
+        )
+
+
+def lca_all(st, pairs):
+    for i, j in pairs:
+        st.get_lowest_common_ancestor(i, j)
+
+
+def lcp_all(st, pairs):
+    for i, j in pairs:
+        st.lcp(i, j)
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    m = 100_000
+    rows = []
+    for n, engine in [
+        (10_000, "radix_trie"),
+        (100_000, "suffix_array"),
+        (1_000_000, "suffix_array"),
+    ]:
+        word = "".join(rng.choice("ab") for _ in range(n))
+        pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(m)]
+        st = SuffixTrie(word, engine=engine)
+        _, setup_time = timed(st._get_sparse_table)
+        row = [n, engine, f"{setup_time:.2f}"]
+        if engine == "radix_trie":
+            _, elapsed = timed(ancestors_lca_all, st, pairs)
+            row.append(f"{elapsed / m * 1e6:.2f}")
+        else:
+            row.append("-")
+        _, lca_time = timed(lca_all, st, pairs)
+        _, lcp_time = timed(lcp_all, st, pairs)
+        row += [f"{lca_time / m * 1e6:.2f}", f"{lcp_time / m * 1e6:.2f}"]
+        rows.append(row)
+    report(
+        f"{m} queries between random suffixes: microseconds per query",
+        rows,
+        header=(
+            "n",
+            "engine",
+            "setup (s)",
+            "ancestors LCA",
+            "LCA",
+            "lcp",
+        ),
+    )
@@ -0,0 +1,44 @@
+"""
+Benchmarks building a `LinkedList()` using `add_end()`. Before keeping a tail
+reference, every `add_end()` walked the whole chain which made building the
+list quadratic. The "walk" column reproduces that old behaviour by looking for
+the last node before inserting; it's only run for the small sizes.
+"""
+from _common import timed, report
+
+from extra.lists.linked_list import LinkedList
+
+
+def build_with_tail(n):
+    ll = LinkedList()
+    for i in range(n):
+        ll.add_end(i)
+    return ll
+
+
+def build_with_walk(n):
+    ll = LinkedList()
+    for i in range(n):
+        prev_node, curr_node = None, ll._head
+        for _ in range(len(ll)):
+            prev_node, curr_node = curr_node, curr_node.get_next()
+        ll._insert_value(prev_node, i)
+    return ll
+
+
+if __name__ == "__main__":
+    rows = []
+    for n in [1_000, 2_000, 4_000, 8_000, 125_000, 250_000, 500_000, 1_000_000]:
+        _, tail_time = timed(build_with_tail, n)
+        walk_time = "-"
+        if n <= 8_000:
+            _, walk_time = timed(build_with_walk, n)
+            walk_time = f"{walk_time:.3f}"
+        rows.append(
+            (n, f"{tail_time:.3f}", f"{tail_time / n * 1e6:.3f}", walk_time)
+        )
+    report(
+        "LinkedList.add_end() x n",
+        rows,
+        header=("n", "tail (s)", "tail (us/item)", "walk (s)"),
+    )
@@ -0,0 +1,86 @@
+"""
+Benchmarks a `MinHeap()` packing its values in an `array.array` of C doubles
+(`typecode="d"`) against the default `MinHeap()` keeping them in a `list`.
+
+It reports the memory retained by a heap of `n` random floats along with the
+peak memory used while building it, then the time taken by `heapify()`,
+`n` x `insert()` and `n` x `remove_min()`.
+"""
+import gc
+import random
+import tracemalloc
+
+from _common import timed, report
+
+from extra.trees.min_heap import MinHeap
+
+
+def measure_memory(n, typecode):
+    rng = random.Random(0)
+    gc.collect()
+    tracemalloc.start()
+    heap = MinHeap.heapify(
+        (rng.random() for _ in range(n)), typecode=typecode
+    )
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del heap
+    return current, peak
+
+
+def insert_all(heap, values):
+    for value in values:
+        heap.insert(value)
+
+
+def remove_all(heap):
+    for _ in range(len(heap)):
+        heap.remove_min()
+
+
+if __name__ == "__main__":
+    rows = []
+    for n in [100_000, 1_000_000, 5_000_000]:
+        row = [n]
+        for typecode in [None, "d"]:
+            current, peak = measure_memory(n, typecode)
+            row += [f"{current / 2**20:.1f}", f"{peak / 2**20:.1f}"]
+        rows.append(row)
+    report(
+        "MinHeap: memory of n random floats (MiB)",
+        rows,
+        header=("n", "list", "list peak", "array('d')", "array('d') peak"),
+    )
+
+    rng = random.Random(0)
+    rows = []
+    for n in [100_000, 1_000_000]:
+        values = [rng.random() for _ in range(n)]
+        row = [n]
+        for typecode in [None, "d"]:
+            heap, heapify_time = timed(
+                MinHeap.heapify, values, typecode=typecode
+            )
+            _, remove_time = timed(remove_all, heap)
+            _, insert_time = timed(
+                insert_all, MinHeap(typecode=typecode), values
+            )
+            row += [
+                f"{heapify_time:.3f}",
+                f"{insert_time:.3f}",
+                f"{remove_time:.3f}",
+            ]
+        rows.append(row)
+    report(
+        "MinHeap: list vs array('d') throughput (s)",
+        rows,
+        header=(
+            "n",
+            "list heapify",
+            "list insert",
+            "list remove_min",
+            "array heapify",
+            "array insert",
+            "array remove_min",
+        ),
+    )
@@ -0,0 +1,58 @@
+"""
+Benchmarks `get_longest_palindrome()` and `count_palindromes()` of
+`SuffixTrie()` over random words. Manacher's algorithm, which finds the
+palindrome radius around every center in linear time, is compared against
+expanding around every center, which is quadratic in the worst case.
+"""
+import random
+
+from _common import timed, report
+
+from extra.trees.suffix_trie import SuffixTrie
+
+
+def expand_around_centers(word):
+    n = len(word)
+    longest = ""
+    for center in range(2 * n - 1):
+        lo, hi = center // 2, (center + 1) // 2
+        while lo >= 0 and hi < n and word[lo] == word[hi]:
+            lo -= 1
+            hi += 1
+        if hi - lo - 1 > len(longest):
+            longest = word[lo + 1: hi]
+    return longest
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    rows = []
+    for n, alphabet in [
+        (10_000, "ab"),
+        (10_000, "a"),
+        (100_000, "ab"),
+        (1_000_000, "ab"),
+    ]:
+        word = "".join(rng.choice(alphabet) for _ in range(n))
+        row = [n, alphabet]
+        if n <= 10_000:
+            _, elapsed = timed(expand_around_centers, word)
+            row.append(f"{elapsed:.3f}")
+        else:
+            row.append("-")
+        st = SuffixTrie(word, engine="suffix_array")
+        _, longest_time = timed(st.get_longest_palindrome)
+        _, count_time = timed(st.count_palindromes, 3)
+        row += [f"{longest_time:.3f}", f"{count_time:.3f}"]
+        rows.append(row)
+    report(
+        "Longest palindromic substring: seconds",
+        rows,
+        header=(
+            "n",
+            "alphabet",
+            "expand around centers",
+            "Manacher (longest)",
+            "count (cached radii)",
+        ),
+    )
@@ -0,0 +1,37 @@
+"""
+Benchmarks the two storage engines of `PriorityQueue()`: the "heap" engine
+(default) and the "linked_list" engine which scans the whole queue on every
+`dequeue()`. Each run enqueues `n` jobs with random priorities, then dequeues
+all of them alternating between the highest and the lowest priority.
+"""
+import random
+
+from _common import timed, report
+
+from extra.lists.priority_queue import PriorityQueue
+
+
+def run(engine, priorities):
+    pq = PriorityQueue(engine=engine)
+    for i, priority in enumerate(priorities):
+        pq.enqueue(i, priority=priority)
+    for i in range(len(priorities)):
+        pq.dequeue(lowest_priority=bool(i % 2))
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    rows = []
+    for n in [1_000, 5_000, 10_000, 50_000, 200_000]:
+        priorities = [rng.randint(0, 10_000) for _ in range(n)]
+        _, heap_time = timed(run, "heap", priorities)
+        linked_time = "-"
+        if n <= 10_000:
+            _, linked_time = timed(run, "linked_list", priorities)
+            linked_time = f"{linked_time:.3f}"
+        rows.append((n, f"{heap_time:.3f}", linked_time))
+    report(
+        "PriorityQueue: n x enqueue() + n x dequeue()",
+        rows,
+        header=("n", "heap (s)", "linked_list (s)"),
+    )
@@ -0,0 +1,58 @@
+"""
+Benchmarks bulk-loading a `SkipList()`. Before, the only way to build a skip
+list was calling `insert()` for every value where each call searches from the
+top-left corner. `from_sorted()` appends the values to the end of every level
+in one pass and `update()` sorts the new values and searches for each one
+starting from the predecessors of the previous one.
+"""
+import random
+
+from _common import timed, report
+
+from extra.lists.skip_list import SkipList
+
+
+def insert_all(sl, values):
+    for value in values:
+        sl.insert(value)
+
+
+if __name__ == "__main__":
+    rng = random.Random(1)
+    rows = []
+    for n in [10_000, 100_000, 1_000_000]:
+        values = sorted(rng.sample(range(10 * n), n))
+        for engine in ["array", "linked_list"]:
+            if n <= 100_000:
+                _, insert_time = timed(SkipList, values, engine=engine, seed=0)
+                insert_time = f"{insert_time:.3f}"
+            else:
+                insert_time = "-"
+            _, bulk_time = timed(
+                SkipList.from_sorted, values, engine=engine, seed=0
+            )
+            rows.append((n, engine, insert_time, f"{bulk_time:.3f}"))
+    report(
+        "Building a skip list out of n sorted values",
+        rows,
+        header=("n", "engine", "SkipList() s", "from_sorted() s"),
+    )
+
+    rows = []
+    n = 100_000
+    base = rng.sample(range(10 * n), n)
+    for m in [1_000, 10_000, 100_000]:
+        new_values = [rng.randrange(10 * n) for _ in range(m)]
+        for engine in ["array", "linked_list"]:
+            sl = SkipList.from_sorted(base, engine=engine, seed=0)
+            _, insert_time = timed(insert_all, sl, new_values)
+            sl = SkipList.from_sorted(base, engine=engine, seed=0)
+            _, update_time = timed(sl.update, new_values)
+            rows.append(
+                (m, engine, f"{insert_time:.3f}", f"{update_time:.3f}")
+            )
+    report(
+        f"Adding m random values to a skip list of {n:,} values",
+        rows,
+        header=("m", "engine", "insert() s", "update() s"),
+    )
@@ -0,0 +1,89 @@
+"""
+Benchmarks the "array" engine of `SkipList()`, which stores every value once in
+a slotted node holding the forward links of all its levels, against the
+"linked_list" engine where each level is a standalone `LinkedList()` holding a
+copy of every promoted value.
+
+It reports the memory retained by a skip list of `n` random floats, then the
+time taken by `n` x `insert()`, lookups, positional access and a full
+iteration. Hardware cache misses can't be counted from Python, the lookup and
+iteration timings are the closest proxy as they are dominated by pointer
+chasing.
+"""
+import gc
+import random
+import sys
+import tracemalloc
+
+from _common import timed, report
+
+from extra.lists.skip_list import SkipList
+
+
+def build(values, engine):
+    return SkipList(values, engine=engine, seed=0)
+
+
+def measure_memory(values, engine):
+    gc.collect()
+    tracemalloc.start()
+    sl = build(values, engine)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return sl, current
+
+
+def lookup_all(sl, queries):
+    return sum(1 for value in queries if value in sl)
+
+
+def index_all(sl, indices):
+    for idx in indices:
+        sl[idx]
+
+
+def iterate(sl):
+    for _ in sl:
+        pass
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    rng = random.Random(1)
+    memory_rows, time_rows = [], []
+    for n in sizes:
+        values = [rng.random() for _ in range(n)]
+        queries = rng.sample(values, 100_000 if n >= 100_000 else n)
+        indices = [rng.randrange(n) for _ in range(len(queries))]
+        for engine in ["linked_list", "array"]:
+            (sl, memory), build_time = timed(measure_memory, values, engine)
+            _, lookup_time = timed(lookup_all, sl, queries)
+            _, index_time = timed(index_all, sl, indices)
+            _, iter_time = timed(iterate, sl)
+            memory_rows.append(
+                (n, engine, f"{memory / 2**20:.1f}", f"{memory / n:.0f}")
+            )
+            time_rows.append(
+                (
+                    n,
+                    engine,
+                    f"{build_time:.2f}",
+                    f"{lookup_time / len(queries) * 1e6:.2f}",
+                    f"{index_time / len(indices) * 1e6:.2f}",
+                    f"{iter_time * 1e3:.0f}",
+                )
+            )
+            del sl
+    report(
+        "Memory retained by SkipList()",
+        memory_rows,
+        header=("n", "engine", "MiB", "bytes/item"),
+    )
+    report(
+        "SkipList() timings",
+        time_rows,
+        header=(
+            "n", "engine", "build (s)", "lookup (us)", "sl[i] (us)",
+            "iterate (ms)",
+        ),
+    )
@@ -0,0 +1,53 @@
+"""
+Benchmarks positional access on a `SkipList()`. Before storing span widths on
+the skip nodes, `sl[i]` and `del sl[i]` walked the zeroth level linearly. The
+"walk" column reproduces that old behaviour by indexing the zeroth-level
+`LinkedList()` directly.
+"""
+import random
+
+from _common import timed, report
+
+from extra.lists.skip_list import SkipList
+
+
+def get_with_widths(sl, indices):
+    for idx in indices:
+        sl[idx]
+
+
+def get_with_walk(sl, indices):
+    zeroth_list = sl._level_lists[0]
+    for idx in indices:
+        # NOTE: idx+1 to skip -∞
+        zeroth_list[idx + 1]
+
+
+def rank_all(sl, values):
+    for value in values:
+        sl.rank(value)
+
+
+if __name__ == "__main__":
+    random.seed(1)
+    rows = []
+    for n in [1_000, 10_000, 100_000]:
+        sl = SkipList(random.sample(range(10 * n), n), seed=0)
+        indices = [random.randrange(n) for _ in range(1_000)]
+        values = [random.randrange(10 * n) for _ in range(1_000)]
+        _, widths_time = timed(get_with_widths, sl, indices)
+        _, walk_time = timed(get_with_walk, sl, indices)
+        _, rank_time = timed(rank_all, sl, values)
+        rows.append(
+            (
+                n,
+                f"{widths_time * 1e3:.1f}",
+                f"{walk_time * 1e3:.1f}",
+                f"{rank_time * 1e3:.1f}",
+            )
+        )
+    report(
+        "1,000 positional lookups on SkipList()",
+        rows,
+        header=("n", "widths (ms)", "walk (ms)", "rank (ms)"),
+    )
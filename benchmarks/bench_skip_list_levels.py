@@ -0,0 +1,84 @@
+"""
+Benchmarks the level generator of `SkipList()`. Before, the height of every
+new value was decided by calling `random.choice(["head", "tail"])` once per
+coin flip on the global random state. The "coins" columns reproduce that by
+overriding `_draw_height()`, the "bits" columns draw the height from the
+trailing zeros of one random integer of the instance's own generator.
+"""
+import random
+
+from _common import timed, report
+
+from extra.lists.skip_list import SkipList
+
+
+class CoinFlipSkipList(SkipList):
+    def _draw_height(self):
+        height = 1
+        while random.choice(["head", "tail"]) == "head":
+            height += 1
+        return height
+
+
+def draw_heights(sl, n):
+    for _ in range(n):
+        sl._draw_height()
+
+
+def build(cls, values, engine):
+    return cls(values, engine=engine, seed=0)
+
+
+def get_shape(sl):
+    return [node.get_height() for node in iter_nodes(sl)]
+
+
+def iter_nodes(sl):
+    curr_node = sl._get_head()
+    while curr_node is not None:
+        yield curr_node
+        curr_node = curr_node.get_next()
+
+
+if __name__ == "__main__":
+    rng = random.Random(1)
+    n = 1_000_000
+    _, coins_time = timed(draw_heights, CoinFlipSkipList(seed=0), n)
+    _, bits_time = timed(draw_heights, SkipList(seed=0), n)
+    _, other_time = timed(draw_heights, SkipList(seed=0, probability=0.3), n)
+    report(
+        f"Drawing {n:,} heights",
+        [
+            ("coins", f"{coins_time:.3f}"),
+            ("bits (p=1/2)", f"{bits_time:.3f}"),
+            ("inversion (p=0.3)", f"{other_time:.3f}"),
+        ],
+        header=("generator", "seconds"),
+    )
+
+    rows = []
+    for n in [10_000, 100_000]:
+        values = [rng.random() for _ in range(n)]
+        for engine in ["array", "linked_list"]:
+            _, coins_time = timed(build, CoinFlipSkipList, values, engine)
+            _, bits_time = timed(build, SkipList, values, engine)
+            rows.append(
+                (
+                    n,
+                    engine,
+                    f"{coins_time / n * 1e6:.2f}",
+                    f"{bits_time / n * 1e6:.2f}",
+                )
+            )
+    report(
+        "SkipList() x insert()",
+        rows,
+        header=("n", "engine", "coins (us/item)", "bits (us/item)"),
+    )
+
+    # the same seed always builds the same shape
+    values = [rng.random() for _ in range(10_000)]
+    shapes = {
+        tuple(get_shape(build(SkipList, values, "array"))) for _ in range(3)
+    }
+    print(f"\nreproducible shape with seed=0: {len(shapes) == 1}")
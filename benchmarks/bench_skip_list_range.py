@@ -0,0 +1,59 @@
+"""
+Benchmarks sliding-window queries on a `SkipList()` holding timestamps. Before
+`irange()` and `count_range()`, a window had to be found by filtering a full
+iteration of the skip list which is what the "scan" columns reproduce.
+"""
+import random
+
+from _common import timed, report
+
+from extra.lists.skip_list import SkipList
+
+
+WINDOW = 100
+
+
+def windows_with_irange(sl, starts):
+    return [list(sl.irange(lo, lo + WINDOW, (True, False))) for lo in starts]
+
+
+def windows_with_scan(sl, starts):
+    return [[x for x in sl if lo <= x < lo + WINDOW] for lo in starts]
+
+
+def counts_with_count_range(sl, starts):
+    return [sl.count_range(lo, lo + WINDOW, (True, False)) for lo in starts]
+
+
+def counts_with_scan(sl, starts):
+    return [sum(1 for x in sl if lo <= x < lo + WINDOW) for lo in starts]
+
+
+if __name__ == "__main__":
+    random.seed(1)
+    rows = []
+    for n in [1_000, 10_000, 100_000]:
+        sl = SkipList(random.sample(range(10 * n), n), seed=0)
+        starts = [random.randrange(10 * n) for _ in range(100)]
+        fast, irange_time = timed(windows_with_irange, sl, starts)
+        slow, scan_time = timed(windows_with_scan, sl, starts)
+        assert fast == slow
+        fast, count_time = timed(counts_with_count_range, sl, starts)
+        slow, count_scan_time = timed(counts_with_scan, sl, starts)
+        assert fast == slow
+        rows.append(
+            (
+                n,
+                f"{irange_time * 1e3:.1f}",
+                f"{scan_time * 1e3:.1f}",
+                f"{count_time * 1e3:.1f}",
+                f"{count_scan_time * 1e3:.1f}",
+            )
+        )
+    report(
+        f"100 windows of width {WINDOW} on SkipList()",
+        rows,
+        header=(
+            "n", "irange (ms)", "scan (ms)", "count_range (ms)", "scan (ms)"
+        ),
+    )
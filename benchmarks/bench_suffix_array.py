@@ -0,0 +1,65 @@
+"""
+Benchmarks building a `SuffixTrie()` with the "suffix_array" engine, which
+only keeps the suffix array & the LCP array, and the "suffix_tree" engine,
+which runs Ukkonen's algorithm storing edges as offsets, against the
+"radix_trie" engine which inserts a copy of every suffix into a `RadixTrie()`.
+The radix trie is quadratic, so it only runs on the smallest input.
+
+It reports the build time for random DNA-like strings of 10K up to 1M
+characters, the peak memory while building (tracing memory is slow, so only up
+to 100K) and then the time of `count_pattern_occurrences()`.
+"""
+import gc
+import random
+import tracemalloc
+
+from _common import timed, report
+
+from extra.trees.suffix_trie import SuffixTrie
+
+
+def measure_memory(word, engine):
+    gc.collect()
+    tracemalloc.start()
+    SuffixTrie(word, engine=engine)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return f"{peak / 2**20:.1f}"
+
+
+def count_all(st, patterns):
+    for pattern in patterns:
+        st.count_pattern_occurrences(pattern)
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    build_rows, query_rows = [], []
+    for n in [10_000, 100_000, 1_000_000]:
+        word = "".join(rng.choice("acgt") for _ in range(n))
+        patterns = [
+            word[idx: idx + 8]
+            for idx in (rng.randrange(n - 8) for _ in range(10_000))
+        ]
+        engines = ["suffix_array", "suffix_tree"]
+        if n <= 10_000:
+            engines.append("radix_trie")
+        for engine in engines:
+            st, elapsed = timed(SuffixTrie, word, engine=engine)
+            peak = measure_memory(word, engine) if n <= 100_000 else "-"
+            build_rows.append((n, engine, f"{elapsed:.2f}", peak))
+            _, elapsed = timed(count_all, st, patterns)
+            query_rows.append(
+                (n, engine, f"{elapsed / len(patterns) * 1e6:.2f}")
+            )
+            del st
+    report(
+        "SuffixTrie() construction",
+        build_rows,
+        header=("n", "engine", "seconds", "peak MiB"),
+    )
+    report(
+        "count_pattern_occurrences() of 8-character patterns",
+        query_rows,
+        header=("n", "engine", "microseconds"),
+    )
@@ -0,0 +1,78 @@
+"""
+Benchmarks `auto_complete(prefix, k=10)` of `RadixTrie()` over a dictionary of
+random scored terms using one- and two-letter prefixes, which are the most
+expensive ones to complete. The best-first search guided by the best score
+cached within every node is compared against retrieving all completions and
+sorting them by their scores.
+
+The number of terms can be passed as the first argument, e.g:
+
+    $ python benchmarks/bench_top_k.py 2000000
+"""
+import sys
+import time
+import random
+import string
+
+from _common import report
+
+from extra.trees.radix_trie import RadixTrie
+
+
+def sort_all(rt, scores, prefix, k):
+    return sorted(rt.auto_complete(prefix), key=lambda w: (-scores[w], w))[:k]
+
+
+def latencies(func, prefixes):
+    output = []
+    for prefix in prefixes:
+        start = time.perf_counter()
+        func(prefix)
+        output.append(time.perf_counter() - start)
+    output.sort()
+    return output
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    k = 10
+    scores = {}
+    while len(scores) < n:
+        term = "".join(
+            rng.choice(string.ascii_lowercase)
+            for _ in range(rng.randint(3, 12))
+        )
+        # heavy-tailed scores like term frequencies
+        scores[term] = int(rng.paretovariate(1.2))
+    rt = RadixTrie()
+    for term, score in scores.items():
+        rt.insert(term, score)
+
+    rows = []
+    for length, times in [(1, 50), (2, 500)]:
+        prefixes = [
+            "".join(rng.choice(string.ascii_lowercase) for _ in range(length))
+            for _ in range(times)
+        ]
+        if length == 1:
+            baseline = latencies(
+                lambda p: sort_all(rt, scores, p, k), prefixes[:10]
+            )
+        else:
+            baseline = latencies(lambda p: sort_all(rt, scores, p, k), prefixes)
+        top_k = latencies(lambda p: rt.auto_complete(p, k=k), prefixes)
+        for name, values in [("sort all", baseline), ("top-k", top_k)]:
+            rows.append(
+                [
+                    length,
+                    name,
+                    f"{values[len(values) // 2] * 1e3:.3f}",
+                    f"{values[int(len(values) * 0.99)] * 1e3:.3f}",
+                ]
+            )
+    report(
+        f"top-{k} completions out of {n} terms: milliseconds per query",
+        rows,
+        header=("prefix length", "method", "p50", "p99"),
+    )
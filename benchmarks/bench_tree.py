@@ -0,0 +1,73 @@
+"""
+Benchmarks `len()`, `get_height()` and `get_depth()` on a `Tree()` built with
+`Tree.from_path()` over a generated directory hierarchy. The cached subtree
+stats are compared against the recursive versions they replaced, both running
+over the very same tree, only its class gets switched.
+"""
+import os
+import random
+import tempfile
+
+from _common import timed, report
+
+from extra.trees.tree import Tree
+
+
+class RecursiveTree(Tree):
+    """
+    The previous recursive implementation, kept here as the baseline.
+    """
+
+    def _count_nodes(self, start_node):
+        total_nodes = 1
+        for child in start_node.get_children():
+            total_nodes += self._count_nodes(child)
+        return total_nodes
+
+    def __len__(self):
+        if self.is_empty():
+            return 0
+        return self._count_nodes(self._root)
+
+    def _get_height(self, start_node):
+        height = 0
+        for child in start_node.get_children():
+            height = max(height, 1 + self._get_height(child))
+        return height
+
+
+def make_hierarchy(root, num_dirs, files_per_dir, rng):
+    dirs = [root]
+    for i in range(num_dirs):
+        path = os.path.join(rng.choice(dirs), f"dir{i}")
+        os.mkdir(path)
+        dirs.append(path)
+    for path in dirs:
+        for j in range(files_per_dir):
+            open(os.path.join(path, f"file{j}"), "w").close()
+
+
+def query(tree, times):
+    for _ in range(times):
+        len(tree)
+        tree.get_height()
+        tree.get_depth()
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    times = 100
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        make_hierarchy(tmp_dir, 2_000, 10, rng)
+        tree, build_time = timed(Tree.from_path, tmp_dir)
+        for name, cls in [("recursive", RecursiveTree), ("cached", Tree)]:
+            tree.__class__ = cls
+            _, elapsed = timed(query, tree, times)
+            rows.append((name, len(tree), f"{elapsed / times * 1e6:.2f}"))
+    print(f"Tree.from_path() took {build_time:.2f} seconds")
+    report(
+        "len() + get_height() + get_depth(): microseconds per round",
+        rows,
+        header=("version", "nodes", "microseconds"),
+    )
@@ -0,0 +1,98 @@
+"""
+Benchmarks lookups (`in`) and `has_prefix()` of `Trie()` and `RadixTrie()`
+over URL-like keys. Following the path with offsets into the searched word is
+compared against the previous approach which sliced the remaining part of the
+word at every step, both running over the very same trie, only its class gets
+switched.
+
+The number of keys inserted into the `RadixTrie()` can be passed as the first
+argument, e.g:
+
+    $ python benchmarks/bench_trie_lookup.py 1000000
+"""
+import sys
+import random
+
+from _common import timed, report
+
+from extra.trees.trie import Trie
+from extra.trees.radix_trie import RadixTrie
+
+
+def slicing_follow_path(self, word):
+    """
+    The previous implementation, kept here as the baseline.
+    """
+    length = len(word)
+    curr_node = self._root
+    while word:
+        ch = word[0]
+        child = curr_node.get_child(ch)
+        child_data = child.get_data() if child else "}"
+        if child_data == word[: len(child_data)]:
+            word = word[len(child_data):]
+            curr_node = child
+        else:
+            break
+    return curr_node, length - len(word)
+
+
+class SlicingTrie(Trie):
+    _follow_path = slicing_follow_path
+
+
+class SlicingRadixTrie(RadixTrie):
+    _follow_path = slicing_follow_path
+
+
+def make_urls(n, rng):
+    hosts = [f"https://www.host{i}.example.com" for i in range(100)]
+    words = ["api", "static", "users", "items", "search", "v1", "v2", "docs"]
+    return [
+        "/".join(
+            [rng.choice(hosts)]
+            + [rng.choice(words) for _ in range(rng.randint(2, 6))]
+            + [f"{rng.getrandbits(40):x}"]
+        )
+        for _ in range(n)
+    ]
+
+
+def lookup_all(trie, keys):
+    for key in keys:
+        key in trie
+        trie.has_prefix(key)
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rows = []
+    for cls, slicing_cls, size in [
+        (Trie, SlicingTrie, min(n, 20_000)),
+        (RadixTrie, SlicingRadixTrie, n),
+    ]:
+        keys = make_urls(size, rng)
+        queries = [rng.choice(keys) for _ in range(100_000)]
+        trie = cls()
+        for key in keys:
+            trie.insert(key)
+        trie.__class__ = slicing_cls
+        _, slicing_time = timed(lookup_all, trie, queries)
+        trie.__class__ = cls
+        _, offset_time = timed(lookup_all, trie, queries)
+        avg_length = sum(map(len, keys)) / size
+        rows.append(
+            [
+                cls.__name__,
+                size,
+                f"{avg_length:.0f}",
+                f"{slicing_time:.3f}",
+                f"{offset_time:.3f}",
+            ]
+        )
+    report(
+        "100000 lookups of URL-like keys: seconds",
+        rows,
+        header=("class", "keys", "avg length", "slicing", "offsets"),
+    )
@@ -0,0 +1,66 @@
+"""
+Benchmarks the startup time of a worker that needs a `RadixTrie()` of random
+dictionary-like words. Rebuilding the trie by inserting all words is compared
+against opening a frozen trie saved once to disk, which is memory-mapped by
+`FrozenTrie.load()` and queried without being deserialized.
+
+The number of words can be passed as the first argument, e.g:
+
+    $ python benchmarks/bench_trie_startup.py 2000000
+"""
+import os
+import sys
+import random
+import string
+import tempfile
+
+from _common import timed, report
+
+from extra.trees.radix_trie import RadixTrie
+from extra.trees.frozen_trie import FrozenTrie
+
+
+def build(words):
+    rt = RadixTrie()
+    for word in words:
+        rt.insert(word)
+    return rt
+
+
+def query_all(trie, queries):
+    for query in queries:
+        query in trie
+        trie.auto_complete(query[:2], k=10)
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    words = [
+        "".join(
+            rng.choice(string.ascii_lowercase)
+            for _ in range(rng.randint(3, 12))
+        )
+        for _ in range(n)
+    ]
+    queries = [rng.choice(words) for _ in range(10_000)]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "words.trie")
+        rt, build_time = timed(build, words)
+        _, save_time = timed(lambda: rt.freeze().save(path))
+        ft, load_time = timed(FrozenTrie.load, path)
+        _, rt_query_time = timed(query_all, rt, queries)
+        _, ft_query_time = timed(query_all, ft, queries)
+        rows = [
+            ["insert() all words", f"{build_time:.3f}", f"{rt_query_time:.3f}"],
+            ["FrozenTrie.load()", f"{load_time:.6f}", f"{ft_query_time:.3f}"],
+        ]
+        size = os.path.getsize(path)
+        del ft
+    report(
+        f"{n} words ({size / 2 ** 20:.1f} MiB file): startup and 10000 "
+        + "queries in seconds",
+        rows,
+        header=("method", "startup time", "queries"),
+    )
+    print(f"\nfreeze() + save() done once beforehand: {save_time:.3f}")
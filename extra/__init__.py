@@ -24,3 +24,5 @@ from extra.trees.treap import Treap as Treap
 from extra.trees.trie import Trie as Trie
 from extra.trees.radix_trie import RadixTrie as RadixTrie
 from extra.trees.suffix_trie import SuffixTrie as SuffixTrie
+from extra.trees.generalized_suffix_trie import GeneralizedSuffixTrie as GeneralizedSuffixTrie
+from extra.trees.frozen_trie import FrozenTrie as FrozenTrie
@@ -5,6 +5,9 @@ class Extra:
     fisrt place.
     """
 
+    # NOTE: empty slots let subclasses that define `__slots__` drop the
+    #  per-instance `__dict__`, other subclasses aren't affected.
+    __slots__ = ()
     __name__ = "extra.Extra()"
 
     def _validate_item(self, item):
@@ -694,16 +694,20 @@ class CircularLinkedList(LinkedList):
         # start inserting the node
         if self._length == 0:
             new_node.set_next(new_node)
-            self._head = new_node
+            self._head = self._tail = new_node
         elif prev_node is None:
             new_node.set_next(self._head.get_next())
             self._head.set_next(new_node)
+            if self._tail is self._head:
+                self._tail = new_node
             # swap data between new_node and self._head
             new_node._data, self._head._data = self._head._data, new_node._data
             new_node = self._head  # to be returned
         else:
             new_node.set_next(prev_node.get_next())
             prev_node.set_next(new_node)
+            if prev_node is self._tail:
+                self._tail = new_node
         self._length += 1
         return new_node
 
@@ -740,8 +744,7 @@ class CircularLinkedList(LinkedList):
     def add_end(self, item):
         """
         Adds the given value at the tail of the `CircularLinkedList()` instance
-        in time-complexity of O(n) where **n** is the number of elements in the
-        instance.
+        in constant time.
 
         Parameters
         ----------
@@ -826,8 +829,7 @@ class CircularLinkedList(LinkedList):
         """
         Extends the current `CircularLinkedList()` instance by appending the
         elements of the other `CircularLinkedList()` instance in time-
-        complexity of O(n+m) where **n** is the number of elements in the
-        original instance and **m** is the number of elements in the other
+        complexity of O(m) where **m** is the number of elements in the other
         instance.
 
         Parameters
@@ -867,12 +869,7 @@ class CircularLinkedList(LinkedList):
                 + f"Can't extend `{self.__name__}` with `{type(other)}`!!"
             )
         if not other.is_empty():
-            counter = 0
-            curr_node = self._head if not self.is_empty() else None
-            while counter < self._length - 1:
-                counter += 1
-                curr_node = curr_node.get_next()
-            prev_node = curr_node
+            prev_node = self._tail if not self.is_empty() else None
             # now, let's add the new values
             for item in other:
                 new_node = self._basic_node(item)
@@ -981,10 +978,14 @@ class CircularLinkedList(LinkedList):
                 self._head._data = None  # NOTE: don't use set_data() here
             else:
                 next_to_head = self._head.get_next()
+                if next_to_head is self._tail:
+                    self._tail = self._head
                 self._head.set_data(next_to_head.get_data())
                 self._head.set_next(next_to_head.get_next())
         else:
             prev_node.set_next(node_to_be_removed.get_next())
+            if node_to_be_removed is self._tail:
+                self._tail = prev_node
         self._length -= 1
 
     def __delitem__(self, idx):
@@ -1106,6 +1106,11 @@ class DoublyLinkedList(LinkedList):
                 prev_node.set_next(next_node)
                 self._tail = prev_node
                 self._length -= 1
+            elif prev_node is None:
+                # unlink the head itself, so other nodes keep their identity
+                next_node.set_prev(None)
+                self._head = next_node
+                self._length -= 1
             else:
                 super()._remove_node(prev_node, node_to_be_removed)
 
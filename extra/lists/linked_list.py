@@ -219,15 +219,18 @@ class LinkedList(Extra):
         """
         if iterable is None:
             self._head = None
+            self._tail = None
             self._length = 0
         elif not hasattr(iterable, "__iter__"):
             raise TypeError("The given object isn't iterable!!")
         elif isinstance(iterable, self.__class__):
             # in case the given iterable is alread a LinkedList()
             self._head = iterable._head
+            self._tail = iterable._tail
             self._length = iterable._length
         else:
             self._head = None
+            self._tail = None
             self._length = 0
             prev_node = None
             for item in iterable:
@@ -967,7 +970,9 @@ class LinkedList(Extra):
     def _get_node(self, idx):
         """
         Retrieves the `Node()` at the given index of the `LinkedList()`
-        instance knowing that the start index is zero.
+        instance knowing that the start index is zero. Asking for the index
+        right after the last node is answered in constant time using the tail
+        reference.
 
         Parameters
         ----------
@@ -996,6 +1001,9 @@ class LinkedList(Extra):
         Node(data: 3, next: None)
         """
         assert 0 <= idx or idx < self._length
+        if idx == self._length and self._length > 0:
+            # the tail is already known, no need to iterate
+            return self._tail, self._tail.get_next()
         # iterate over the linked list
         counter = 0
         prev_node = None
@@ -1176,13 +1184,15 @@ class LinkedList(Extra):
         # start inserting the node
         if self._length == 0:
             new_node.set_next(None)
-            self._head = new_node
+            self._head = self._tail = new_node
         elif prev_node is None:
             new_node.set_next(self._head)
             self._head = new_node
         else:
             new_node.set_next(prev_node.get_next())
             prev_node.set_next(new_node)
+            if prev_node is self._tail:
+                self._tail = new_node
         self._length += 1
         return new_node
 
@@ -1294,7 +1304,7 @@ class LinkedList(Extra):
     def add_end(self, item):
         """
         Adds the given value at the tail of the `LinkedList()` instance in
-        linear time.
+        constant time.
 
         Parameters
         ----------
@@ -1368,8 +1378,7 @@ class LinkedList(Extra):
     def extend(self, other):
         """
         Extends the current `LinkedList()` instance by appending the elements
-        of the other `LinkedList()` instance in time-complexity of O(n) where
-        **n** is the lengh of the current instance.
+        of the other `LinkedList()` instance in constant time.
 
         Parameters
         ----------
@@ -1407,10 +1416,11 @@ class LinkedList(Extra):
             pass  # do nothing
         elif self.is_empty():
             self._head = other._head
+            self._tail = other._tail
             self._length = other._length
         else:
-            last_node, _ = self._get_node(self._length)
-            last_node.set_next(other._head)
+            self._tail.set_next(other._head)
+            self._tail = other._tail
             self._length += other._length
 
     # =============================     SET      ==============================
@@ -1532,10 +1542,15 @@ class LinkedList(Extra):
                 # NOTE: don't use set_data() here
                 self._head._data = None
             else:
+                # NOTE: `next_node` is the one that gets unlinked here
+                if next_node is self._tail:
+                    self._tail = self._head
                 self._head.set_next(next_node.get_next())
                 self._head.set_data(next_node.get_data())
         else:
             prev_node.set_next(next_node)
+            if node_to_be_removed is self._tail:
+                self._tail = prev_node
         self._length -= 1
 
     def _remove_idx(self, idx):
@@ -2068,6 +2083,7 @@ class LinkedList(Extra):
         if not inplace:
             return rotated
         self._head = rotated._head
+        self._tail = rotated._tail
 
     def rotate_right(self, distance, inplace=True):
         """
@@ -2115,6 +2131,7 @@ class LinkedList(Extra):
         if not inplace:
             return rotated
         self._head = rotated._head
+        self._tail = rotated._tail
 
     # =============================     MISC     ==============================
     def reverse(self):
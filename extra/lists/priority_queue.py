@@ -19,7 +19,13 @@ item in the PriorityQueue(), you can set the static variable `SHOW_PRIORITY` to
 `True` just like so:
 
 >>> PriorityQueue.SHOW_PRIORITY = True
+
+By default, the items are indexed by two binary heaps (one for each end of
+the priority range) which makes both `enqueue()` and `dequeue()` run in
+O(log(n)). The original linked-list engine, which scans the whole queue on
+every `dequeue()`, is still available using `engine="linked_list"`.
 """
+import heapq
 import random
 import warnings
 from extra.lists.doubly_linked_list import DoublyNode
@@ -147,9 +153,10 @@ class PriorityQueue(Queue):
     """
 
     SHOW_PRIORITY = False
+    ENGINES = {"heap", "linked_list"}
     __name__ = "extra.PriorityQueue()"
 
-    def __init__(self, max_capacity=float("inf"), seed=None):
+    def __init__(self, max_capacity=float("inf"), seed=None, engine="heap"):
         """
         Creates a `PriorityQueue()` object!!
 
@@ -159,13 +166,20 @@ class PriorityQueue(Queue):
             It's a positive integer representing the maximum number of elements
             a `PriorityQueue()` should contain. (default: inf)
         seed: int, optional
+        engine: str
+            The storage engine used to find the item with the highest (or the
+            lowest) priority. It's either "heap" which does that in O(log(n))
+            or "linked_list" which scans the whole queue in O(n).
+            (default: "heap")
 
         Raises
         ------
         TypeError:
             If the type of `max_capacity` isn't `int` or `float`.
         ValueError:
-            If the given value of `max_capacity` is less than zero.
+            It can be raised due to one of the following reasons:
+                1. If the given value of `max_capacity` is less than zero.
+                2. If the given `engine` isn't a supported engine.
 
         Example
         -------
@@ -189,10 +203,29 @@ class PriorityQueue(Queue):
         >>> pq = PriorityQueue(10.6)
         >>> pq._max_capacity
         11
+
+        Items sharing the same priority are dequeued in the order they were
+        enqueued when using the "heap" engine:
+
+        >>> pq = PriorityQueue(engine="heap")
+        >>> pq.enqueue("first", priority=1)
+        >>> pq.enqueue("second", priority=1)
+        >>> pq.dequeue()
+        'first'
         """
+        if engine not in self.ENGINES:
+            raise ValueError(
+                f"`engine` has to be one of {sorted(self.ENGINES)}!!"
+            )
         super().__init__(max_capacity)
+        self._engine = engine
         self._min_priority = float("inf")
         self._max_priority = float("-inf")
+        # used only by the "heap" engine
+        self._min_heap = []
+        self._max_heap = []
+        self._entries = {}
+        self._counter = 0
 
     # =============================     PRINT    ==============================
     def __repr__(self):
@@ -317,10 +350,69 @@ class PriorityQueue(Queue):
         if new_priority is not None and type(new_priority) not in {int, float}:
             raise TypeError("Given priority has to be a number!!")
 
+    def __push_entries(self, node):
+        """
+        Indexes the given node inside both heaps of the "heap" engine. Each
+        heap entry is a list of `[key, order, node]` where `order` is an
+        increasing counter that keeps the equal priorities first-in first-out.
+
+        Parameters
+        ----------
+        node: PriorityNode()
+            The node to be indexed.
+        """
+        priority = node.get_priority()
+        min_entry = [priority, self._counter, node]
+        max_entry = [-priority, self._counter, node]
+        self._counter += 1
+        self._entries[node] = (min_entry, max_entry)
+        heapq.heappush(self._min_heap, min_entry)
+        heapq.heappush(self._max_heap, max_entry)
+
+    def __discard_entries(self, node):
+        """
+        Marks the heap entries of the given node as removed. Removed entries
+        are dropped lazily once they reach the top of their heap; and both
+        heaps are rebuilt once removed entries outnumber the live ones.
+
+        Parameters
+        ----------
+        node: PriorityNode()
+            The node whose entries should be discarded.
+        """
+        for entry in self._entries.pop(node):
+            entry[-1] = None
+        if len(self._min_heap) > 2 * len(self._entries) + 32:
+            for heap in [self._min_heap, self._max_heap]:
+                heap[:] = [entry for entry in heap if entry[-1] is not None]
+                heapq.heapify(heap)
+
+    def __peek_entry(self, heap):
+        """
+        Drops the removed entries from the top of the given heap and returns
+        the top live entry, or `None` if the heap has no live entries.
+        """
+        while heap and heap[0][-1] is None:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def __update_bounds(self):
+        """
+        Updates `_min_priority` & `_max_priority` member variables using the
+        tops of the "heap" engine's heaps in amortized constant time.
+        """
+        min_entry = self.__peek_entry(self._min_heap)
+        max_entry = self.__peek_entry(self._max_heap)
+        self._min_priority = float("inf") if min_entry is None \
+            else min_entry[0]
+        self._max_priority = float("-inf") if max_entry is None \
+            else -max_entry[0]
+
     def enqueue(self, item, priority=None):
         """
         Inserts the given `item` to the end of the `PriorityQueue()`, it does
-        that in constant time.
+        that in O(log(n)) using the "heap" engine and in constant time using
+        the "linked_list" engine.
 
         Parameters
         ----------
@@ -369,9 +461,18 @@ class PriorityQueue(Queue):
         super()._validate_item(item)
         self.__validate_priority(priority)
         node = PriorityNode(item, priority)
-        self._min_priority = min(self._min_priority, node.get_priority())
-        self._max_priority = max(self._max_priority, node.get_priority())
-        super()._enqueue(node)
+        if self._engine == "heap":
+            if self.is_full() and not self.is_empty():
+                # the first inserted item is about to be pushed out
+                self.__discard_entries(self._container._tail)
+            super()._enqueue(node)
+            if self._max_capacity > 0:
+                self.__push_entries(node)
+            self.__update_bounds()
+        else:
+            self._min_priority = min(self._min_priority, node.get_priority())
+            self._max_priority = max(self._max_priority, node.get_priority())
+            super()._enqueue(node)
 
     # =============================      TOP     ==============================
     def top(self):
@@ -439,7 +540,14 @@ class PriorityQueue(Queue):
     def dequeue(self, lowest_priority=False):
         """
         Pops the item that has the highest priority from the `PriorityQueue()`
-        instance in constant time.
+        instance in O(log(n)) using the "heap" engine and in O(n) using the
+        "linked_list" engine.
+
+        Parameters
+        ----------
+        lowest_priority: bool
+            If `True`, the item that has the lowest priority is popped instead.
+            (default: `False`)
 
         Returns
         -------
@@ -475,6 +583,13 @@ class PriorityQueue(Queue):
                 f"Dequeuing from an empty `{self.__name__}`!!", UserWarning
             )
             return
+        elif self._engine == "heap":
+            heap = self._min_heap if lowest_priority else self._max_heap
+            node = self.__peek_entry(heap)[-1]
+            self.__discard_entries(node)
+            self._container._remove_node(node.get_prev(), node)
+            self.__update_bounds()
+            node_data = node.get_data()
         else:
             curr_node = self._container._head
             while curr_node is not None:
@@ -523,6 +638,7 @@ class PriorityQueue(Queue):
         Note
         ----
         When you clear the `PriorityQueue()` instance, the `max_capacity` of
-        the cleared instance remains the same as the one before.
+        the cleared instance remains the same as the one before. The same goes
+        for the storage `engine`.
         """
-        super().clear()
+        self.__init__(max_capacity=self._max_capacity, engine=self._engine)
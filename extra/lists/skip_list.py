@@ -38,72 +38,59 @@ for each item in the skip list. Thus, we expect the lowest linked list, at
 **n/2** items, and the one above it to have about **n/4** items. In other
 words, we expect the height of the skip list to be about **log(n)**.
 
+Instead of flipping one coin at a time, the number of levels of a new item is
+drawn at once by counting the trailing zeros of a random integer. Each skip
+list owns its random generator, so giving it a `seed` makes its shape
+reproducible. The promotion probability and the maximum height are both
+configurable.
+
 The -∞ setntinel value is put in the SkipList() as a convention. So, it doesn't
 count as an element in the SkipList(). In other words, the zeroths element in
 the above skip list is `0` not `-∞`.
+
+Each node also remembers the "**width**" of its link, which is the number of
+elements skipped when moving to the next node on the same level. Summing up the
+widths while searching gives the position of any node, which makes accessing
+elements by index as fast as searching for values.
+
+By default, each value is stored only once inside a node that keeps an array of
+forward links, one for every level the value was promoted to. The original
+layout where every level is a standalone Linked List holding its own copy of
+the promoted values is still available using `engine="linked_list"`.
 """
+import bisect
+import math
 import random
 from extra.interface import Extra
 from extra.lists.linked_list import Node, LinkedList
 
 
 # helper functions
-# random.seed(1)
-def flip_coin():
-    """
-    A helper function to mimic the action of flipping a coin. The result is
-    totally random,
-
-    Returns
-    -------
-    str:
-        Either "head" or "tail".
-
-    Example
-    -------
-    >>> flip_coin()
-    'tail'
-    >>> flip_coin()
-    'head'
-    >>> flip_coin()
-    'head'
-    """
-    return random.choice(["head", "tail"])
-
-
-def search_sorted(prev_node, start_node, value):
+def count_trailing_zeros(number):
     """
-    A helper function to search the `SkipList()` instance starting from a
-    given node declared as `start_node` and searching for the given `value`.
+    A helper function to count the zero bits at the right of the binary
+    representation of the given positive integer.
 
     Parameters
     ----------
-    prev_node: SkipNode()
-        A reference to the node that is previous to the `start_node`.
-    start_node: SkipNode()
-        A reference to the node at which the searching starts.
-    value: int or float
-        The number for which we started searching.
+    number: int
+        A positive integer.
 
     Returns
     -------
-    SkipNode()
-        A reference to the node previus to the node containing the value if the
-        value was found. If the value wasn't found, then this will be either
-        `None` or the second last node in the skiplist.
-    SkipNode()
-        A reference to the node containg the value if the value was found. If
-        the value wasn't found, then this will be the last node in the
-        skiplist.
+    int:
+        The number of trailing zero bits.
+
+    Example
+    -------
+    >>> count_trailing_zeros(12)
+    2
+    >>> count_trailing_zeros(7)
+    0
     """
-    # search a sorted linked list and return the last accessed node.
-    curr_node = start_node
-    next_node = curr_node.get_next()
-    while next_node is not None and next_node.get_data() <= value:
-        prev_node = curr_node
-        curr_node = next_node
-        next_node = curr_node.get_next()
-    return prev_node, curr_node
+    assert type(number) == int and number > 0
+    # NOTE: `number & -number` keeps the lowest set bit only
+    return (number & -number).bit_length() - 1
 
 
 class SkipNode(Node):
@@ -132,6 +119,9 @@ class SkipNode(Node):
             raise TypeError(f"`{self.__name__}` contains numbers only!!")
         super().__init__(item)
         self._down = None
+        # NOTE: `_width` is the number of zeroth-level links skipped when
+        #  moving from this node to the next one on the same level
+        self._width = 1
 
     def get_down(self):
         """
@@ -213,6 +203,124 @@ class SkipNode(Node):
         return super()._represent()
 
 
+class ArraySkipNode(Extra):
+    """
+    An array skip node is the basic unit for building skip lists using the
+    "array" engine. It stores its value once along with a fixed-size array of
+    forward links, one link for each level the node belongs to.
+    """
+
+    __slots__ = ("_data", "_links")
+    __name__ = "extra.ArraySkipNode()"
+
+    def __init__(self, item, height=1):
+        """
+        Creates an `ArraySkipNode()` object used mainly with `SkipList()`
+        objects!!
+
+        Parameters
+        ----------
+        item: object
+            The value to be saved within the `ArraySkipNode()` instance.
+        height: int
+            The number of levels this node belongs to, default `1`.
+
+        Raises
+        ------
+        ValueError:
+            If the given item is `None`.
+        TypeError:
+            If the given item isn't a number.
+        """
+        super()._validate_item(item)
+        if type(item) not in {int, float}:
+            raise TypeError(f"`{self.__name__}` contains numbers only!!")
+        assert type(height) == int and height >= 1
+        self._data = item
+        # NOTE: the link at the i-th level is stored as two consecutive items:
+        #  the next node at `_links[2*i]` and the width at `_links[2*i+1]`
+        #  where the width is the number of zeroth-level links skipped
+        self._links = [None, 1] * height
+
+    def get_data(self):
+        """
+        Returns the data stored in the current `ArraySkipNode()` instance.
+
+        Returns
+        -------
+        int or float:
+            The data stored in the `ArraySkipNode()`.
+        """
+        return self._data
+
+    def get_next(self):
+        """
+        Returns the next node at the zeroth level.
+
+        Returns
+        -------
+        ArraySkipNode():
+            The `ArraySkipNode()` that follows the current one at the zeroth
+            level or `None` if there weren't any.
+        """
+        return self._links[0]
+
+    def get_height(self):
+        """
+        Returns the number of levels that the `ArraySkipNode()` belongs to.
+
+        Returns
+        -------
+        int:
+            A positive integer representing the height of the node.
+        """
+        return len(self._links) // 2
+
+    def __repr__(self):
+        """
+        Represents `ArraySkipNode()` object as a string.
+
+        Returns
+        -------
+        str:
+            A string representing the `ArraySkipNode()` instance.
+
+        Example
+        -------
+        >>> x = ArraySkipNode(10, height=2)
+        >>> x
+        ArraySkipNode(data: 10, height: 2, next: None)
+        """
+        next_node = self._links[0]
+        nxt = next_node._represent() if next_node is not None else None
+        return (
+            f"ArraySkipNode(data: {self._represent()}, "
+            + f"height: {self.get_height()}, next: {nxt})"
+        )
+
+    def _represent(self):
+        """
+        A helpful function used to represent the `ArraySkipNode()` when
+        printing!!
+
+        Returns
+        -------
+        str:
+            A string representing the `ArraySkipNode()` is a very simple way.
+
+        Example
+        -------
+        >>> x = ArraySkipNode(10)
+        >>> x._represent()
+        '10'
+        """
+        if self._data == float("-inf"):
+            return "-∞"
+        elif self._data == float("inf"):
+            return "∞"
+        return str(self._data)
+
+
 class SkipList(Extra):
     """
     A skip list is an awesome linear data structures which consists of a series
@@ -224,10 +332,18 @@ class SkipList(Extra):
     linear data structures.
     """
 
+    ENGINES = {"array", "linked_list"}
     _basic_node = SkipNode
     __name__ = "extra.SkipList()"
 
-    def __init__(self, iterable=None):
+    def __init__(
+        self,
+        iterable=None,
+        engine="array",
+        seed=None,
+        probability=0.5,
+        max_height=32,
+    ):
         """
         Initializes a `SkipList()` instance using an optional iterable object
         in time-complexity of O(n) where **n** is the number of elements inside
@@ -238,29 +354,48 @@ class SkipList(Extra):
         iterable: iterable, optional
             An iterable python object that implements the `__iter__` method.
             For example, `list` and `tuple` are both iterables.
+        engine: str
+            The layout used to store the levels. It's either "array" which
+            stores every value once in an `ArraySkipNode()` holding the links
+            of all its levels or "linked_list" which keeps each level as a
+            standalone `LinkedList()` of `SkipNode()` objects where promoted
+            values are copied to the upper levels. (default: "array")
+        seed: int, optional
+            The seed of the random generator owned by this instance which
+            decides the levels of the inserted values. (default: `None` which
+            seeds it from the current time or an OS-specific source).
+        probability: float
+            The probability of promoting a value to the next level. Powers of
+            1/2 are the fastest to draw. (default: 0.5)
+        max_height: int
+            The maximum number of levels a value can belong to. (default: 32)
 
         Raises
         ------
         TypeError:
-            It can be raised in three cases
+            It can be raised in these cases
                 1. In case the given object isn't iterable.
                 2. If one of the elements in the iterable is an `Extra` object.
                 3. If one of the elements in the iterable is NOT a number.
+                4. If `probability` isn't a number.
+                5. If `max_height` isn't an integer.
         ValueError:
-            If one of the iterable elements is `None`.
+            It can be raised in these cases
+                1. If one of the iterable elements is `None`.
+                2. If the given `engine` isn't a supported engine.
+                3. If `probability` isn't between 0 and 1 (exclusive).
+                4. If `max_height` is less than 1.
 
         Note
         -----
         Inserting values into different levels in the skip list is completely
         random. So, running the following example will return different values
         each time you run it. So, in order to obtain the same result as before
-        you need to set `random.seed(1)` before running any of the previous
-        example.
+        you need to pass the same `seed`.
 
         Examples
         --------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([10, -5, 7, 9])
+        >>> sl = SkipList([10, -5, 7, 9], seed=7)
         >>> sl
         ┌────┐                    ┌────┐
         | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
@@ -287,39 +422,114 @@ class SkipList(Extra):
         >>> sl_2 = SkipList([1, sl_1])
         TypeError: Can't create `extra.SkipList()` using `extra.SkipList()`!!
         """
-        # NOTE: `_level_lists` is an array of LinkedList() objects
-        if iterable is None:
-            ll = LinkedList()
-            ll._insert_node(ll._head, self._basic_node(float("-inf")))
-            self._level_lists = [ll]
-            self._num_levels = 1
-        elif not hasattr(iterable, "__iter__"):
+        if iterable is not None and not hasattr(iterable, "__iter__"):
             raise TypeError("The given object isn't iterable!!")
-        elif isinstance(iterable, self.__class__):
-            self._level_lists = iterable._level_lists
-            self._num_levels = iterable._num_levels
+        elif engine not in self.ENGINES:
+            raise ValueError(
+                f"`engine` has to be one of {sorted(self.ENGINES)}!!"
+            )
+        elif type(probability) not in {int, float}:
+            raise TypeError("`probability` has to be a number!!")
+        elif not 0 < probability < 1:
+            raise ValueError(
+                "`probability` has to be between 0 and 1 (exclusive)!!"
+            )
+        elif type(max_height) != int:
+            raise TypeError("`max_height` has to be an integer!!")
+        elif max_height < 1:
+            raise ValueError("`max_height` has to be >= 1!!")
+
+        self._engine = engine
+        self._rng = random.Random(seed)
+        self._probability = probability
+        self._max_height = max_height
+        # NOTE: when `probability` is 1/2^k, every k trailing zeros of a random
+        #  integer promote the value once. Otherwise, `_bits_per_level` is 0
+        #  and the height is drawn using `_log_probability`.
+        inverse = 1 / probability
+        if inverse == int(inverse) and int(inverse) & (int(inverse) - 1) == 0:
+            self._bits_per_level = int(inverse).bit_length() - 1
         else:
+            self._bits_per_level = 0
+        self._log_probability = math.log(probability)
+        self._reset()
+        if iterable is not None:
+            for item in iterable:
+                self.insert(item)
+
+    def _reset(self):
+        """
+        Creates the empty levels of the `SkipList()` instance according to its
+        engine.
+        """
+        self._num_levels = 1
+        if self._engine == "linked_list":
+            # NOTE: `_level_lists` is an array of LinkedList() objects
             ll = LinkedList()
             ll._insert_node(ll._head, self._basic_node(float("-inf")))
             self._level_lists = [ll]
-            self._num_levels = 1
-            for item in iterable:
-                self.insert(item)
+        else:
+            # NOTE: `_head` is the -∞ node which belongs to all levels
+            self._head = ArraySkipNode(float("-inf"))
+            self._length = 0
+
+    def _get_head(self):
+        """
+        Returns the -∞ node at the zeroth level of the `SkipList()` instance.
+
+        Returns
+        -------
+        SkipNode() or ArraySkipNode():
+            The zeroth-level node holding the -∞ sentinel value.
+        """
+        if self._engine == "linked_list":
+            return self._level_lists[0]._head
+        return self._head
 
     # =============================    PRINT     ==============================
-    def __print_node(self, node, zeroth_node, lower_node):
+    def __get_zeroth_heights(self):
+        """
+        Gets the nodes of the zeroth level along with the number of levels
+        each node belongs to.
+
+        Returns
+        -------
+        list:
+            A list of tuples where each tuple contains a zeroth-level node,
+            starting from the -∞ node, and its height.
+        """
+        heights = {}
+        if self._engine == "linked_list":
+            # count the levels each value was copied to
+            for level_list in self._level_lists:
+                curr_node = level_list._head
+                while curr_node is not None:
+                    data = curr_node.get_data()
+                    heights[data] = heights.get(data, 0) + 1
+                    curr_node = curr_node.get_next()
+        output = []
+        curr_node = self._get_head()
+        while curr_node is not None:
+            if self._engine == "linked_list":
+                height = heights[curr_node.get_data()]
+            else:
+                height = curr_node.get_height()
+            output.append((curr_node, height))
+            curr_node = curr_node.get_next()
+        return output
+
+    def __print_node(self, node, height, level):
         """
         Prints the given node of the `SkipList()` instance.
 
         Parameters
         ----------
-        node: SkipNode()
-            The SkipNode() to be printed.
-        zeroth_node: SkipNode()
-            The SkipNode() of the lowest LinkedList (zeorth level) attached to
-            the given `node`.
-        lower_node: SkipNode()
-            The SkipNode() which is directly below the `node`.
+        node: SkipNode() or ArraySkipNode()
+            The zeroth-level node to be printed.
+        height: int
+            The number of levels the given `node` belongs to.
+        level: int
+            The rank of the level being printed.
 
         Returns
         -------
@@ -327,42 +537,27 @@ class SkipList(Extra):
             It returns a tuple of two lists representing the given middle-part
             and lower-part of the node when printed knowing that each node will
             be printed in three lines in total.
-
-        Raises
-        ------
-        AssertionError:
-            This can be raised in the following cases:
-                1. The `node` is not neither `None` nor an instance of \
-                    `SkipNode()`.
-                2. The `zeroth_node` is not neither `None` nor an instance of \
-                    `SkipNode()`.
-                3. The `lower_node` is not neither `None` nor an instance of \
-                    `SkipNode()`.
-        """
-        assert node is None or isinstance(node, self._basic_node)
-        assert zeroth_node is None or isinstance(zeroth_node, self._basic_node)
-        assert lower_node is None or isinstance(lower_node, self._basic_node)
+        """
+        assert type(height) == int and height >= 1
         middle = []
         bottom_border = []
-        item = zeroth_node._represent()
+        item = node._represent()
         width = len(item) + 2  # 2: for a space before & after an item
-        if node is not None and zeroth_node.get_data() == node.get_data():
-            bottom_border += ["└"] if lower_node is None else ["├"]
+        if height > level:
+            bottom_border += ["└"] if level == 0 else ["├"]
             bottom_border += ["─"] * width
-            bottom_border += ["┘ "] if lower_node is None else ["┤ "]
+            bottom_border += ["┘ "] if level == 0 else ["┤ "]
             middle += [f"| {item} │⟶"]
         else:
             middle += [f"⟶{'⟶'*width}⟶⟶"]
-            if (
-                lower_node is not None
-                and lower_node.get_data() == zeroth_node.get_data()
-            ):
+            # the node belongs to the lower level
+            if height == level:
                 bottom_border += ["┌"] + (["─"] * width) + ["┐ "]
             else:
                 bottom_border += [" "] + ([" "] * width) + ["  "]
         return middle, bottom_border
 
-    def __print_level(self, level):
+    def __print_level(self, level, zeroth_heights):
         """
         Prints each level in the `SkipList()` instance.
 
@@ -371,6 +566,8 @@ class SkipList(Extra):
         level: int
             A positive zero-indexed integer representing the level rank. The
             lowest level of the `SkipList()` is zero.
+        zeroth_heights: list
+            The zeroth-level nodes along with their heights.
 
         Returns
         -------
@@ -389,57 +586,37 @@ class SkipList(Extra):
         assert type(level) == int
         assert level < self._num_levels
 
-        zeroth_list = self._level_lists[0]
-        curr_list = self._level_lists[level]
         # the following two lists will represent the output of this function
         bottom_border = []
         middle = []
-        # iterate over two lists in parallel
-        zeroth_node = zeroth_list._head
-        curr_node = curr_list._head
-        lower_node = self._level_lists[level - 1]._head if level > 0 else None
-        while zeroth_node is not None:
-            middle_part, bottom_part = self.__print_node(
-                curr_node, zeroth_node, lower_node
-            )
+        for node, height in zeroth_heights:
+            middle_part, bottom_part = self.__print_node(node, height, level)
             middle += middle_part
             bottom_border += bottom_part
-            if (curr_node is not None
-                    and zeroth_node.get_data() == curr_node.get_data()):
-                curr_node = curr_node.get_next()
-            if (
-                lower_node is not None
-                and zeroth_node.get_data() == lower_node.get_data()
-            ):
-                lower_node = lower_node.get_next()
-            zeroth_node = zeroth_node.get_next()
         return "{}\n{}".format("".join(middle), "".join(bottom_border))
 
-    def __print_top_border(self):
+    def __print_top_border(self, zeroth_heights):
         """
         Prints out the top border of the `SkipList()` instance.
 
+        Parameters
+        ----------
+        zeroth_heights: list
+            The zeroth-level nodes along with their heights.
+
         Returns:
         str:
             A one-line string representing the top-border of the `SkipList()`
         """
-        lower_list = self._level_lists[0]
-        top_list = self._level_lists[self._num_levels - 1]
-        # the following two lists will represent the output of this function
+        # the following list will represent the output of this function
         top_border = []
-        # iterate over two lists in parallel
-        lower_node = lower_list._head
-        curr_node = top_list._head
-        while (lower_node is not None):
-            item = lower_node._represent()
+        for node, height in zeroth_heights:
+            item = node._represent()
             width = len(item) + 2  # 2: for a space before & after an item
-            if (curr_node is not None
-                    and lower_node.get_data() == curr_node.get_data()):
+            if height == self._num_levels:
                 top_border += ["┌"] + (["─"] * width) + ["┐ "]
-                curr_node = curr_node.get_next()
             else:
                 top_border += [" "] + ([" "] * width) + ["  "]
-            lower_node = lower_node.get_next()
         return "{}".format("".join(top_border))
 
     def __repr__(self):
@@ -455,8 +632,7 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([20, 77, 10, 6, 2])
+        >>> sl = SkipList([20, 77, 10, 6, 2], seed=173)
         >>> sl
         ┌────┐                    ┌────┐
         | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 20 │⟶⟶⟶⟶⟶⟶⟶⟶
@@ -466,9 +642,10 @@ class SkipList(Extra):
         | -∞ │⟶| 2 │⟶| 6 │⟶| 10 │⟶| 20 │⟶| 77 │⟶
         └────┘ └───┘ └───┘ └────┘ └────┘ └────┘
         """
-        output = [self.__print_top_border()]
+        zeroth_heights = self.__get_zeroth_heights()
+        output = [self.__print_top_border(zeroth_heights)]
         output += [
-            self.__print_level(level)
+            self.__print_level(level, zeroth_heights)
             for level in range(self._num_levels - 1, -1, -1)
         ]
         return "\n".join(output)
@@ -493,6 +670,8 @@ class SkipList(Extra):
         >>> len(sl)
         3
         """
+        if self._engine == "array":
+            return self._length
         n = len(self._level_lists[0])
         return n - 1 if n > 0 else 0
 
@@ -521,9 +700,9 @@ class SkipList(Extra):
     # =============================    HEIGHT    ==============================
     def get_height(self):
         """
-        Gets the height of the `SkipNode()` instance. `SkipNode()` height is
-        the number of levels where each level is a standalone `LinkedList()`
-        object.
+        Gets the height of the `SkipList()` instance. `SkipList()` height is
+        the number of levels where each level is a sorted subset of the
+        values.
 
         Returns
         -------
@@ -532,8 +711,7 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([20, 77, 10, 6, 2])
+        >>> sl = SkipList([20, 77, 10, 6, 2], seed=173)
         >>> sl.get_height()
         3
         """
@@ -560,8 +738,11 @@ class SkipList(Extra):
         2
         3
         """
-        for item in self._level_lists[0][1:]:
-            yield item
+        # NOTE: skip -∞
+        curr_node = self._get_head().get_next()
+        while curr_node is not None:
+            yield curr_node.get_data()
+            curr_node = curr_node.get_next()
 
     # =============================    SEARCH    ==============================
     def _validate_item(self, item):
@@ -642,75 +823,6 @@ class SkipList(Extra):
         elif idx < -len(self) or idx >= len(self):
             raise IndexError("Can't find any element at the given index!!")
 
-    def _search(self, value):
-        """
-        Searches the `SkipList()` for a given value and returns the first node
-        containing that value if found and some other necessary info. If not
-        found, it returns the node whose value is less that the given value and
-        yet bigger than other values.
-
-        Parameters
-        ----------
-        value: int or float
-            The value to be searched for in the `SkipList()` instance.
-
-        Returns
-        -------
-        SkipNode():
-            If the value is found, this object represents the previous node to
-            the found node. If the value isn't found, this object represents
-            the previous node to the last accessed node.
-        SkipNode():
-            If the value is found, this object is the found node. If the value
-            is not found, this object is the last accessed node.
-        list:
-            A list of all accessed `SkipNode()` objects sorted in descending
-            manner.
-
-        Raises:
-        -------
-        AssertionError:
-            If the given value isn't a number
-
-        Examples
-        --------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([10, -2, 3])
-        >>> sl
-        ┌────┐              ┌────┐
-        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
-        ├────┤ ┌────┐       ├────┤
-        | -∞ │⟶| -2 │⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
-        ├────┤ ├────┤ ┌───┐ ├────┤
-        | -∞ │⟶| -2 │⟶| 3 │⟶| 10 │⟶
-        └────┘ └────┘ └───┘ └────┘
-        >>> prev_node, node, last_accessed_nodes = sl._search(3)
-        >>> prev_node
-        SkipNode(data: -2, next: 3)
-        >>> node
-        Node(data: 3, next: 10)
-        >>> last_accessed_nodes
-        [SkipNode(data: -2, next: 10), SkipNode(data: -∞, next: 10)]
-        """
-        # returns the last accessed node when searching a certain value.
-        assert type(value) in {int, float}
-
-        last_accessed_nodes = []
-        top_list = self._level_lists[self._num_levels - 1]
-        prev_node = None
-        start_node = top_list._head
-        while (start_node.get_down() is not None):
-            prev_node, found_node = search_sorted(prev_node, start_node, value)
-            if found_node.get_data() == value:
-                return prev_node, found_node, last_accessed_nodes
-            last_accessed_nodes.append(found_node)
-            start_node = found_node.get_down()
-            if prev_node is not None:
-                prev_node = prev_node.get_down()
-        prev_node, found_node = search_sorted(prev_node, start_node, value)
-        assert len(last_accessed_nodes) == self._num_levels - 1
-        return prev_node, found_node, last_accessed_nodes[::-1]
-
     def __contains__(self, value):
         """
         Checks if the given value exists in the `SkipList()` instance in time-
@@ -746,13 +858,15 @@ class SkipList(Extra):
         if type(value) not in {int, float}:
             return False
         self._validate_item(value)
-        _, found_node, _ = self._search(value)
-        return found_node.get_data() == value
+        prev_nodes, _ = self._search_predecessors(value)
+        next_node = prev_nodes[0].get_next()
+        return next_node is not None and next_node.get_data() == value
 
     def __getitem__(self, idx):
         """
-        Retrieves the element at the given index in time-complexity of O(k)
-        where **k** is the given index. The given index is a zero-based `int`.
+        Retrieves the element at the given index in time-complexity of
+        O(log(n)) where **n** is the number of elements in the `SkipList()`
+        instance. The given index is a zero-based `int`.
         This method doesn't support negative indexing and doesn't support
         `slice` objects either.
 
@@ -798,126 +912,1055 @@ class SkipList(Extra):
         zeroths element in the above skip list is `0` not `-∞`.
         """
         self._validate_index(idx)
-        # NOTE: idx+1 to skip -∞
-        node = self._level_lists[0].__getitem__(idx + 1)
-        return node
+        return self._select_node(idx).get_data()
 
-    # =============================    INSERT    ==============================
-    def _add_extra_level(self):
+    # =============================    RANK     ===============================
+    def _search_predecessors(self, value, inclusive=False, fingers=None):
         """
-        Creates a new level at the top of the `SkipList()`, a new level is a
-        new `LinkedList()` instance attached to the `SkipList()`.
+        Searches the `SkipList()` for the last node whose value is strictly
+        less than the given value at every level, keeping track of how many
+        elements were skipped along the way.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be searched for in the `SkipList()` instance.
+        inclusive: bool
+            A flag to search for the last node whose value is less than or
+            equal to the given value instead, default `False`.
+        fingers: tuple, optional
+            The two lists returned by a previous search for a smaller value.
+            At every level, the search jumps straight to the old predecessor
+            when it lies further ahead, so a batch of sorted values is located
+            in one sweep over each level.
 
         Returns
         -------
-        LinkedList():
-            The newly-created `LinkedList()` instance after being attached to
-            the other `LinkedList()` object in the lower level.
+        list:
+            A list of `SkipNode()` or `ArraySkipNode()` objects where the i-th
+            item is the last node at the i-th level whose value is less than
+            the given value.
+        list:
+            A list of integers where the i-th item is the position of the i-th
+            node of the previous list knowing that the -∞ sentinel is at
+            position `0`.
+
+        Raises:
+        -------
+        AssertionError:
+            If the given value isn't a number
+
+        Examples
+        --------
+        >>> sl = SkipList([10, -2, 3], seed=7)
+        >>> sl
+        ┌────┐              ┌────┐
+        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
+        ├────┤ ┌────┐       ├────┤
+        | -∞ │⟶| -2 │⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
+        ├────┤ ├────┤ ┌───┐ ├────┤
+        | -∞ │⟶| -2 │⟶| 3 │⟶| 10 │⟶
+        └────┘ └────┘ └───┘ └────┘
+        >>> prev_nodes, positions = sl._search_predecessors(10)
+        >>> prev_nodes
+        [ArraySkipNode(data: 3, height: 1, next: 10),
+        ArraySkipNode(data: -2, height: 2, next: 3),
+        ArraySkipNode(data: -∞, height: 3, next: -2)]
+        >>> positions
+        [2, 1, 0]
         """
-        top_list = self._level_lists[self._num_levels - 1]
-        new_llist = LinkedList()
-        new_llist._insert_node(new_llist._head,
-                               self._basic_node(float("-inf")))
-        # connect the head of the new linked list to the lower linked list
-        new_llist._head.set_down(top_list._head)
-        # add new linked list to the SkipList
-        self._level_lists.append(new_llist)
-        self._num_levels += 1
-        return new_llist
+        assert type(value) in {int, float}
 
-    def _promote(self, upper_prev_node, curr_node, curr_level):
+        prev_nodes = [None] * self._num_levels
+        positions = [0] * self._num_levels
+        pos = 0
+        finger_nodes, finger_positions = fingers if fingers else ([], [])
+        if self._engine == "array":
+            curr_node = self._head
+            for level in range(self._num_levels - 1, -1, -1):
+                if level < len(finger_nodes) and finger_positions[level] > pos:
+                    curr_node = finger_nodes[level]
+                    pos = finger_positions[level]
+                i = 2 * level
+                next_node = curr_node._links[i]
+                while next_node is not None and (
+                    next_node._data < value
+                    or inclusive and next_node._data == value
+                ):
+                    pos += curr_node._links[i + 1]
+                    curr_node = next_node
+                    next_node = curr_node._links[i]
+                prev_nodes[level] = curr_node
+                positions[level] = pos
+            return prev_nodes, positions
+
+        curr_node = self._level_lists[self._num_levels - 1]._head
+        for level in range(self._num_levels - 1, -1, -1):
+            if level < len(finger_nodes) and finger_positions[level] > pos:
+                curr_node = finger_nodes[level]
+                pos = finger_positions[level]
+            next_node = curr_node.get_next()
+            while next_node is not None and (
+                next_node.get_data() < value
+                or inclusive and next_node.get_data() == value
+            ):
+                pos += curr_node._width
+                curr_node = next_node
+                next_node = curr_node.get_next()
+            prev_nodes[level] = curr_node
+            positions[level] = pos
+            curr_node = curr_node.get_down()
+        return prev_nodes, positions
+
+    def _select_node(self, idx):
         """
-        Promotes a node to the higher level. Promoting is done by copying the
-        node from (i)th level to the (i+1)th level.
+        Retrieves the node at the given index by following the span widths of
+        the nodes from the top level down to the zeroth level.
 
         Parameters
         ----------
-        upper_prev_node: SkipNode()
-            The tail of the `LinkedList()` object in the above level.
-        curr_node: SkipNode()
-            The node to be promoted.
-        curr_level: int
-            The current level rank (level of the node before promoting).
+        idx: int
+            A non-negative index that is less than the `SkipList()` length.
 
         Returns
         -------
-        SkipNode():
-            The `SkipNode()` object after being promoted in the higher level.
+        SkipNode() or ArraySkipNode():
+            The highest node holding the element at this index.
         """
-        assert isinstance(upper_prev_node, self._basic_node)
-        assert isinstance(curr_node, self._basic_node)
-        assert curr_level < self._num_levels
-
-        # create new node with the same data as curr_data
-        upper_node = self._basic_node(curr_node.get_data())
-        # connect the upper list to the new node
-        upper_node = self._level_lists[curr_level + 1]._insert_node(
-            upper_prev_node, upper_node
-        )
-        # connect the current list with the upper one
-        upper_node.set_down(curr_node)
-        return upper_node
+        assert type(idx) == int and 0 <= idx < len(self)
 
-    def insert(self, value):
+        # NOTE: idx+1 to skip -∞
+        target = idx + 1
+        pos = 0
+        if self._engine == "array":
+            curr_node = self._head
+            for level in range(self._num_levels - 1, -1, -1):
+                i = 2 * level
+                next_node = curr_node._links[i]
+                while (
+                    next_node is not None
+                    and pos + curr_node._links[i + 1] <= target
+                ):
+                    pos += curr_node._links[i + 1]
+                    curr_node = next_node
+                    next_node = curr_node._links[i]
+                if pos == target:
+                    break
+            return curr_node
+
+        curr_node = self._level_lists[self._num_levels - 1]._head
+        while pos != target:
+            next_node = curr_node.get_next()
+            while next_node is not None and pos + curr_node._width <= target:
+                pos += curr_node._width
+                curr_node = next_node
+                next_node = curr_node.get_next()
+            if pos != target:
+                curr_node = curr_node.get_down()
+        return curr_node
+
+    def rank(self, value):
         """
-        Insertd a value to the `SkipList()` instance in time-complexity of
-        O(log(n)) where **n** is the number of elements in the `SkipList()`.
+        Counts the elements in the `SkipList()` instance that are less than the
+        given value in time-complexity of O(log(n)) where **n** is the number
+        of elements in the `SkipList()`. When the value exists, this is its
+        index.
 
         Parameters
         ----------
         value: int or float
-            The number to be inserted in the `SkipList()` instance.
+            The value whose rank is needed.
+
+        Returns
+        -------
+        int:
+            The number of elements strictly less than the given value.
 
         Raises
         ------
-        TypeError: If the given `value` isn't a number.
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value isn't a number.
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([2, 1, 3, 4, 5])
-        >>> sl.insert(10)
-        >>> sl
-        ┌────┐       ┌───┐                   ┌────┐
-        | -∞ │⟶⟶⟶⟶⟶⟶⟶| 2 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
-        ├────┤ ┌───┐ ├───┤                   ├────┤
-        | -∞ │⟶| 1 │⟶| 2 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
-        ├────┤ ├───┤ ├───┤ ┌───┐ ┌───┐ ┌───┐ ├────┤
-        | -∞ │⟶| 1 │⟶| 2 │⟶| 3 │⟶| 4 │⟶| 5 │⟶| 10 │⟶
-        └────┘ └───┘ └───┘ └───┘ └───┘ └───┘ └────┘
-        >>> sl.insert("hi")
-        TypeError: `extra.SkipList()` supports only numbers!!
-
-        Note
-        -----
-        Inserting values into different levels in the skip list is completely
-        random. So, running the previous example will return different values
-        each time you run it. So, in order to obtain the same result as before
-        you need to set `random.seed(1)` before running any of the previous
-        example.
+        >>> sl = SkipList([4, 3, 1, 5, 2])
+        >>> sl.rank(3)
+        2
+        >>> sl.rank(2.5)
+        2
+        >>> sl.rank(100)
+        5
         """
         self._validate_item(value)
-        # search for that value
-        _, found_node, last_accessed_nodes = self._search(value)
-        # `value` already exists in our SkipList
-        if found_node.get_data() == value:
-            return
+        _, positions = self._search_predecessors(value)
+        return positions[0]
+
+    def select(self, idx):
+        """
+        Retrieves the element at the given index, i.e. the (idx+1)-th smallest
+        element, in time-complexity of O(log(n)) where **n** is the number of
+        elements in the `SkipList()`. Unlike `__getitem__()`, negative indices
+        are accepted.
+
+        Parameters
+        ----------
+        idx: int
+            The index of the element to be retrieved.
+
+        Returns
+        -------
+        int or float:
+            The value at this index inside the `SkipList()` instance.
+
+        Raises
+        ------
+        TypeError:
+            If the given index isn't `int`.
+        IndexError:
+            If the given index is out of the `SkipList()` boundaries.
+
+        Example
+        -------
+        >>> sl = SkipList([4, 3, 1, 5, 2])
+        >>> sl.select(0)
+        1
+        >>> sl.select(-1)
+        5
+        >>> sl.select(5)
+        IndexError: Can't find any element at the given index!!
+        """
+        self._validate_index(idx, accept_negative=True)
+        if idx < 0:
+            idx += len(self)
+        return self._select_node(idx).get_data()
+
+    # =============================    RANGE    ===============================
+    def bisect_left(self, value):
+        """
+        Finds the index where the given value would be inserted to keep the
+        `SkipList()` sorted, placed before the value if it already exists, in
+        time-complexity of O(log(n)) where **n** is the number of elements in
+        the `SkipList()`. This is the same as `rank()`.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be located.
+
+        Returns
+        -------
+        int:
+            The number of elements strictly less than the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value isn't a number.
+
+        Example
+        -------
+        >>> sl = SkipList([1, 3, 5, 7, 9])
+        >>> sl.bisect_left(5)
+        2
+        >>> sl.bisect_left(6)
+        3
+        """
+        return self.rank(value)
+
+    def bisect_right(self, value):
+        """
+        Finds the index where the given value would be inserted to keep the
+        `SkipList()` sorted, placed after the value if it already exists, in
+        time-complexity of O(log(n)) where **n** is the number of elements in
+        the `SkipList()`.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be located.
+
+        Returns
+        -------
+        int:
+            The number of elements less than or equal to the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value isn't a number.
+
+        Example
+        -------
+        >>> sl = SkipList([1, 3, 5, 7, 9])
+        >>> sl.bisect_right(5)
+        3
+        >>> sl.bisect_right(6)
+        3
+        """
+        self._validate_item(value)
+        _, positions = self._search_predecessors(value, inclusive=True)
+        return positions[0]
+
+    def floor(self, value):
+        """
+        Finds the greatest element in the `SkipList()` that is less than or
+        equal to the given value in time-complexity of O(log(n)) where **n**
+        is the number of elements in the `SkipList()`.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be located.
+
+        Returns
+        -------
+        int or float:
+            The greatest element less than or equal to the given value, or
+            `None` if all elements are greater than the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value isn't a number.
+
+        Example
+        -------
+        >>> sl = SkipList([1, 3, 5, 7, 9])
+        >>> sl.floor(5)
+        5
+        >>> sl.floor(6)
+        5
+        >>> sl.floor(0) is None
+        True
+        """
+        self._validate_item(value)
+        prev_nodes, positions = self._search_predecessors(
+            value, inclusive=True
+        )
+        # NOTE: position `0` is the -∞ sentinel
+        return prev_nodes[0].get_data() if positions[0] > 0 else None
+
+    def ceiling(self, value):
+        """
+        Finds the smallest element in the `SkipList()` that is greater than or
+        equal to the given value in time-complexity of O(log(n)) where **n**
+        is the number of elements in the `SkipList()`.
+
+        Parameters
+        ----------
+        value: int or float
+            The value to be located.
+
+        Returns
+        -------
+        int or float:
+            The smallest element greater than or equal to the given value, or
+            `None` if all elements are less than the given value.
+
+        Raises
+        ------
+        ValueError:
+            If the given value is `None`.
+        TypeError:
+            If the given value isn't a number.
+
+        Example
+        -------
+        >>> sl = SkipList([1, 3, 5, 7, 9])
+        >>> sl.ceiling(5)
+        5
+        >>> sl.ceiling(6)
+        7
+        >>> sl.ceiling(10) is None
+        True
+        """
+        self._validate_item(value)
+        prev_nodes, _ = self._search_predecessors(value)
+        next_node = prev_nodes[0].get_next()
+        return next_node.get_data() if next_node is not None else None
+
+    def _validate_range(self, lo, hi, inclusive):
+        """
+        Checks the validity of the given range boundaries. It raises the
+        appropriate error when they aren't valid and it returns nothing if
+        they are valid.
+
+        Parameters
+        ----------
+        lo: int or float or None
+            The lower boundary of the range, `None` means unbounded.
+        hi: int or float or None
+            The upper boundary of the range, `None` means unbounded.
+        inclusive: tuple
+            A tuple of two booleans.
+
+        Raises
+        ------
+        TypeError:
+            This happens in one of the following cases:
+                1. If one of the boundaries is neither `None` nor a number.
+                2. If `inclusive` isn't a tuple of two booleans.
+        """
+        for value in (lo, hi):
+            if value is not None:
+                self._validate_item(value)
+        if (
+            type(inclusive) != tuple
+            or len(inclusive) != 2
+            or any(type(flag) != bool for flag in inclusive)
+        ):
+            raise TypeError("`inclusive` has to be a tuple of two booleans!!")
+
+    def _iter_range(self, start_node, hi, include_hi):
+        """
+        Iterates over the zeroth level of the `SkipList()` starting from the
+        given node until passing the upper boundary of the range.
+
+        Parameters
+        ----------
+        start_node: SkipNode() or None
+            The zeroth-level node where iteration starts.
+        hi: int or float or None
+            The upper boundary of the range, `None` means unbounded.
+        include_hi: bool
+            A flag to include the upper boundary if found.
+
+        Returns
+        -------
+        generator:
+            The values within the range in ascending order.
+        """
+        curr_node = start_node
+        while curr_node is not None:
+            value = curr_node.get_data()
+            if hi is not None and (
+                value > hi or value == hi and not include_hi
+            ):
+                return
+            yield value
+            curr_node = curr_node.get_next()
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        """
+        Iterates lazily over the elements of the `SkipList()` that lie within
+        the given range. Finding the first element takes O(log(n)) time where
+        **n** is the number of elements in the `SkipList()`, and every other
+        element is streamed in O(1) time.
+
+        Parameters
+        ----------
+        lo: int or float, optional
+            The lower boundary of the range, `None` means unbounded.
+        hi: int or float, optional
+            The upper boundary of the range, `None` means unbounded.
+        inclusive: tuple, optional
+            A tuple of two booleans to include the lower & upper boundaries
+            respectively, default `(True, True)`.
+
+        Returns
+        -------
+        generator:
+            The values within the range in ascending order.
+
+        Raises
+        ------
+        TypeError:
+            This happens in one of the following cases:
+                1. If one of the boundaries is neither `None` nor a number.
+                2. If `inclusive` isn't a tuple of two booleans.
+
+        Example
+        -------
+        >>> sl = SkipList([1, 3, 5, 7, 9])
+        >>> list(sl.irange(3, 7))
+        [3, 5, 7]
+        >>> list(sl.irange(3, 7, inclusive=(False, False)))
+        [5]
+        >>> list(sl.irange(hi=4))
+        [1, 3]
+        """
+        self._validate_range(lo, hi, inclusive)
+        if lo is None:
+            # NOTE: skip -∞
+            start_node = self._get_head().get_next()
+        else:
+            prev_nodes, _ = self._search_predecessors(
+                lo, inclusive=not inclusive[0]
+            )
+            start_node = prev_nodes[0].get_next()
+        return self._iter_range(start_node, hi, inclusive[1])
+
+    def count_range(self, lo=None, hi=None, inclusive=(True, True)):
+        """
+        Counts the elements of the `SkipList()` that lie within the given range
+        in time-complexity of O(log(n)) where **n** is the number of elements
+        in the `SkipList()`.
+
+        Parameters
+        ----------
+        lo: int or float, optional
+            The lower boundary of the range, `None` means unbounded.
+        hi: int or float, optional
+            The upper boundary of the range, `None` means unbounded.
+        inclusive: tuple, optional
+            A tuple of two booleans to include the lower & upper boundaries
+            respectively, default `(True, True)`.
+
+        Returns
+        -------
+        int:
+            The number of elements within the range.
+
+        Raises
+        ------
+        TypeError:
+            This happens in one of the following cases:
+                1. If one of the boundaries is neither `None` nor a number.
+                2. If `inclusive` isn't a tuple of two booleans.
+
+        Example
+        -------
+        >>> sl = SkipList([1, 3, 5, 7, 9])
+        >>> sl.count_range(3, 7)
+        3
+        >>> sl.count_range(3, 7, inclusive=(False, True))
+        2
+        >>> sl.count_range(lo=4)
+        3
+        """
+        self._validate_range(lo, hi, inclusive)
+        if lo is None:
+            start = 0
+        else:
+            _, positions = self._search_predecessors(
+                lo, inclusive=not inclusive[0]
+            )
+            start = positions[0]
+        if hi is None:
+            end = len(self)
+        else:
+            _, positions = self._search_predecessors(
+                hi, inclusive=inclusive[1]
+            )
+            end = positions[0]
+        return max(end - start, 0)
+
+    # =============================    INSERT    ==============================
+    def _draw_height(self):
+        """
+        Draws the number of levels a new value will belong to using the random
+        generator of the `SkipList()` instance. The height follows a geometric
+        distribution where the probability of being promoted from one level
+        to the next is the instance's `probability`.
+
+        Returns
+        -------
+        int:
+            A positive integer that is at most the instance's `max_height`.
+
+        Example
+        -------
+        >>> sl = SkipList(seed=1)
+        >>> [sl._draw_height() for _ in range(10)]
+        [2, 1, 1, 4, 2, 4, 2, 3, 1, 2]
+        """
+        if self._max_height == 1:
+            return 1
+        elif self._bits_per_level:
+            num_bits = self._bits_per_level * (self._max_height - 1)
+            number = self._rng.getrandbits(num_bits)
+            # all bits are zeros, promote to the top
+            if number == 0:
+                return self._max_height
+            return 1 + count_trailing_zeros(number) // self._bits_per_level
+        # invert the geometric distribution, NOTE: 1-random() is in (0, 1]
+        height = 1 + int(
+            math.log(1.0 - self._rng.random()) / self._log_probability
+        )
+        return min(height, self._max_height)
+
+    def _add_extra_level(self):
+        """
+        Creates a new level at the top of the `SkipList()`, a new level is a
+        new `LinkedList()` instance attached to the `SkipList()`.
+
+        Returns
+        -------
+        LinkedList():
+            The newly-created `LinkedList()` instance after being attached to
+            the other `LinkedList()` object in the lower level.
+        """
+        top_list = self._level_lists[self._num_levels - 1]
+        new_llist = LinkedList()
+        new_llist._insert_node(new_llist._head,
+                               self._basic_node(float("-inf")))
+        # connect the head of the new linked list to the lower linked list
+        new_llist._head.set_down(top_list._head)
+        # the head of an empty level spans over the whole skip list
+        new_llist._head._width = len(self) + 1
+        # add new linked list to the SkipList
+        self._level_lists.append(new_llist)
+        self._num_levels += 1
+        return new_llist
+
+    def _promote(self, upper_prev_node, curr_node, curr_level):
+        """
+        Promotes a node to the higher level. Promoting is done by copying the
+        node from (i)th level to the (i+1)th level.
+
+        Parameters
+        ----------
+        upper_prev_node: SkipNode()
+            The tail of the `LinkedList()` object in the above level.
+        curr_node: SkipNode()
+            The node to be promoted.
+        curr_level: int
+            The current level rank (level of the node before promoting).
+
+        Returns
+        -------
+        SkipNode():
+            The `SkipNode()` object after being promoted in the higher level.
+        """
+        assert isinstance(upper_prev_node, self._basic_node)
+        assert isinstance(curr_node, self._basic_node)
+        assert curr_level < self._num_levels
+
+        # create new node with the same data as curr_data
+        upper_node = self._basic_node(curr_node.get_data())
+        # connect the upper list to the new node
+        upper_node = self._level_lists[curr_level + 1]._insert_node(
+            upper_prev_node, upper_node
+        )
+        # connect the current list with the upper one
+        upper_node.set_down(curr_node)
+        return upper_node
+
+    def _insert_tower(self, prev_nodes, positions, value):
+        """
+        Inserts the given value into the "array" engine as one
+        `ArraySkipNode()` whose height is drawn by `_draw_height()`.
+
+        Parameters
+        ----------
+        prev_nodes: list
+            The last node at every level whose value is less than the given
+            value as returned by `_search_predecessors()`.
+        positions: list
+            The positions of the `prev_nodes` as returned by
+            `_search_predecessors()`.
+        value: int or float
+            The number to be inserted which doesn't exist in the `SkipList()`.
+
+        Note
+        ----
+        Afterwards, `prev_nodes` and `positions` point at the new node in the
+        levels it was inserted to, so they are still the predecessors of any
+        value greater than the inserted one.
+        """
+        height = self._draw_height()
+        # the head of an empty level spans over the whole skip list
+        head_links = self._head._links
+        while self._num_levels < height:
+            head_links += [None, self._length + 1]
+            prev_nodes.append(self._head)
+            positions.append(0)
+            self._num_levels += 1
+
+        new_node = ArraySkipNode(value, height)
+        new_links = new_node._links
+        new_pos = positions[0] + 1
+        for level in range(self._num_levels):
+            i = 2 * level
+            prev_links = prev_nodes[level]._links
+            if level < height:
+                # split the span of the predecessor at new_node
+                new_links[i] = prev_links[i]
+                new_links[i + 1] = positions[level] + prev_links[i + 1] + 1 \
+                    - new_pos
+                prev_links[i] = new_node
+                prev_links[i + 1] = new_pos - positions[level]
+            else:
+                # new_node lies within the span of the predecessor
+                prev_links[i + 1] += 1
+        self._length += 1
+        for level in range(height):
+            prev_nodes[level] = new_node
+            positions[level] = new_pos
+
+    def _insert_copies(self, prev_nodes, positions, value):
+        """
+        Inserts the given value into the "linked_list" engine by copying it to
+        as many levels as drawn by `_draw_height()`.
+
+        Parameters
+        ----------
+        prev_nodes: list
+            The last node at every level whose value is less than the given
+            value as returned by `_search_predecessors()`.
+        positions: list
+            The positions of the `prev_nodes` as returned by
+            `_search_predecessors()`.
+        value: int or float
+            The number to be inserted which doesn't exist in the `SkipList()`.
+
+        Note
+        ----
+        Afterwards, `prev_nodes` and `positions` point at the new nodes in the
+        levels they were inserted to, so they are still the predecessors of any
+        value greater than the inserted one.
+        """
         # create new_node with the new value
         new_node = self._basic_node(value)
         # insert new_node to the 0th linkedlist
-        curr_node = self._level_lists[0]._insert_node(found_node, new_node)
-
-        # promote the new_node if flipping the coin results `Head`
+        curr_node = self._level_lists[0]._insert_node(prev_nodes[0], new_node)
+        new_pos = positions[0] + 1
+        # new_node lies within the span of every upper predecessor
+        for level in range(1, self._num_levels):
+            prev_nodes[level]._width += 1
+        prev_nodes[0], positions[0] = curr_node, new_pos
+
+        # promote the new_node to the drawn height
+        height = self._draw_height()
         curr_level = 0
-        while flip_coin() == "head":
+        while curr_level < height - 1:
             if curr_level >= self._num_levels - 1:
                 top_list = self._add_extra_level()
-                upper_prev_node = top_list._head
-            else:
-                upper_prev_node = last_accessed_nodes[curr_level]
+                prev_nodes.append(top_list._head)
+                positions.append(0)
+            upper_prev_node = prev_nodes[curr_level + 1]
+            upper_pos = positions[curr_level + 1]
             # promote new_node
             curr_node = self._promote(upper_prev_node, curr_node, curr_level)
+            # split the span of the upper predecessor at new_node
+            curr_node._width = upper_pos + upper_prev_node._width - new_pos
+            upper_prev_node._width = new_pos - upper_pos
             curr_level += 1
+            prev_nodes[curr_level], positions[curr_level] = curr_node, new_pos
+
+    def insert(self, value):
+        """
+        Insertd a value to the `SkipList()` instance in time-complexity of
+        O(log(n)) where **n** is the number of elements in the `SkipList()`.
+
+        Parameters
+        ----------
+        value: int or float
+            The number to be inserted in the `SkipList()` instance.
+
+        Raises
+        ------
+        TypeError: If the given `value` isn't a number.
+
+        Example
+        -------
+        >>> sl = SkipList([2, 1, 3, 4, 5], seed=173)
+        >>> sl.insert(10)
+        >>> sl
+        ┌────┐       ┌───┐                   ┌────┐
+        | -∞ │⟶⟶⟶⟶⟶⟶⟶| 2 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
+        ├────┤ ┌───┐ ├───┤                   ├────┤
+        | -∞ │⟶| 1 │⟶| 2 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 10 │⟶
+        ├────┤ ├───┤ ├───┤ ┌───┐ ┌───┐ ┌───┐ ├────┤
+        | -∞ │⟶| 1 │⟶| 2 │⟶| 3 │⟶| 4 │⟶| 5 │⟶| 10 │⟶
+        └────┘ └───┘ └───┘ └───┘ └───┘ └───┘ └────┘
+        >>> sl.insert("hi")
+        TypeError: `extra.SkipList()` supports only numbers!!
+
+        Note
+        -----
+        Inserting values into different levels in the skip list is completely
+        random. So, running the previous example will return different values
+        each time you run it. So, in order to obtain the same result as before
+        you need to pass the same `seed`.
+        """
+        self._validate_item(value)
+        # the -∞ sentinel is at the head of every level already
+        if value == float("-inf"):
+            return
+        # search for that value
+        prev_nodes, positions = self._search_predecessors(value)
+        next_node = prev_nodes[0].get_next()
+        # `value` already exists in our SkipList
+        if next_node is not None and next_node.get_data() == value:
+            return
+        elif self._engine == "array":
+            self._insert_tower(prev_nodes, positions, value)
+        else:
+            self._insert_copies(prev_nodes, positions, value)
+
+    def _get_sorted_values(self, iterable):
+        """
+        Validates the elements of the given iterable and returns them sorted
+        without duplicates. Sorting is skipped when the elements are already
+        sorted.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method.
+
+        Returns
+        -------
+        list:
+            A sorted list of the unique numbers inside the given `iterable`
+            except -∞ which is the sentinel of the `SkipList()`.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in two cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is NOT a number.
+        ValueError:
+            If one of the iterable elements is `None`.
+        """
+        if not hasattr(iterable, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        values = list(iterable)
+        numeric_types = {int, float}
+        is_sorted = True
+        for idx, item in enumerate(values):
+            if type(item) not in numeric_types:
+                # let the validator raise the proper error
+                self._validate_item(item)
+            if is_sorted and idx > 0 and item < values[idx - 1]:
+                is_sorted = False
+        if not is_sorted:
+            values.sort()
+        # drop duplicates and the -∞ sentinel silently the same way as
+        # `insert()` does
+        unique_values = []
+        prev_item = float("-inf")
+        for item in values:
+            if item != prev_item:
+                unique_values.append(item)
+                prev_item = item
+        return unique_values
+
+    def _append_sorted(self, values, deterministic=False):
+        """
+        Appends sorted unique values, that are all greater than the maximum of
+        the `SkipList()` instance, in time-complexity of O(m) where **m** is
+        the number of the given values. The last node at every level is kept
+        while sweeping, so no search is needed per value.
+
+        Parameters
+        ----------
+        values: list
+            A sorted list of unique numbers greater than the ones stored in
+            the `SkipList()` instance.
+        deterministic: bool
+            A flag to promote every k-th node of a level to the next level,
+            where k is the closest integer to `1/probability`, instead of
+            drawing the heights randomly. (default: `False`)
+        """
+        # inclusive, so a stored +∞ counts as the last node
+        last_nodes, last_positions = self._search_predecessors(
+            float("inf"), inclusive=True
+        )
+        step = max(2, round(1 / self._probability))
+        pos = last_positions[0]
+        for value in values:
+            pos += 1
+            if deterministic:
+                height, quotient = 1, pos
+                while quotient % step == 0 and height < self._max_height:
+                    height += 1
+                    quotient //= step
+            else:
+                height = self._draw_height()
+            # widths are set when the levels are linked or at the end
+            while self._num_levels < height:
+                if self._engine == "array":
+                    self._head._links += [None, 0]
+                    self._num_levels += 1
+                    last_nodes.append(self._head)
+                else:
+                    last_nodes.append(self._add_extra_level()._head)
+                last_positions.append(0)
+
+            if self._engine == "array":
+                new_node = ArraySkipNode(value, height)
+                for level in range(height):
+                    i = 2 * level
+                    last_links = last_nodes[level]._links
+                    last_links[i] = new_node
+                    last_links[i + 1] = pos - last_positions[level]
+                    last_nodes[level] = new_node
+                    last_positions[level] = pos
+            else:
+                lower_node = None
+                for level in range(height):
+                    new_node = self._level_lists[level]._insert_node(
+                        last_nodes[level], self._basic_node(value)
+                    )
+                    if lower_node is not None:
+                        new_node.set_down(lower_node)
+                    last_nodes[level]._width = pos - last_positions[level]
+                    last_nodes[level] = lower_node = new_node
+                    last_positions[level] = pos
+
+        # the last node at every level spans till the end of the skip list
+        for level in range(self._num_levels):
+            width = pos + 1 - last_positions[level]
+            if self._engine == "array":
+                last_nodes[level]._links[2 * level + 1] = width
+            else:
+                last_nodes[level]._width = width
+        if self._engine == "array":
+            self._length = pos
+
+    @classmethod
+    def from_sorted(
+        cls,
+        iterable,
+        engine="array",
+        seed=None,
+        probability=0.5,
+        max_height=32,
+        deterministic=False,
+    ):
+        """
+        A class method which bulk-loads a `SkipList()` instance out of sorted
+        values in time-complexity of O(n) where **n** is the number of
+        elements inside the given `iterable`. All levels are built in one pass
+        by appending every value to the end of the levels it belongs to.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method.
+            For example, `list` and `tuple` are both iterables.
+        engine: str
+            The layout used to store the levels. (default: "array")
+        seed: int, optional
+            The seed of the random generator owned by the new instance.
+        probability: float
+            The probability of promoting a value to the next level.
+            (default: 0.5)
+        max_height: int
+            The maximum number of levels a value can belong to. (default: 32)
+        deterministic: bool
+            A flag to promote every k-th node of a level to the next level,
+            where k is the closest integer to `1/probability`, instead of
+            promoting the values randomly. This gives a perfectly balanced
+            skip list. (default: `False`)
+
+        Returns
+        -------
+        SkipList():
+            A `SkipList()` instance holding the given values.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in these cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is NOT a number.
+                3. If `probability` isn't a number.
+                4. If `max_height` isn't an integer.
+        ValueError:
+            It can be raised in these cases
+                1. If one of the iterable elements is `None`.
+                2. If the given `engine` isn't a supported engine.
+                3. If `probability` isn't between 0 and 1 (exclusive).
+                4. If `max_height` is less than 1.
+
+        Example
+        -------
+        >>> SkipList.from_sorted([1, 2, 3, 4, 5, 6, 7], deterministic=True)
+        ┌────┐                   ┌───┐
+        | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 4 │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶
+        ├────┤       ┌───┐       ├───┤       ┌───┐
+        | -∞ │⟶⟶⟶⟶⟶⟶⟶| 2 │⟶⟶⟶⟶⟶⟶⟶| 4 │⟶⟶⟶⟶⟶⟶⟶| 6 │⟶⟶⟶⟶⟶⟶⟶
+        ├────┤ ┌───┐ ├───┤ ┌───┐ ├───┤ ┌───┐ ├───┤ ┌───┐
+        | -∞ │⟶| 1 │⟶| 2 │⟶| 3 │⟶| 4 │⟶| 5 │⟶| 6 │⟶| 7 │⟶
+        └────┘ └───┘ └───┘ └───┘ └───┘ └───┘ └───┘ └───┘
+
+        Unsorted values are sorted first in time-complexity of O(n log(n))
+
+        >>> SkipList.from_sorted([3, 1, 2], deterministic=True)
+        ┌────┐       ┌───┐
+        | -∞ │⟶⟶⟶⟶⟶⟶⟶| 2 │⟶⟶⟶⟶⟶⟶
+        ├────┤ ┌───┐ ├───┤ ┌───┐
+        | -∞ │⟶| 1 │⟶| 2 │⟶| 3 │⟶
+        └────┘ └───┘ └───┘ └───┘
+        """
+        if not hasattr(iterable, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        sl = cls(
+            engine=engine,
+            seed=seed,
+            probability=probability,
+            max_height=max_height,
+        )
+        sl._append_sorted(sl._get_sorted_values(iterable), deterministic)
+        return sl
+
+    def update(self, iterable):
+        """
+        Inserts all values of the given iterable into the `SkipList()`
+        instance in one sweep. The values are sorted first, then each one is
+        searched for starting from the predecessors of the previous one, and
+        the values greater than the maximum are appended directly. This takes
+        time-complexity of O(m log(m) + n) in the worst case where **m** is the
+        number of the given values and **n** is the number of elements in the
+        `SkipList()`, which is less than O(m log(n)) when `m` is large.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method.
+            For example, `list` and `tuple` are both iterables.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in two cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is NOT a number.
+        ValueError:
+            If one of the iterable elements is `None`.
+
+        Note
+        ----
+        All values are validated before inserting any of them, so the
+        `SkipList()` instance isn't changed when an error is raised.
+
+        Example
+        -------
+        >>> sl = SkipList([10, -2, 3], seed=7)
+        >>> sl.update([8, 3, 20, 1])
+        >>> sl.to_list()
+        [-2, 1, 3, 8, 10, 20]
+        """
+        values = self._get_sorted_values(iterable)
+        last_node = self._search_predecessors(
+            float("inf"), inclusive=True
+        )[0][0]
+        split = bisect.bisect_right(values, last_node.get_data())
+        fingers = None
+        for value in values[:split]:
+            prev_nodes, positions = self._search_predecessors(
+                value, fingers=fingers
+            )
+            next_node = prev_nodes[0].get_next()
+            if next_node is None or next_node.get_data() != value:
+                if self._engine == "array":
+                    self._insert_tower(prev_nodes, positions, value)
+                else:
+                    self._insert_copies(prev_nodes, positions, value)
+            fingers = (prev_nodes, positions)
+        self._append_sorted(values[split:])
 
     # =============================    REMOVE    ==============================
     def _remove_level(self, level):
@@ -944,6 +1987,36 @@ class SkipList(Extra):
         del self._level_lists[level]
         self._num_levels -= 1
 
+    def _remove_tower(self, prev_nodes, found_node):
+        """
+        Removes the given `ArraySkipNode()` from all the levels of the "array"
+        engine.
+
+        Parameters
+        ----------
+        prev_nodes: list
+            The last node at every level whose value is less than the value
+            of the `found_node` as returned by `_search_predecessors()`.
+        found_node: ArraySkipNode()
+            The node to be removed.
+        """
+        found_links = found_node._links
+        for level in range(self._num_levels):
+            i = 2 * level
+            prev_links = prev_nodes[level]._links
+            if prev_links[i] is found_node:
+                # the predecessor takes over the span of the removed node
+                prev_links[i] = found_links[i]
+                prev_links[i + 1] += found_links[i + 1] - 1
+            else:
+                prev_links[i + 1] -= 1
+        self._length -= 1
+        # remove the levels that became empty
+        head_links = self._head._links
+        while self._num_levels > 1 and head_links[-2] is None:
+            del head_links[-2:]
+            self._num_levels -= 1
+
     def remove(self, value):
         """
         Removes node whose value equal to the given value.
@@ -955,8 +2028,7 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([4, 3, 1, 5])
+        >>> sl = SkipList([4, 3, 1, 5], seed=7)
         >>> sl
         ┌────┐             ┌───┐
         | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 4 │⟶⟶⟶⟶⟶⟶⟶
@@ -982,26 +2054,25 @@ class SkipList(Extra):
         if type(value) not in {int, float}:
             return
         # search for that value
-        prev_node, found_node, last_accessed_nodes = self._search(value)
-        # NOTE: len(last_accessed_nodes) can be used to get the level where
-        #  this value was found
-        if found_node.get_data() == value:
-            level = self._num_levels - 1 - len(last_accessed_nodes)
-            while level >= 0:
-                curr_level_list = self._level_lists[level]
-                curr_level_list._remove_node(prev_node, found_node)
-                # check if curr_level_list is empty()
-                if level != 0 and len(curr_level_list) == 1:
-                    self._remove_level(level)
-                level -= 1
-                found_node = found_node.get_down()
-                # update value of prev_node
-                if prev_node is not None and found_node is not None:
-                    prev_node = prev_node.get_down()
-                    next_node = prev_node.get_next()
-                    while next_node.get_data() != found_node.get_data():
-                        prev_node = next_node
-                        next_node = prev_node.get_next()
+        prev_nodes, _ = self._search_predecessors(value)
+        found_node = prev_nodes[0].get_next()
+        if found_node is None or found_node.get_data() != value:
+            return
+        elif self._engine == "array":
+            self._remove_tower(prev_nodes, found_node)
+            return
+        for level in range(self._num_levels):
+            prev_node = prev_nodes[level]
+            next_node = prev_node.get_next()
+            if next_node is not None and next_node.get_data() == value:
+                # prev_node takes over the span of the removed node
+                prev_node._width += next_node._width - 1
+                self._level_lists[level]._remove_node(prev_node, next_node)
+            else:
+                prev_node._width -= 1
+        # remove the levels that became empty
+        while self._num_levels > 1 and len(self._level_lists[-1]) == 1:
+            self._remove_level(self._num_levels - 1)
 
     def __delitem__(self, idx):
         """
@@ -1025,8 +2096,7 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([4, 3, 1, 5])
+        >>> sl = SkipList([4, 3, 1, 5], seed=7)
         >>> sl
         ┌────┐             ┌───┐
         | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 4 │⟶⟶⟶⟶⟶⟶⟶
@@ -1051,9 +2121,7 @@ class SkipList(Extra):
         since it was empty after removal.
         """
         self._validate_index(idx)
-        # NOTE: idx+1 to skip -∞
-        _, node = self._level_lists[0]._get_node(idx + 1)
-        self.remove(node.get_data())
+        self.remove(self._select_node(idx).get_data())
 
     def clear(self):
         """
@@ -1061,8 +2129,7 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList([4, 3, 1, 5])
+        >>> sl = SkipList([4, 3, 1, 5], seed=7)
         >>> sl
         ┌────┐             ┌───┐
         | -∞ │⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶⟶| 4 │⟶⟶⟶⟶⟶⟶⟶
@@ -1079,7 +2146,7 @@ class SkipList(Extra):
         | -∞ │⟶
         └────┘
         """
-        self.__init__()
+        self._reset()
 
     # =============================     MISC     ==============================
     def to_list(self):
@@ -1095,8 +2162,7 @@ class SkipList(Extra):
 
         Example
         -------
-        >>> import random; random.seed(1)
-        >>> sl = SkipList()
+        >>> sl = SkipList(seed=7)
         >>> sl.insert(20)
         >>> sl.insert(10)
         >>> sl.insert(30)
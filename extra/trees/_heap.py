@@ -1,3 +1,4 @@
+import array
 import warnings
 from abc import ABC, abstractmethod
 from extra.interface import Extra
@@ -53,13 +54,44 @@ class HeapNode(BinaryTreeNode):
 class Heap(ABC, Extra):
     _basic_node = HeapNode
     __name__ = "extra.Heap()"
+    # the numeric type codes of the `array` module
+    TYPECODES = {"b", "B", "h", "H", "i", "I", "l", "L", "q", "Q", "f", "d"}
 
     @abstractmethod
-    def __init__(self):
+    def __init__(self, indexed=False, typecode=None):
         """
         An abstract method that initializes the `Heap()` abstract class.
-        """
-        self._heap = []
+
+        Parameters
+        ----------
+        indexed: bool
+            A flag to keep a value-to-positions index alongside the heap. This
+            index makes `remove()`, `update()` & `decrease_key()` run in O(h)
+            and `__contains__()` in O(1) at the cost of extra memory.
+            (default: False)
+        typecode: str, optional
+            A numeric type code of the `array` module (e.g. `'d'` for C
+            doubles). When given, the heap values are packed inside an
+            `array.array` instead of a `list` of Python objects. (default:
+            None)
+
+        Raises
+        ------
+        TypeError: If `indexed` isn't a boolean or `typecode` isn't a string.
+        ValueError: If `typecode` isn't a numeric type code.
+        """
+        if type(indexed) != bool:
+            raise TypeError("`indexed` is a boolean flag (False by default)!!")
+        if typecode is not None:
+            if type(typecode) != str:
+                raise TypeError("`typecode` has to be a string!!")
+            if typecode not in self.TYPECODES:
+                raise ValueError(
+                    f"`typecode` has to be one of {sorted(self.TYPECODES)}!!"
+                )
+        self._typecode = typecode
+        self._heap = [] if typecode is None else array.array(typecode)
+        self._positions = {} if indexed else None
 
     def _validate_item(self, item):
         """
@@ -82,17 +114,29 @@ class Heap(ABC, Extra):
             raise TypeError(f"`{self.__name__}` accepts only numbers!!")
 
     @classmethod
-    def heapify(cls, iterable):
+    def heapify(cls, iterable, is_min_heap=True, indexed=False, typecode=None):
         """
         A class method which converts an iterable object to a heap object in
         time-complexity of O(n) where **n** is the number of elements inside
-        the given `iterable`.
+        the given `iterable`. The values are validated in one pass, then the
+        heap is built in-place from the bottom up (Floyd's method) instead of
+        inserting them one by one.
 
         Parameters
         ----------
         iterable: iterable
             An iterable python object that implements the `__iter__` method.
-            For example, `list` and `tuple` are both iterables.
+            For example, `list`, `tuple`, `array.array` and generators are all
+            iterables.
+        is_min_heap: (default: True)
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+        indexed: bool
+            A flag to keep a value-to-positions index alongside the heap.
+            (default: False)
+        typecode: str, optional
+            A numeric type code of the `array` module to pack the heap values
+            in an `array.array`. (default: None)
 
         Returns
         -------
@@ -106,12 +150,45 @@ class Heap(ABC, Extra):
             2. If one of the elements in the iterable is NOT a number.
 
         ValueError: If one of the iterable elements is `None`.
+        OverflowError: If one of the elements doesn't fit in `typecode`.
         """
+        assert type(is_min_heap) == bool
         if not hasattr(iterable, "__iter__"):
             raise TypeError("The given object isn't iterable!!")
-        heap = cls()
-        for item in iterable:
-            heap.insert(item)
+        heap = cls(indexed=indexed, typecode=typecode)
+        numeric_types = {int, float}
+        if isinstance(iterable, array.array) and iterable.typecode in (
+            cls.TYPECODES
+        ):
+            # numeric arrays hold nothing but numbers, arrays of the same
+            # type code are copied with a single memcpy
+            values = (
+                list(iterable) if typecode is None
+                else array.array(typecode, iterable)
+            )
+        elif typecode is None:
+            values = list(iterable)
+            for item in values:
+                if type(item) not in numeric_types:
+                    # let the validator raise the proper error
+                    heap._validate_item(item)
+        else:
+            # pack the values right away to avoid an intermediate list
+            values = array.array(typecode)
+            append = values.append
+            for item in iterable:
+                if type(item) not in numeric_types:
+                    heap._validate_item(item)
+                append(item)
+        # build the heap first, then index the final positions in one pass
+        positions, heap._positions = heap._positions, None
+        heap._heap = values
+        for idx in reversed(range(len(values) // 2)):
+            heap._sift_down(idx, is_min_heap)
+        if positions is not None:
+            for idx, value in enumerate(values):
+                positions.setdefault(value, set()).add(idx)
+            heap._positions = positions
         return heap
 
     # =============================    LENGTH    ==============================
@@ -139,7 +216,7 @@ class Heap(ABC, Extra):
             `True` shows that this instance is empty and `False` shows it's
             not empty.
         """
-        return self._heap == []
+        return len(self._heap) == 0
 
     # =============================     PRINT    ==============================
     def _transform(self):
@@ -156,9 +233,11 @@ class Heap(ABC, Extra):
 
         root = self._basic_node(self._heap[0])
         q = [root]
+        q_idx = 0
         idx = 1
         while idx < len(self):
-            parent_node = q.pop(0)
+            parent_node = q[q_idx]
+            q_idx += 1
             parent_node.set_left(self._basic_node(self._heap[idx]))
             q.append(parent_node.get_left())
             idx += 1
@@ -170,9 +249,95 @@ class Heap(ABC, Extra):
         btree._root = root
         return btree
 
+    def _compute_layout(self):
+        """
+        Computes the drawing layout of the heap instance directly from the
+        indices of the list-shaped heap. It follows the same layout used by
+        `BinaryTree.__repr__()` without creating any node.
+
+        Returns
+        -------
+        tuple:
+            Three lists indexed the same way as the heap; the width of the box
+            of each subtree, the middle position of each node's value within
+            its box and the offset of each box within the whole drawing.
+        """
+        heap = self._heap
+        length = len(heap)
+        widths = [0] * length
+        mids = [0] * length
+        # children come after their parents, so fill the boxes bottom-up
+        for idx in range(length - 1, -1, -1):
+            value_width = len(str(heap[idx]))
+            left_idx, right_idx = 2 * idx + 1, 2 * idx + 2
+            l_width = widths[left_idx] if left_idx < length else 0
+            r_width = widths[right_idx] if right_idx < length else 0
+            root_start = l_width + 1 if l_width > 0 else 0
+            gap_size = value_width + (l_width > 0) + (r_width > 0)
+            widths[idx] = l_width + gap_size + r_width
+            mids[idx] = (2 * root_start + value_width - 1) // 2
+        # then place the boxes top-down
+        offsets = [0] * length
+        for idx in range(length // 2):
+            left_idx, right_idx = 2 * idx + 1, 2 * idx + 2
+            offsets[left_idx] = offsets[idx]
+            if right_idx < length:
+                offsets[right_idx] = (
+                    offsets[idx] + widths[idx] - widths[right_idx]
+                )
+        return widths, mids, offsets
+
+    def _iter_repr_lines(self):
+        """
+        Generates the lines representing the heap instance level by level
+        using the indices of the list-shaped heap.
+
+        Returns
+        -------
+        generator:
+            A generator of the lines representing the heap instance.
+        """
+        heap = self._heap
+        length = len(heap)
+        widths, mids, offsets = self._compute_layout()
+        start = 0
+        while start < length:
+            end = min(2 * start + 1, length)
+            branch_line, node_line = [], []
+            cursor = 0
+            for idx in range(start, end):
+                value_repr = str(heap[idx])
+                left_idx, right_idx = 2 * idx + 1, 2 * idx + 2
+                padding = " " * (offsets[idx] - cursor)
+                node_line.append(padding)
+                branch_line.append(padding)
+                if left_idx < length:
+                    l_width = widths[left_idx]
+                    l_root = mids[left_idx] + 1
+                    node_line.append(" " * (l_root + 1))
+                    node_line.append("_" * (l_width - l_root))
+                    branch_line.append(" " * l_root + "/")
+                    branch_line.append(" " * (l_width - l_root))
+                node_line.append(value_repr)
+                branch_line.append(" " * len(value_repr))
+                if right_idx < length:
+                    r_width = widths[right_idx]
+                    r_root = mids[right_idx]
+                    node_line.append("_" * r_root)
+                    node_line.append(" " * (r_width - r_root + 1))
+                    branch_line.append(" " * r_root + "\\")
+                    branch_line.append(" " * (r_width - r_root))
+                cursor = offsets[idx] + widths[idx]
+            yield "".join(node_line).rstrip()
+            # the last level has no branches beneath it
+            if end < length:
+                yield "".join(branch_line).rstrip()
+            start = end
+
     def __repr__(self):
         """
-        Represents the heap instance as a string.
+        Represents the heap instance as a string. The drawing is generated
+        level by level from the list-shaped heap, so no tree gets created.
 
         Returns
         -------
@@ -181,14 +346,14 @@ class Heap(ABC, Extra):
         """
         if self.is_empty():
             return "/ \\"
-        btree = self._transform()
-        return str(btree)
+        return "\n".join(self._iter_repr_lines())
 
     # =============================    SEARCH    ==============================
     def __contains__(self, num):
         """
         Searches the heap instance for the given value and returns `True` if
-        the value exists and `False` if not.
+        the value exists and `False` if not. It takes constant time when the
+        heap is indexed and linear time otherwise.
 
         Parameters
         ----------
@@ -203,8 +368,155 @@ class Heap(ABC, Extra):
         """
         if self.is_empty() or type(num) not in {int, float}:
             return False
+        if self._positions is not None:
+            return num in self._positions
         return num in self._heap
 
+    def _find_idx(self, value):
+        """
+        Returns the index of one occurrence of the given value inside the heap
+        instance, or `None` if the value wasn't found. It uses the positions
+        index when the heap is indexed.
+
+        Parameters
+        ----------
+        value: object
+            The value to be searched for.
+
+        Returns
+        -------
+        int or None:
+            The index of the value inside `_heap`.
+        """
+        if self.is_empty() or type(value) not in {int, float}:
+            return None
+        if self._positions is not None:
+            indices = self._positions.get(value)
+            return next(iter(indices)) if indices else None
+        try:
+            return self._heap.index(value)
+        except ValueError:
+            return None
+
+    # =============================    INDEX     ==============================
+    def __add_position(self, value, idx):
+        """
+        Records that the given value is stored at the given index.
+        """
+        self._positions.setdefault(value, set()).add(idx)
+
+    def __discard_position(self, value, idx):
+        """
+        Forgets that the given value is stored at the given index.
+        """
+        indices = self._positions[value]
+        indices.discard(idx)
+        if not indices:
+            del self._positions[value]
+
+    def __move_position(self, value, old_idx, new_idx):
+        """
+        Records that the given value has moved from `old_idx` to `new_idx`.
+        """
+        indices = self._positions[value]
+        indices.discard(old_idx)
+        indices.add(new_idx)
+
+    # =============================     SIFT     ==============================
+    def _sift_up(self, idx, is_min_heap):
+        """
+        Moves the value at the given index up the heap instance till its parent
+        respects the heap-order property in time-complexity of O(h) where
+        **h** is the height of the heap.
+
+        Parameters
+        ----------
+        idx: int
+            The index of the value to be moved up.
+        is_min_heap: bool
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+
+        Returns
+        -------
+        int:
+            The index at which the value has settled.
+        """
+        heap = self._heap
+        positions = self._positions
+        start_idx = idx
+        value = heap[idx]
+        while idx > 0:
+            parent_idx = (idx - 1) // 2
+            parent = heap[parent_idx]
+            if (parent > value) if is_min_heap else (parent < value):
+                heap[idx] = parent
+                if positions is not None:
+                    self.__move_position(parent, parent_idx, idx)
+                idx = parent_idx
+            else:
+                break
+        heap[idx] = value
+        if positions is not None and idx != start_idx:
+            self.__move_position(value, start_idx, idx)
+        return idx
+
+    def _sift_down(self, idx, is_min_heap):
+        """
+        Moves the value at the given index down the heap instance till both of
+        its children respect the heap-order property in time-complexity of
+        O(h) where **h** is the height of the heap.
+
+        Parameters
+        ----------
+        idx: int
+            The index of the value to be moved down.
+        is_min_heap: bool
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+
+        Returns
+        -------
+        int:
+            The index at which the value has settled.
+        """
+        heap = self._heap
+        positions = self._positions
+        length = len(heap)
+        start_idx = idx
+        value = heap[idx]
+        child_idx = (idx * 2) + 1
+        while child_idx < length:
+            # get which child should be moved up
+            right_idx = child_idx + 1
+            if right_idx < length and (
+                heap[right_idx] < heap[child_idx]
+                if is_min_heap
+                else heap[right_idx] > heap[child_idx]
+            ):
+                child_idx = right_idx
+            child = heap[child_idx]
+            if (child < value) if is_min_heap else (child > value):
+                heap[idx] = child
+                if positions is not None:
+                    self.__move_position(child, child_idx, idx)
+                idx = child_idx
+                child_idx = (idx * 2) + 1
+            else:
+                break
+        heap[idx] = value
+        if positions is not None and idx != start_idx:
+            self.__move_position(value, start_idx, idx)
+        return idx
+
+    def _restore(self, idx, is_min_heap):
+        """
+        Restores the heap-order property around the value at the given index
+        after it has been changed, by moving it either up or down.
+        """
+        if self._sift_up(idx, is_min_heap) == idx:
+            self._sift_down(idx, is_min_heap)
+
     # =============================    INSERT    ==============================
     def insert(self, value, is_min_heap=True):
         """
@@ -228,79 +540,112 @@ class Heap(ABC, Extra):
 
         # add the new value
         self._heap.append(value)
-        # swap between parents when needed
         idx = len(self._heap) - 1
-        while idx != 0:
-            parent_idx = (idx - 1) // 2
-            current = self._heap[idx]
-            parent = self._heap[parent_idx]
-            if (is_min_heap and parent > current) or (
-                not is_min_heap and parent < current
-            ):
-                self._heap[parent_idx], self._heap[idx] = (
-                    self._heap[idx],
-                    self._heap[parent_idx],
-                )
-                idx = parent_idx
-            else:
-                break
+        if self._positions is not None:
+            # index the stored value, packed heaps may have converted it
+            self.__add_position(self._heap[idx], idx)
+        # swap between parents when needed
+        self._sift_up(idx, is_min_heap)
 
-    # =============================    REMOVE    ==============================
-    def __rebalance(self, parent_idx, is_min_heap):
+    # =============================    UPDATE    ==============================
+    def update(self, old_value, new_value, is_min_heap=True):
         """
-        A private method to rebalance the heap instance after removal.
-        Rebalancing is essential for keeping the heap-order property intact.
+        Replaces one occurrence of `old_value` inside the heap instance with
+        `new_value` and moves it to its right position.
 
         Parameters
         ----------
-        parent_idx: int
-            The Index of the node's parent.
-        is_min_heap: bool
+        old_value: int or float
+            The value to be replaced.
+        new_value: int or float
+            The new numeric value.
+        is_min_heap: (default: True)
             A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
             shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
 
         Raises
         ------
-        AssertionError: This can be raised in the following cases:
-            1. If the `parent_index` is an invalid index.
-            2. If the type of the `is_min_heap` flag isn't boolean
+        ValueError: If the given `new_value` is `None`.
+        TypeError: If the given `new_value` is not a numeric value.
+        UserWarning: If the heap instance is empty of if `old_value` wasn't \
+            found in the instance.
         """
-        assert type(parent_idx) == int and parent_idx >= 0
+        self._validate_item(new_value)
         assert type(is_min_heap) == bool
 
-        last_idx = len(self._heap) - 1
-        while parent_idx < last_idx:
-            parent = self._heap[parent_idx]
-            l_child_idx, r_child_idx = (
-                (parent_idx * 2) + 1, (parent_idx * 2) + 2
+        if self.is_empty():
+            warnings.warn(f"`{self.__name__}` is empty!!", UserWarning)
+            return
+        idx = self._find_idx(old_value)
+        if idx is None:
+            warnings.warn(
+                f"Couldn't find `{old_value}` in `{self.__name__}`",
+                UserWarning
             )
-            # get which child is smaller
-            if r_child_idx >= last_idx:
-                if l_child_idx >= last_idx:
-                    break
-                else:
-                    child_idx = l_child_idx
-            else:
-                if is_min_heap:
-                    if self._heap[l_child_idx] < self._heap[r_child_idx]:
-                        child_idx = l_child_idx
-                    else:
-                        child_idx = r_child_idx
-                else:
-                    if self._heap[l_child_idx] > self._heap[r_child_idx]:
-                        child_idx = l_child_idx
-                    else:
-                        child_idx = r_child_idx
-            child = self._heap[child_idx]
-            if ((is_min_heap and parent > child) or
-                    (not is_min_heap and parent < child)):
-                self._heap[parent_idx], self._heap[child_idx] = (
-                    self._heap[child_idx],
-                    self._heap[parent_idx],
-                )
-                parent_idx = child_idx
-            else:
-                break
+            return
+        stored_value = self._heap[idx]
+        self._heap[idx] = new_value
+        if self._positions is not None:
+            self.__discard_position(stored_value, idx)
+            self.__add_position(self._heap[idx], idx)
+        self._restore(idx, is_min_heap)
+
+    def decrease_key(self, old_value, new_value, is_min_heap=True):
+        """
+        Decreases one occurrence of `old_value` inside the heap instance to
+        `new_value` and moves it to its right position.
+
+        Parameters
+        ----------
+        old_value: int or float
+            The value to be decreased.
+        new_value: int or float
+            The new numeric value which can't be bigger than `old_value`.
+        is_min_heap: (default: True)
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+
+        Raises
+        ------
+        ValueError: If the given `new_value` is `None` or bigger than the \
+            given `old_value`.
+        TypeError: If the given `new_value` is not a numeric value.
+        UserWarning: If the heap instance is empty of if `old_value` wasn't \
+            found in the instance.
+        """
+        self._validate_item(new_value)
+        if type(old_value) in {int, float} and new_value > old_value:
+            raise ValueError(
+                f"Can't decrease `{old_value}` to a bigger value `{new_value}`"
+            )
+        Heap.update(self, old_value, new_value, is_min_heap)
+
+    # =============================    REMOVE    ==============================
+    def _remove_idx(self, idx, is_min_heap):
+        """
+        Removes the value at the given index from the heap instance by moving
+        the last value into its place and restoring the heap-order property.
+
+        Parameters
+        ----------
+        idx: int
+            The index of the value to be removed.
+        is_min_heap: bool
+            A flag to tell if the heap instance is MinHeap or MaxHeap. `True`
+            shows that the instance is `MinHeap()` and `False` for `MaxHeap()`.
+        """
+        heap = self._heap
+        last_idx = len(heap) - 1
+        del_value = heap[idx]
+        last_value = heap.pop()
+        if self._positions is not None:
+            self.__discard_position(last_value, last_idx)
+        if idx != last_idx:
+            heap[idx] = last_value
+            if self._positions is not None:
+                self.__discard_position(del_value, idx)
+                self.__add_position(last_value, idx)
+            self._restore(idx, is_min_heap)
 
     def remove(self, del_value, is_min_heap=True):
         """
@@ -325,48 +670,30 @@ class Heap(ABC, Extra):
         if self.is_empty():
             warnings.warn(f"`{self.__name__}` is empty!!", UserWarning)
             return
-        elif type(del_value) not in {int, float}:
-            warnings.warn(
-                f"Couldn't find `{del_value}` in `{self.__name__}`",
-                UserWarning
-            )
-            return
-        try:
-            del_idx = self._heap.index(del_value)
-        except ValueError:
+        del_idx = self._find_idx(del_value)
+        if del_idx is None:
             # del_value wasn't found in the heap
             warnings.warn(
                 f"Couldn't find `{del_value}` in `{self.__name__}`",
                 UserWarning
             )
             return
-        last_idx = len(self._heap) - 1
-        # swap between removed item and last item
-        self._heap[last_idx], self._heap[del_idx] = (
-            self._heap[del_idx],
-            self._heap[last_idx],
-        )
-        # set last item to -inf or inf based on heap type
-        self._heap[last_idx] = float("-inf") if is_min_heap else float("inf")
-        # start swapping when needed
-        self.__rebalance(del_idx, is_min_heap)
-        # remove the (+/-)inf
-        self._heap.pop()
+        self._remove_idx(del_idx, is_min_heap)
 
     # =============================     ITER     ==============================
     def __iter__(self):
         """
         Iterates over the heap instance and returns a generator of the heap
-        node values in breadth-first manner.
+        node values in breadth-first manner, which is the order of the
+        list-shaped heap.
 
         Returns
         -------
         generator:
             The value of each node in the instance.
         """
-        btree = self._transform()
-        for node in btree:
-            yield node
+        for value in self._heap:
+            yield value
 
     def to_list(self):
         """
@@ -377,12 +704,58 @@ class Heap(ABC, Extra):
         -------
         list:
             A `list` object containing the same elements as the heap instance.
+            Packed heaps return a new `list` of their values.
         """
+        if self._typecode is not None:
+            return self._heap.tolist()
         return self._heap
 
+    # =============================    BUFFER    ==============================
+    def get_buffer(self):
+        """
+        Exposes the values of a packed heap instance through the buffer
+        protocol without copying them. The values are ordered the same way as
+        `to_list()`.
+
+        Returns
+        -------
+        memoryview:
+            A read-only view over the `array.array` holding the heap values.
+
+        Raises
+        ------
+        TypeError: If the heap instance wasn't created with a `typecode`.
+
+        Note
+        ----
+        The heap can't grow or shrink while the view is alive, `insert()` and
+        the removal methods will raise `BufferError` till the view is
+        released. Before Python 3.8, a writable buffer can't be viewed as
+        read-only. So, the returned view is a read-only snapshot of the values
+        which is copied in O(n) and doesn't lock the heap.
+        """
+        if self._typecode is None:
+            raise TypeError(
+                f"Only `{self.__name__}` created with a `typecode` exposes "
+                + "a buffer!!"
+            )
+        elif hasattr(memoryview, "toreadonly"):
+            return memoryview(self._heap).toreadonly()
+        # NOTE: `memoryview.toreadonly()` was added in Python 3.8
+        return memoryview(self._heap.tobytes()).cast(self._typecode)
+
+    def __buffer__(self, flags):
+        """
+        Implements the buffer protocol (Python 3.12+) for packed heap
+        instances, so `memoryview(heap)` works just like `get_buffer()`.
+        """
+        return self.get_buffer()
+
     # =============================    CLEAR     ==============================
     def clear(self):
         """
         Removes all nodes within the heap instance in constant time.
         """
-        self.__init__()
+        self.__init__(
+            indexed=self._positions is not None, typecode=self._typecode
+        )
@@ -248,6 +248,50 @@ class AVL(BST):
         """
         super().__init__(iterable)
 
+    @classmethod
+    def from_sorted(cls, iterable):
+        """
+        A class method which bulk-loads a balanced `AVL()` instance out of
+        sorted values in time-complexity of O(n) where **n** is the number of
+        elements inside the given `iterable`. No rotation is needed and the
+        height of each node is set while building the tree bottom-up.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method.
+            For example, `list` and `tuple` are both iterables.
+
+        Returns
+        -------
+        AVL():
+            A balanced `AVL()` instance holding the given values.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in two cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is NOT a number.
+        ValueError:
+            If one of the iterable elements is `None`.
+        UserWarning:
+            For each duplicated value which gets ignored.
+
+        Example
+        -------
+        >>> avl = AVL.from_sorted([1, 2, 3, 4, 5, 6, 7])
+        >>> avl
+            __4__
+           /     \\
+          2       6
+         / \\     / \\
+        1   3   5   7
+
+        Unsorted values are sorted first in time-complexity of O(n log(n)).
+        """
+        return super().from_sorted(iterable)
+
     # =============================    LENGTH    ==============================
     def __len__(self):
         """
@@ -714,7 +758,8 @@ class AVL(BST):
         parent = start_node.get_parent()
         grand_parent = start_node.get_grand_parent()
         while grand_parent is not None and grand_parent.is_balanced():
-            return self._get_unbalanced_node(parent)
+            child, parent = parent, grand_parent
+            grand_parent = grand_parent.get_parent()
         return grand_parent, parent, child
 
     def _rebalance(self, start_node):
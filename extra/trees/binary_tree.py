@@ -131,7 +131,8 @@ class BinaryTreeNode(TreeNode):
         """
         super().__init__(value)
         self._left = self._right = None
-        del self._children
+        del self._parent, self._children
+        del self._subtree_size, self._subtree_height
 
     def get_data(self):
         """
@@ -358,6 +358,113 @@ class BST(BinaryTree):
             for item in iterable:
                 self.insert(item)
 
+    @classmethod
+    def _build_balanced_subtree(cls, keys, start, end):
+        """
+        Builds a height-balanced subtree out of the sorted unique `keys` lying
+        between the `start` (inclusive) and the `end` (exclusive) indices. The
+        middle key becomes the root of the subtree.
+
+        Parameters
+        ----------
+        keys: list
+            A sorted list of unique numeric values.
+        start: int
+            The index of the first key in the subtree.
+        end: int
+            The index after the last key in the subtree.
+
+        Returns
+        -------
+        BSTNode() or None:
+            The root of the new subtree or `None` if the range is empty.
+        """
+        if start >= end:
+            return None
+        mid = (start + end) // 2
+        node = cls._basic_node(keys[mid])
+        # children are built first, so nodes like `AVLNode()` get their
+        # heights right when the children are set
+        node.set_left(cls._build_balanced_subtree(keys, start, mid))
+        node.set_right(cls._build_balanced_subtree(keys, mid + 1, end))
+        return node
+
+    @classmethod
+    def from_sorted(cls, iterable):
+        """
+        A class method which bulk-loads a height-balanced `BST()` instance out
+        of sorted values in time-complexity of O(n) where **n** is the number
+        of elements inside the given `iterable`. The values are validated and
+        checked to be sorted in one pass, then the middle value of each range
+        becomes the root of its subtree.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method.
+            For example, `list` and `tuple` are both iterables.
+
+        Returns
+        -------
+        BST():
+            A balanced `BST()` instance holding the given values.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in two cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is NOT a number.
+        ValueError:
+            If one of the iterable elements is `None`.
+        UserWarning:
+            For each duplicated value which gets ignored the same way as
+            `insert()` does.
+
+        Example
+        -------
+        >>> BST.from_sorted([1, 2, 3, 4, 5, 6, 7])
+            __4__
+           /     \\
+          2       6
+         / \\     / \\
+        1   3   5   7
+
+        Unsorted values are sorted first in time-complexity of O(n log(n))
+
+        >>> BST.from_sorted([3, 1, 2])
+          2
+         / \\
+        1   3
+        """
+        if not hasattr(iterable, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        tree = cls()
+        values = list(iterable)
+        numeric_types = {int, float}
+        is_sorted = True
+        for idx, item in enumerate(values):
+            if type(item) not in numeric_types:
+                # let the validator raise the proper error
+                tree._validate_item(item)
+            if is_sorted and idx > 0 and item < values[idx - 1]:
+                is_sorted = False
+        if not is_sorted:
+            values.sort()
+        # drop duplicates
+        keys = []
+        for item in values:
+            if keys and item == keys[-1]:
+                warnings.warn(
+                    f"`{item}` already exists in `{tree.__name__}`",
+                    UserWarning
+                )
+            else:
+                keys.append(item)
+        tree._root = cls._build_balanced_subtree(keys, 0, len(keys))
+        tree._length = len(keys)
+        return tree
+
     def _validate_item(self, item):
         """
         Makes sure the input variable type can be processed. The main use for
@@ -452,10 +559,10 @@ class BST(BinaryTree):
         assert isinstance(start_node, self._basic_node)
 
         # get the right-most node
-        if start_node.get_right() is None:
-            return start_node
-        else:
-            return self._get_max_node(start_node.get_right())
+        max_node = start_node
+        while max_node.get_right() is not None:
+            max_node = max_node.get_right()
+        return max_node
 
     def get_max(self):
         """
@@ -521,10 +628,10 @@ class BST(BinaryTree):
         assert isinstance(start_node, self._basic_node)
 
         # get the left-most node
-        if start_node.get_left() is None:
-            return start_node
-        else:
-            return self._get_min_node(start_node.get_left())
+        min_node = start_node
+        while min_node.get_left() is not None:
+            min_node = min_node.get_left()
+        return min_node
 
     def get_min(self):
         """
@@ -609,18 +716,20 @@ class BST(BinaryTree):
         assert isinstance(start_node, self._basic_node)
         assert type(find_val) in {float, int}
 
-        if find_val == start_node.get_data():
-            return start_node
-        elif find_val < start_node.get_data():
-            if start_node.get_left():
-                return self._search(find_val, start_node.get_left())
+        # walk down the tree instead of recursing, so degenerate trees don't
+        # hit the recursion limit
+        curr_node = start_node
+        while True:
+            curr_value = curr_node.get_data()
+            if find_val == curr_value:
+                return curr_node
+            elif find_val < curr_value:
+                next_node = curr_node.get_left()
             else:
-                return start_node
-        else:
-            if start_node.get_right():
-                return self._search(find_val, start_node.get_right())
-            else:
-                return start_node
+                next_node = curr_node.get_right()
+            if next_node is None:
+                return curr_node
+            curr_node = next_node
 
     def __contains__(self, find_val):
         """
@@ -692,25 +801,19 @@ class BST(BinaryTree):
         )
 
         value = inserted_node.get_data()
-        if value == start_node.get_data():
+        # the last accessed node is either the duplicate or the new parent
+        parent = self._search(value, start_node)
+        if value == parent.get_data():
             warnings.warn(
                 f"`{value}` already exists in `{self.__name__}`", UserWarning
             )
-            return start_node
-        elif value < start_node.get_data():
-            if start_node.get_left():
-                return self._insert_node(start_node.get_left(), inserted_node)
-            else:
-                start_node.set_left(inserted_node)
-                self._length += 1
-                return inserted_node
+            return parent
+        elif value < parent.get_data():
+            parent.set_left(inserted_node)
         else:
-            if start_node.get_right():
-                return self._insert_node(start_node.get_right(), inserted_node)
-            else:
-                start_node.set_right(inserted_node)
-                self._length += 1
-                return inserted_node
+            parent.set_right(inserted_node)
+        self._length += 1
+        return inserted_node
 
     def _insert_value(self, start_node, value):
         """
@@ -883,23 +986,20 @@ class BST(BinaryTree):
         assert isinstance(node, self._basic_node)
         assert replacement is None or isinstance(replacement, self._basic_node)
 
-        # replace 'node' with 'replacement'
-        if replacement is None:
-            parent = node.get_parent()
-            if parent.get_left() == node:
-                parent.set_left(replacement)
-            else:
-                parent.set_right(replacement)
-        else:
-            if replacement.is_leaf():
-                new_replacement = None
-            elif replacement.get_left():
-                new_replacement = replacement.get_left()
-            else:
-                new_replacement = replacement.get_right()
+        # push the data of 'node' down the chain of replacements
+        while replacement is not None:
+            # the in-order neighbor of the replacement keeps the binary-search
+            # order, unlike any of its children
+            new_replacement = self._find_replacement(replacement)
             # swap data
             self._basic_node.swap(node, replacement)
-            self._transplant(replacement, new_replacement)
+            node, replacement = replacement, new_replacement
+        # then cut the last node off
+        parent = node.get_parent()
+        if parent.get_left() == node:
+            parent.set_left(None)
+        else:
+            parent.set_right(None)
 
     def _remove(self, del_value, start_node):
         """
@@ -0,0 +1,726 @@
+"""
+A frozen trie is an immutable and compact representation of a trie or a radix
+trie. Instead of a Python object per node holding a dictionary of children, all
+nodes are laid out in breadth-first order inside one contiguous buffer, so the
+children of every node occupy a contiguous range of nodes sorted by their
+labels. Each node is described by just a few numbers:
+
+- the index of its first child.
+- the offset of its label inside the concatenated labels.
+- the score of the word ending at it, if any.
+- the best score of all words found within its subtree.
+- the first byte of its label, used to find children using binary search.
+
+The following is the frozen trie of the three words: "car", "cart", and
+"cast":
+
+.. code-block:: text
+
+    node         0   1   2   3   4   5   6
+    label      ROOT  c   a   r   s   t   t
+    first child  1   2   3   5   6   7   7
+    word             ✗   ✗   ✓   ✗   ✓   ✓
+
+A frozen trie answers the same queries as the trie it was created from while
+taking a small fraction of its memory. Looking up a child is done using binary
+search over the sorted children of a node and labels are stored as UTF-8 bytes.
+"""
+import heapq
+import math
+import mmap
+from array import array
+from bisect import bisect_left, bisect_right
+
+from extra.interface import Extra
+
+
+# the header is the magic bytes, which include the byte order of the machine
+# that created the frozen trie, followed by the number of nodes, the length of
+# the labels in bytes and the number of words.
+BYTE_ORDER = b"L" if array("q", [1]).tobytes()[0] else b"B"
+MAGIC = b"EXTRIE" + BYTE_ORDER + b"1"
+HEADER_SIZE = len(MAGIC) + 3 * 8
+
+
+class FrozenTrie(Extra):
+    """
+    A frozen trie is an immutable and compact representation of a `Trie()` or
+    a `RadixTrie()` that supports the same queries: searching for words and
+    prefixes and auto-completing prefixes.
+    """
+
+    __name__ = "extra.FrozenTrie()"
+
+    def __init__(self, buffer):
+        """
+        Creates a `FrozenTrie()` object from the given buffer, which is the
+        output of `FrozenTrie.to_bytes()`. Frozen tries are usually created by
+        calling `Trie.freeze()` or `RadixTrie.freeze()`.
+
+        Parameters
+        ----------
+        buffer: bytes
+            A bytes-like object holding a frozen trie.
+
+        Raises
+        ------
+        TypeError:
+            If the given `buffer` isn't a bytes-like object.
+        ValueError:
+            If the given `buffer` doesn't hold a valid frozen trie.
+
+        Example
+        -------
+        >>> t = Trie()
+        >>> t.insert("car")
+        >>> ft = FrozenTrie(t.freeze().to_bytes())
+        >>> ft
+        extra.FrozenTrie(1 words)
+        """
+        try:
+            view = memoryview(buffer)
+        except TypeError:
+            raise TypeError("The given buffer isn't a bytes-like object!!")
+        magic = view[: len(MAGIC)].tobytes()
+        if (
+            len(view) < HEADER_SIZE
+            or magic[:6] != MAGIC[:6]
+            or magic[7:] != MAGIC[7:]
+        ):
+            raise ValueError("The given buffer isn't a valid frozen trie!!")
+        elif magic != MAGIC:
+            raise ValueError(
+                "The given frozen trie was created on a machine with a "
+                + "different byte order!!"
+            )
+        num_nodes, labels_size, num_words = view[
+            len(MAGIC): HEADER_SIZE
+        ].cast("q")
+        if len(view) != HEADER_SIZE + 33 * num_nodes + 16 + labels_size:
+            raise ValueError("The given buffer isn't a valid frozen trie!!")
+        offset = HEADER_SIZE
+        sections = []
+        for fmt, size in [
+            ("q", num_nodes + 1),
+            ("q", num_nodes + 1),
+            ("d", num_nodes),
+            ("d", num_nodes),
+        ]:
+            sections.append(view[offset: offset + size * 8].cast(fmt))
+            offset += size * 8
+        self._first_bytes = view[offset: offset + num_nodes]
+        offset += num_nodes
+        self._buffer = buffer
+        self._num_words = num_words
+        (
+            self._child_starts,
+            self._label_offsets,
+            self._scores,
+            self._best_scores,
+        ) = sections
+        self._labels_start = offset
+
+    @classmethod
+    def _from_root(cls, root):
+        """
+        Creates a `FrozenTrie()` object out of the `TrieNode()` objects found
+        within the subtree rooted at the given node.
+
+        Parameters
+        ----------
+        root: TrieNode()
+            The root of a `Trie()` or a `RadixTrie()`.
+
+        Returns
+        -------
+        FrozenTrie():
+            The frozen version of the given trie.
+        """
+        nan = float("nan")
+        child_starts = array("q")
+        label_offsets = array("q", [0])
+        scores = array("d")
+        best_scores = array("d")
+        first_bytes = bytearray()
+        labels = []
+        num_words = 0
+        nodes = [root]
+        for node in nodes:
+            label = node._data.encode("utf-8") if node is not root else b""
+            labels.append(label)
+            first_bytes.append(label[0] if label else 0)
+            label_offsets.append(label_offsets[-1] + len(label))
+            if node._is_word and node is not root:
+                num_words += 1
+                scores.append(node._score if node._score is not None else 0)
+            else:
+                scores.append(nan)
+            best_scores.append(
+                node._best_score if node._best_score is not None else nan
+            )
+            child_starts.append(len(nodes))
+            children = node._children
+            nodes.extend(children[ch] for ch in sorted(children))
+        child_starts.append(len(nodes))
+        labels = b"".join(labels)
+        header = array("q", [len(nodes), len(labels), num_words])
+        return cls(
+            b"".join(
+                [
+                    MAGIC,
+                    header.tobytes(),
+                    child_starts.tobytes(),
+                    label_offsets.tobytes(),
+                    scores.tobytes(),
+                    best_scores.tobytes(),
+                    first_bytes,
+                    labels,
+                ]
+            )
+        )
+
+    def to_bytes(self):
+        """
+        Serializes the `FrozenTrie()` instance, which can be loaded back by
+        passing the output to the `FrozenTrie()` constructor.
+
+        Returns
+        -------
+        bytes:
+            The bytes representing the `FrozenTrie()` instance.
+
+        Example
+        -------
+        >>> t = Trie()
+        >>> t.insert("car")
+        >>> ft = t.freeze()
+        >>> len(ft.to_bytes())
+        183
+        """
+        return bytes(self._buffer)
+
+    def save(self, path):
+        """
+        Writes the `FrozenTrie()` instance to the given file, which can be
+        opened later using `FrozenTrie.load()`.
+
+        Parameters
+        ----------
+        path: str
+            The path of the file to be written.
+
+        Example
+        -------
+        >>> rt = RadixTrie()
+        >>> rt.insert("car")
+        >>> rt.insert("cart")
+        >>> rt.freeze().save("words.trie")
+        """
+        with open(path, "wb") as fout:
+            fout.write(self._buffer)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Opens a `FrozenTrie()` written using `FrozenTrie.save()` by
+        memory-mapping the given file instead of reading it. So, loading takes
+        constant time no matter how big the file is, all queries run directly
+        against the mapped bytes and all processes loading the same file share
+        the same copy of it within the page cache.
+
+        Parameters
+        ----------
+        path: str
+            The path of the file to be opened.
+
+        Returns
+        -------
+        FrozenTrie():
+            The frozen trie stored within the given file.
+
+        Raises
+        ------
+        ValueError:
+            If the given file doesn't hold a valid frozen trie.
+
+        Example
+        -------
+        >>> rt = RadixTrie()
+        >>> rt.insert("car")
+        >>> rt.insert("cart")
+        >>> rt.freeze().save("words.trie")
+        >>> ft = FrozenTrie.load("words.trie")
+        >>> ft.auto_complete("ca")
+        ['car', 'cart']
+        """
+        with open(path, "rb") as fin:
+            # empty files can't be mapped
+            if not fin.read(1):
+                raise ValueError("The given file isn't a valid frozen trie!!")
+            buffer = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer)
+
+    # =============================    LENGTH    ==============================
+    def __len__(self):
+        """
+        Gets the length of the `FrozenTrie()` instance in constant time, which
+        is the number of nodes including the root just like the trie it was
+        created from.
+
+        Returns
+        -------
+        int:
+            The length of the `FrozenTrie()` instance.
+
+        Example
+        -------
+        >>> t = Trie()
+        >>> t.insert("car")
+        >>> t.insert("cart")
+        >>> t.insert("cast")
+        >>> len(t.freeze())
+        7
+        """
+        return len(self._scores)
+
+    def is_empty(self):
+        """
+        Checks if the `FrozenTrie()` instance has no words.
+
+        Returns
+        -------
+        bool:
+            `True` if the `FrozenTrie()` instance is empty and `False`
+            otherwise.
+
+        Example
+        -------
+        >>> Trie().freeze().is_empty()
+        True
+        """
+        return self._num_words == 0
+
+    def count_words(self):
+        """
+        Counts the words stored within the `FrozenTrie()` instance in constant
+        time.
+
+        Returns
+        -------
+        int:
+            The number of words within the `FrozenTrie()` instance.
+
+        Example
+        -------
+        >>> t = Trie()
+        >>> t.insert("car")
+        >>> t.insert("cart")
+        >>> t.freeze().count_words()
+        2
+        """
+        return self._num_words
+
+    def __repr__(self):
+        """
+        Represents the `FrozenTrie()` instance as a string.
+
+        Returns
+        -------
+        str:
+            A string representing the `FrozenTrie()` instance.
+
+        Example
+        -------
+        >>> t = Trie()
+        >>> t.insert("car")
+        >>> t.insert("cart")
+        >>> t.freeze()
+        extra.FrozenTrie(2 words)
+        """
+        return f"extra.FrozenTrie({self._num_words} words)"
+
+    # =============================     FIND     ==============================
+    def _get_label(self, node):
+        """
+        Returns the label of the given node as UTF-8 bytes.
+        """
+        return self._buffer[
+            self._labels_start + self._label_offsets[node]:
+            self._labels_start + self._label_offsets[node + 1]
+        ]
+
+    def _get_child(self, node, word, idx):
+        """
+        Searches the children of the given node for the one whose label starts
+        with the character found at the given index of the given word.
+
+        Parameters
+        ----------
+        node: int
+            The index of the parent node.
+        word: bytes
+            A UTF-8 encoded word.
+        idx: int
+            The index of the character's first byte in the given `word`.
+
+        Returns
+        -------
+        int:
+            The index of the found child or -1 if it wasn't found.
+        """
+        lead = word[idx]
+        child_starts = self._child_starts
+        # children are sorted by their labels, so the ones whose labels start
+        # with the same byte are next to each other.
+        lo = bisect_left(
+            self._first_bytes, lead, child_starts[node], child_starts[node + 1]
+        )
+        hi = bisect_right(
+            self._first_bytes, lead, lo, child_starts[node + 1]
+        )
+        if hi - lo == 1 and lead < 0x80:
+            return lo
+        # multi-byte characters may share their first byte, so compare the
+        # whole character whose width is known from its first byte.
+        width = 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+        key = word[idx: idx + width]
+        for child in range(lo, hi):
+            start = self._labels_start + self._label_offsets[child]
+            if self._buffer[start: start + width] == key:
+                return child
+        return -1
+
+    def _follow_path(self, word):
+        """
+        Parses the `FrozenTrie()` instance and returns the last accessed node
+        along side with the index of the first byte of the given word that
+        can't be parsed.
+
+        Parameters
+        ----------
+        word: bytes
+            The UTF-8 encoded word to search for.
+
+        Returns
+        -------
+        int:
+            The index of the last accessed node.
+        int:
+            The number of bytes at the start of the given `word` that were
+            found in the `FrozenTrie()` instance.
+        """
+        curr_node, idx, length = 0, 0, len(word)
+        while idx < length:
+            child = self._get_child(curr_node, word, idx)
+            if child == -1:
+                break
+            label = self._get_label(child)
+            if not word.startswith(label, idx):
+                break
+            idx += len(label)
+            curr_node = child
+        return curr_node, idx
+
+    def _is_word(self, node):
+        """
+        Checks if a word ends at the given node.
+        """
+        return not math.isnan(self._scores[node])
+
+    def __contains__(self, word):
+        """
+        Searches the `FrozenTrie()` for the given `word` and returns `True` if
+        the whole word exists and `False` if not.
+
+        Parameters
+        ----------
+        word: str
+            The word to be searched for.
+
+        Returns
+        -------
+        bool:
+            `True` if the given `word` exists in the `FrozenTrie()` and
+            `False` if not.
+
+        Example
+        -------
+        >>> t = Trie()
+        >>> t.insert("car")
+        >>> t.insert("cart")
+        >>> ft = t.freeze()
+        >>> "car" in ft
+        True
+        >>> "ca" in ft
+        False
+        """
+        if type(word) != str:
+            return False
+        word = word.encode("utf-8")
+        last_node, idx = self._follow_path(word)
+        return idx == len(word) and self._is_word(last_node)
+
+    def has_prefix(self, prefix):
+        """
+        Searches the `FrozenTrie()` for the given `prefix` and returns `True`
+        if the whole prefix exists and `False` if not.
+
+        Parameters
+        ----------
+        prefix: str
+            The prefix to be searched for.
+
+        Returns
+        -------
+        bool:
+            `True` if the given `prefix` exists in the `FrozenTrie()` and
+            `False` if not.
+
+        Example
+        -------
+        >>> t = Trie()
+        >>> t.insert("car")
+        >>> t.insert("cart")
+        >>> ft = t.freeze()
+        >>> ft.has_prefix("ca")
+        True
+        >>> ft.has_prefix("cas")
+        False
+        """
+        if type(prefix) != str:
+            return False
+        return self._find_prefix_node(prefix.encode("utf-8"))[0] != -1
+
+    # ============================= AUTOCOMPLETE ==============================
+    def _validate_prefix(self, prefix):
+        """
+        Makes sure the given prefix can be auto-completed.
+
+        Parameters
+        ----------
+        prefix: str
+            The prefix to be auto-completed.
+
+        Raises
+        ------
+        ValueError:
+            If the given `prefix` is `None`.
+        TypeError:
+            If the type of the given `prefix` is not `str`.
+        """
+        super()._validate_item(prefix)
+        if type(prefix) != str:
+            raise TypeError(
+                f"Can't deal with {type(prefix)} object since "
+                + f"`{self.__name__}` contains only characters!!"
+            )
+
+    def _find_prefix_node(self, prefix):
+        """
+        Finds the node at which the given `prefix` ends. Since a prefix can end
+        in the middle of a node's label, the returned node is the one covering
+        the prefix's last character.
+
+        Parameters
+        ----------
+        prefix: bytes
+            The UTF-8 encoded prefix to search for.
+
+        Returns
+        -------
+        int:
+            The index of the node at which the given `prefix` ends or -1 if no
+            word in the `FrozenTrie()` instance starts with the given
+            `prefix`.
+        bytes:
+            The labels on the path from the root to the returned node.
+        """
+        last_node, idx = self._follow_path(prefix)
+        if idx < len(prefix):
+            child = self._get_child(last_node, prefix, idx)
+            if child == -1:
+                return -1, prefix
+            label = self._get_label(child)
+            if not label.startswith(prefix[idx:]):
+                return -1, prefix
+            return child, prefix[:idx] + label
+        return last_node, prefix
+
+    def _iter_candidates(self, start_node, start_prefix):
+        """
+        A helper method to the iter_complete() method which lazily yields the
+        words found within the subtree rooted at the given node in
+        lexicographic order.
+
+        Parameters
+        ----------
+        start_node: int
+            The index of the node to start iterating from.
+        start_prefix: bytes
+            The labels on the path from the root to the `start_node`.
+
+        Yields
+        ------
+        str:
+            The words found within the subtree rooted at `start_node`.
+        """
+        child_starts = self._child_starts
+        buffer = [start_prefix]
+        # each item is a node and the buffer's length before visiting it
+        stack = [(start_node, 0)]
+        while stack:
+            curr_node, buffer_length = stack.pop()
+            if buffer_length:
+                del buffer[buffer_length:]
+                buffer.append(self._get_label(curr_node))
+            if self._is_word(curr_node):
+                yield b"".join(buffer).decode("utf-8")
+            for child in range(
+                child_starts[curr_node + 1] - 1,
+                child_starts[curr_node] - 1,
+                -1,
+            ):
+                stack.append((child, len(buffer)))
+
+    def _get_top_candidates(self, start_node, start_prefix, k):
+        """
+        A helper method to the auto-complete() method which retrieves the `k`
+        words with the highest scores found within the subtree rooted at the
+        given node using a best-first search ordered by the best score of
+        every node.
+
+        Parameters
+        ----------
+        start_node: int
+            The index of the node to start searching from.
+        start_prefix: bytes
+            The labels on the path from the root to the `start_node`.
+        k: int
+            The number of words to be retrieved.
+
+        Returns
+        -------
+        list:
+            At most `k` words sorted by their scores in descending order. Words
+            with equal scores are sorted alphabetically.
+        """
+        candidates = []
+        scores, best_scores = self._scores, self._best_scores
+        child_starts = self._child_starts
+        if math.isnan(best_scores[start_node]) or k == 0:
+            return candidates
+        heap = [(-best_scores[start_node], start_prefix, 1, start_node)]
+        while heap and len(candidates) < k:
+            _, prefix, is_node, node = heapq.heappop(heap)
+            if not is_node:
+                candidates.append(prefix.decode("utf-8"))
+                continue
+            if self._is_word(node):
+                heapq.heappush(heap, (-scores[node], prefix, 0, node))
+            for child in range(child_starts[node], child_starts[node + 1]):
+                if not math.isnan(best_scores[child]):
+                    heapq.heappush(
+                        heap,
+                        (
+                            -best_scores[child],
+                            prefix + self._get_label(child),
+                            1,
+                            child,
+                        ),
+                    )
+        return candidates
+
+    def auto_complete(self, prefix="", k=None):
+        """
+        Parses the `FrozenTrie()` instance and retrieves all the words that
+        has the given `prefix` in lexicographic order. When `k` is given, only
+        the `k` words with the highest scores are retrieved.
+
+        Parameters
+        ----------
+        prefix: str (default '')
+            A prefix to auto-complete.
+        k: int (default None)
+            The number of completions to be retrieved. `None` retrieves all of
+            them.
+
+        Returns
+        -------
+        list:
+            A list of all found words that have the given `prefix`. When `k`
+            is given, the list has at most `k` words sorted by their scores in
+            descending order.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in two cases
+                1. If the type of the given `prefix` is not `str`.
+                2. If the given `k` isn't an integer.
+        ValueError:
+            If the given `k` is negative.
+
+        Example
+        -------
+        >>> t = Trie()
+        >>> t.insert("car")
+        >>> t.insert("cart", score=3)
+        >>> t.insert("cast", score=5)
+        >>> ft = t.freeze()
+        >>> ft.auto_complete("car")
+        ['car', 'cart']
+        >>> ft.auto_complete()
+        ['car', 'cart', 'cast']
+        >>> ft.auto_complete("ca", k=2)
+        ['cast', 'cart']
+        """
+        self._validate_prefix(prefix)
+        if k is not None:
+            if type(k) != int:
+                raise TypeError("`k` has to be an integer!!")
+            elif k < 0:
+                raise ValueError("`k` can't be a negative number!!")
+        node, prefix = self._find_prefix_node(prefix.encode("utf-8"))
+        if node == -1:
+            return []
+        elif k is not None:
+            return self._get_top_candidates(node, prefix, k)
+        return list(self._iter_candidates(node, prefix))
+
+    def iter_complete(self, prefix=""):
+        """
+        Lazily auto-completes the given `prefix` using all words found in the
+        `FrozenTrie()` instance. Words are yielded one at a time in
+        lexicographic order.
+
+        Parameters
+        ----------
+        prefix: str (default '')
+            A prefix to auto-complete.
+
+        Returns
+        -------
+        generator:
+            A generator yielding all words that have the given `prefix` in
+            lexicographic order.
+
+        Raises
+        ------
+        TypeError:
+            If the given `prefix` isn't a `str`.
+
+        Example
+        -------
+        >>> t = Trie()
+        >>> t.insert("cast")
+        >>> t.insert("car")
+        >>> t.insert("cart")
+        >>> from itertools import islice
+        >>> list(islice(t.freeze().iter_complete(), 2))
+        ['car', 'cart']
+        """
+        self._validate_prefix(prefix)
+        node, prefix = self._find_prefix_node(prefix.encode("utf-8"))
+        if node == -1:
+            return iter(())
+        return self._iter_candidates(node, prefix)
@@ -0,0 +1,577 @@
+"""
+A generalized suffix trie is a suffix trie that indexes a whole collection of
+documents instead of a single string. Every document ends with its own unique
+terminator, so each suffix belongs to exactly one document. This makes it
+possible to search for a substring across all the documents at once and to
+find the longest substrings shared between many documents.
+
+The following is the generalized suffix trie of the two documents "abc" and
+"bc" where `$0` and `$1` are the terminators of the first and second document
+respectively:
+
+.. code-block:: text
+
+    ROOT
+    ├── abc$0
+    ├─┬ bc
+    │ ├── $0
+    │ └── $1
+    ├─┬ c
+    │ ├── $0
+    │ └── $1
+    ├── $0
+    └── $1
+
+It's built incrementally using Ukkonen's algorithm, so adding a document of
+length `m` takes O(m) and the whole structure takes memory proportional to the
+total length of all documents.
+"""
+from array import array
+from bisect import bisect_right
+
+from extra.interface import Extra
+
+
+class GeneralizedSuffixTrie(Extra):
+    """
+    A generalized suffix trie is a suffix trie that indexes a whole collection
+    of documents instead of a single string. Each document is given an integer
+    id, which is the order of its insertion, and every substring can be
+    located by the ids of the documents containing it and its offsets there.
+    """
+
+    __name__ = "extra.GeneralizedSuffixTrie()"
+
+    def __init__(self, iterable=None):
+        """
+        Creates a `GeneralizedSuffixTrie()` object from the given iterable of
+        documents!!
+
+        Parameters
+        ----------
+        iterable: iterable (default: None)
+            An iterable of `str` documents to be added in order.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in two cases
+                1. In case the given object isn't iterable.
+                2. If one of the documents isn't a `str` object.
+        ValueError:
+            If one of the documents is an empty string.
+
+        Example
+        -------
+        >>> gst = GeneralizedSuffixTrie(["banana", "ananas"])
+        >>> gst
+        extra.GeneralizedSuffixTrie(2 documents)
+        """
+        if iterable is not None and not hasattr(iterable, "__iter__"):
+            raise TypeError("The given object isn't iterable!!")
+        # documents are stored as code points followed by a negative
+        # terminator, which is the only way to keep terminators unique.
+        self._text = array("q")
+        self._doc_starts = array("q")
+        # nodes are integer ids where the root is 0
+        self._starts = array("q", [0])
+        self._ends = array("q", [0])
+        self._links = array("q", [0])
+        self._parents = array("q", [0])
+        self._str_depths = array("q", [0])
+        # `None` for leaf nodes, whose edges last till the end of the text
+        self._children = [{}]
+        # Ukkonen's active point
+        self._active_node = self._active_edge = self._active_length = 0
+        if iterable is not None:
+            for doc in iterable:
+                self.add(doc)
+
+    def _add_node(self, start, end, parent, str_depth, children):
+        """
+        Appends a new node to the arrays describing the nodes.
+
+        Parameters
+        ----------
+        start: int
+            The start offset of the node's edge label in the text.
+        end: int
+            The end offset of the node's edge label in the text, or -1 for
+            leaf nodes.
+        parent: int
+            The id of the parent node.
+        str_depth: int
+            The length of the string between the root and the node.
+        children: dict or None
+            The children of the node, or `None` for leaf nodes.
+
+        Returns
+        -------
+        int:
+            The id of the new node.
+        """
+        self._starts.append(start)
+        self._ends.append(end)
+        self._links.append(0)
+        self._parents.append(parent)
+        self._str_depths.append(str_depth)
+        self._children.append(children)
+        return len(self._starts) - 1
+
+    # =============================      ADD     ==============================
+    def add(self, doc):
+        """
+        Adds the given document to the `GeneralizedSuffixTrie()` in linear
+        time using Ukkonen's algorithm.
+
+        Parameters
+        ----------
+        doc: str
+            The document to be added.
+
+        Returns
+        -------
+        int:
+            The id of the added document.
+
+        Raises
+        ------
+        TypeError:
+            If the given document isn't a `str` object.
+        ValueError:
+            If the given document is an empty string.
+
+        Example
+        -------
+        >>> gst = GeneralizedSuffixTrie()
+        >>> gst.add("banana")
+        0
+        >>> gst.add("ananas")
+        1
+        """
+        super()._validate_item(doc)
+        if type(doc) != str:
+            raise TypeError(
+                f"Can't add {type(doc)} into `{self.__name__}`!!"
+            )
+        elif len(doc) == 0:
+            raise ValueError(
+                f"An empty string can't be added to `{self.__name__}`!!"
+            )
+        doc_id = len(self._doc_starts)
+        self._doc_starts.append(len(self._text))
+        self._text.extend(map(ord, doc))
+        self._text.append(-1 - doc_id)
+
+        text, starts, ends = self._text, self._starts, self._ends
+        links, children = self._links, self._children
+        active_node = self._active_node
+        active_edge = self._active_edge
+        active_length = self._active_length
+        # all suffixes of the previous documents were made explicit by their
+        # terminators, so nothing remains from them
+        remainder = 0
+        for i in range(self._doc_starts[doc_id], len(text)):
+            ch = text[i]
+            remainder += 1
+            last_new_node = 0
+            while remainder > 0:
+                if active_length == 0:
+                    active_edge = i
+                edge_ch = text[active_edge]
+                next_node = children[active_node].get(edge_ch)
+                if next_node is None:
+                    children[active_node][edge_ch] = self._add_node(
+                        i, -1, active_node, 0, None
+                    )
+                    if last_new_node:
+                        links[last_new_node] = active_node
+                        last_new_node = 0
+                else:
+                    end = i + 1 if ends[next_node] < 0 else ends[next_node]
+                    edge_length = end - starts[next_node]
+                    if active_length >= edge_length:
+                        # walk down to the next node
+                        active_edge += edge_length
+                        active_length -= edge_length
+                        active_node = next_node
+                        continue
+                    if text[starts[next_node] + active_length] == ch:
+                        # the suffix is already there, this phase is over
+                        if last_new_node and active_node:
+                            links[last_new_node] = active_node
+                            last_new_node = 0
+                        active_length += 1
+                        break
+                    # split the edge by a new internal node
+                    split_node = self._add_node(
+                        starts[next_node],
+                        starts[next_node] + active_length,
+                        active_node,
+                        self._str_depths[active_node] + active_length,
+                        {},
+                    )
+                    children[active_node][edge_ch] = split_node
+                    children[split_node][ch] = self._add_node(
+                        i, -1, split_node, 0, None
+                    )
+                    starts[next_node] += active_length
+                    children[split_node][text[starts[next_node]]] = next_node
+                    self._parents[next_node] = split_node
+                    if last_new_node:
+                        links[last_new_node] = split_node
+                    last_new_node = split_node
+                remainder -= 1
+                if active_node == 0 and active_length > 0:
+                    active_length -= 1
+                    active_edge = i - remainder + 1
+                elif active_node != 0:
+                    active_node = links[active_node]
+        self._active_node = active_node
+        self._active_edge = active_edge
+        self._active_length = active_length
+        return doc_id
+
+    # =============================    LENGTH    ==============================
+    def __len__(self):
+        """
+        Gets the number of documents in the `GeneralizedSuffixTrie()` instance.
+
+        Returns
+        -------
+        int:
+            The number of documents in the instance.
+
+        Example
+        -------
+        >>> gst = GeneralizedSuffixTrie(["banana", "ananas"])
+        >>> len(gst)
+        2
+        """
+        return len(self._doc_starts)
+
+    def is_empty(self):
+        """
+        Checks if the `GeneralizedSuffixTrie()` instance has no documents.
+
+        Returns
+        -------
+        bool:
+            `True` if the instance has no documents and `False` otherwise.
+
+        Example
+        -------
+        >>> gst = GeneralizedSuffixTrie()
+        >>> gst.is_empty()
+        True
+        >>> gst.add("banana")
+        0
+        >>> gst.is_empty()
+        False
+        """
+        return len(self) == 0
+
+    # =============================     PRINT    ==============================
+    def __repr__(self):
+        """
+        Represents the `GeneralizedSuffixTrie()` instance as a string.
+
+        Returns
+        -------
+        str:
+            The string-representation of the `GeneralizedSuffixTrie()`.
+
+        Example
+        -------
+        >>> GeneralizedSuffixTrie(["banana", "ananas"])
+        extra.GeneralizedSuffixTrie(2 documents)
+        """
+        return f"extra.GeneralizedSuffixTrie({len(self)} documents)"
+
+    # =============================     FIND     ==============================
+    def _follow_path(self, pattern):
+        """
+        Follows the edges matching the given `pattern` in O(m) where `m` is
+        the pattern's length.
+
+        Parameters
+        ----------
+        pattern: str
+            The substring to look for.
+
+        Returns
+        -------
+        int or None:
+            The id of the highest node whose path starts with the given
+            `pattern`, or `None` if the pattern doesn't exist.
+        """
+        codes = array("q", map(ord, pattern))
+        text, node, idx = self._text, 0, 0
+        while idx < len(codes):
+            node = self._children[node].get(codes[idx])
+            if node is None:
+                return None
+            start, end = self._starts[node], self._ends[node]
+            if end < 0:
+                end = len(text)
+            length = min(end - start, len(codes) - idx)
+            if text[start: start + length] != codes[idx: idx + length]:
+                return None
+            idx += length
+        return node
+
+    def _iter_leaves(self, node):
+        """
+        Iterates over the leaf nodes of the subtree rooted at the given node.
+
+        Parameters
+        ----------
+        node: int
+            The id of the subtree's root.
+
+        Yields
+        ------
+        int:
+            The id of each leaf node in the subtree.
+        """
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if self._children[node] is None:
+                yield node
+            else:
+                stack.extend(self._children[node].values())
+
+    def _get_suffix_start(self, leaf):
+        """
+        Gets the offset, in the whole text, of the suffix represented by the
+        given leaf node.
+
+        Parameters
+        ----------
+        leaf: int
+            The id of a leaf node.
+
+        Returns
+        -------
+        int:
+            The start offset of the leaf's suffix.
+        """
+        return self._starts[leaf] - self._str_depths[self._parents[leaf]]
+
+    def has_substring(self, substr):
+        """
+        Searches the `GeneralizedSuffixTrie()` for the given substring in O(m)
+        where `m` is the substring's length.
+
+        Parameters
+        ----------
+        substr: str
+            The substring to be searched for.
+
+        Returns
+        -------
+        bool:
+            `True` if the substring exists in any document and `False` if not.
+
+        Example
+        -------
+        >>> gst = GeneralizedSuffixTrie(["banana", "ananas"])
+        >>> gst.has_substring("nas")
+        True
+        >>> gst.has_substring("nab")
+        False
+        """
+        if type(substr) != str:
+            return False
+        return self._follow_path(substr) is not None
+
+    def count_pattern_occurrences(self, pattern):
+        """
+        Counts the number of times the given pattern appears in all the
+        documents of the `GeneralizedSuffixTrie()`.
+
+        Parameters
+        ----------
+        pattern: str
+            The pattern to find its number of occurrences.
+
+        Returns
+        -------
+        int:
+            The number of occurrences of the pattern.
+
+        Example
+        -------
+        >>> gst = GeneralizedSuffixTrie(["banana", "ananas"])
+        >>> gst.count_pattern_occurrences("ana")
+        4
+        >>> gst.count_pattern_occurrences("bann")
+        0
+        """
+        if type(pattern) != str or not pattern:
+            return 0
+        node = self._follow_path(pattern)
+        if node is None:
+            return 0
+        return sum(1 for _ in self._iter_leaves(node))
+
+    def get_occurrences(self, pattern):
+        """
+        Finds all the occurrences of the given pattern in the documents of the
+        `GeneralizedSuffixTrie()`.
+
+        Parameters
+        ----------
+        pattern: str
+            The pattern to be located.
+
+        Returns
+        -------
+        list:
+            A sorted list of `(doc_id, offset)` tuples where `doc_id` is the
+            id of the document containing the pattern and `offset` is where it
+            starts in that document.
+
+        Example
+        -------
+        >>> gst = GeneralizedSuffixTrie(["banana", "ananas"])
+        >>> gst.get_occurrences("ana")
+        [(0, 1), (0, 3), (1, 0), (1, 2)]
+        >>> gst.get_occurrences("bann")
+        []
+        """
+        if type(pattern) != str or not pattern:
+            return []
+        node = self._follow_path(pattern)
+        if node is None:
+            return []
+        occurrences = []
+        for leaf in self._iter_leaves(node):
+            start = self._get_suffix_start(leaf)
+            doc_id = bisect_right(self._doc_starts, start) - 1
+            occurrences.append((doc_id, start - self._doc_starts[doc_id]))
+        return sorted(occurrences)
+
+    # =============================      LCS     ==============================
+    def get_longest_common_substring(self, k=None):
+        """
+        Gets the longest common substring(s) shared by at least `k` of the
+        documents in the `GeneralizedSuffixTrie()`. The documents found below
+        each node are gathered by merging the smaller sets into the bigger
+        ones, which takes O(nlog(n)) where `n` is the total length of all
+        documents. A node stops gathering once it reaches `k` documents.
+
+        Parameters
+        ----------
+        k: int (default: None)
+            The minimum number of documents that should share the substring.
+            By default, it has to be shared by all the documents.
+
+        Returns
+        -------
+        list:
+            A list of the longest common substring(s). It's `[""]` when no
+            substring is shared by `k` documents.
+
+        Raises
+        ------
+        TypeError:
+            If `k` isn't an integer.
+        ValueError:
+            If `k` isn't between 1 and the number of documents.
+
+        Example
+        -------
+        >>> gst = GeneralizedSuffixTrie(["banana", "ananas", "cabana"])
+        >>> gst.get_longest_common_substring()
+        ['ana']
+        >>> gst.get_longest_common_substring(k=2)
+        ['anana']
+        """
+        if self.is_empty():
+            return []
+        elif k is None:
+            k = len(self)
+        elif type(k) != int:
+            raise TypeError("`k` has to be an integer value!!")
+        elif not 1 <= k <= len(self):
+            raise ValueError(f"`k` has to be between 1 and {len(self)}!!")
+        doc_starts = self._doc_starts
+        doc_ends = doc_starts[1:] + array("q", [len(self._text)])
+        if k == 1:
+            # substrings of a single document end at leaves, so the longest
+            # ones are just the longest documents
+            longest_length = max(
+                end - start - 1 for start, end in zip(doc_starts, doc_ends)
+            )
+            return list({
+                "".join(map(chr, self._text[start: end - 1]))
+                for start, end in zip(doc_starts, doc_ends)
+                if end - start - 1 == longest_length
+            })
+        children, str_depths = self._children, self._str_depths
+        starts, parents = self._starts, self._parents
+        # the id of the document owning each offset of the text
+        doc_ids_of = array("q")
+        for doc_id, (start, end) in enumerate(zip(doc_starts, doc_ends)):
+            doc_ids_of.extend(array("q", [doc_id]) * (end - start))
+        # children come after their parents in this order
+        order = [0]
+        for node in order:
+            if children[node] is not None:
+                order.extend(children[node].values())
+        longest_length, lcs_nodes = 0, []
+        # the set of documents below each node, or `True` once it reaches `k`
+        # documents since all of its ancestors will reach `k` as well
+        docs = {}
+        for node in reversed(order):
+            parent = parents[node]
+            if children[node] is None:
+                doc_id = doc_ids_of[starts[node] - str_depths[parent]]
+                parent_doc_ids = docs.get(parent)
+                if parent_doc_ids is None:
+                    docs[parent] = {doc_id}
+                elif parent_doc_ids is not True:
+                    parent_doc_ids.add(doc_id)
+                continue
+            doc_ids = docs.pop(node)
+            if doc_ids is not True and len(doc_ids) >= k:
+                doc_ids = True
+            if doc_ids is True and str_depths[node] >= longest_length:
+                if str_depths[node] > longest_length:
+                    longest_length, lcs_nodes = str_depths[node], []
+                lcs_nodes.append(node)
+            if node:
+                # merge the smaller set into the bigger one
+                parent_doc_ids = docs.get(parent)
+                if parent_doc_ids is None or doc_ids is True:
+                    docs[parent] = doc_ids
+                elif parent_doc_ids is True:
+                    continue
+                elif len(parent_doc_ids) < len(doc_ids):
+                    doc_ids.update(parent_doc_ids)
+                    docs[parent] = doc_ids
+                else:
+                    parent_doc_ids.update(doc_ids)
+        lcs_set = set()
+        for node in lcs_nodes:
+            end = self._ends[node]
+            lcs_set.add(
+                "".join(map(chr, self._text[end - longest_length: end]))
+            )
+        return list(lcs_set) if lcs_set else [""]
+
+    # =============================     CLEAR    ==============================
+    def clear(self):
+        """
+        Removes all the documents from the `GeneralizedSuffixTrie()` instance.
+
+        Example
+        -------
+        >>> gst = GeneralizedSuffixTrie(["banana", "ananas"])
+        >>> gst.clear()
+        >>> gst.is_empty()
+        True
+        """
+        self.__init__()
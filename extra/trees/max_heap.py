@@ -28,10 +28,30 @@ class MaxHeap(Heap):
 
     __name__ = "extra.MaxHeap()"
 
-    def __init__(self):
+    def __init__(self, indexed=False, typecode=None):
         """
         Creates an empty `MaxHeap()` object!!
 
+        Parameters
+        ----------
+        indexed: bool
+            A flag to keep a value-to-positions index alongside the heap. This
+            index makes `remove()`, `update()` & `decrease_key()` run in O(h)
+            and `__contains__()` in constant time at the cost of extra memory.
+            (default: False)
+        typecode: str, optional
+            A numeric type code of the `array` module (e.g. `'d'` for C
+            doubles). When given, the values are packed inside an
+            `array.array` which takes much less memory than a `list`.
+            (default: None)
+
+        Raises
+        ------
+        TypeError:
+            If `indexed` isn't a boolean or `typecode` isn't a string.
+        ValueError:
+            If `typecode` isn't a numeric type code of the `array` module.
+
         Example
         -------
         >>> max_heap = MaxHeap()
@@ -39,11 +59,13 @@ class MaxHeap(Heap):
         <class 'extra.trees.max_heap.MaxHeap'>
         >>> max_heap
         / \\
+        >>> indexed_heap = MaxHeap(indexed=True)
+        >>> packed_heap = MaxHeap(typecode="d")
         """
-        super().__init__()
+        super().__init__(indexed, typecode)
 
     @classmethod
-    def heapify(cls, iterable):
+    def heapify(cls, iterable, indexed=False, typecode=None):
         """
         A class method which creates a `MaxHeap()` instance using an iterable
         object in time-complexity of O(n) where **n** is the number of elements
@@ -54,6 +76,12 @@ class MaxHeap(Heap):
         iterable: iterable
             An iterable python object that implements the `__iter__` method.
             For example, `list` and `tuple` are both iterables.
+        indexed: bool
+            A flag to keep a value-to-positions index alongside the heap.
+            (default: False)
+        typecode: str, optional
+            A numeric type code of the `array` module to pack the values in
+            an `array.array`. (default: None)
 
         Returns
         -------
@@ -96,7 +124,9 @@ class MaxHeap(Heap):
         >>> max_heap_2 = MaxHeap.heapify([1, max_heap_1])
         TypeError: Can't create `extra.MaxHeap()` using `extra.MaxHeap()`!!
         """
-        return super().heapify(iterable)
+        return super().heapify(
+            iterable, is_min_heap=False, indexed=indexed, typecode=typecode
+        )
 
     # =============================    LENGTH    ==============================
     def __len__(self):
@@ -237,7 +267,8 @@ class MaxHeap(Heap):
     def __contains__(self, num):
         """
         Searches the `MaxHeap()` for the given value and returns `True` if the
-        value exists and `False` if not.
+        value exists and `False` if not in linear time, or in constant time if
+        the `MaxHeap()` is indexed.
 
         Parameters
         ----------
@@ -307,6 +338,96 @@ class MaxHeap(Heap):
         """
         super().insert(value, is_min_heap=False)
 
+    # =============================    UPDATE    ==============================
+    def update(self, old_value, new_value):
+        """
+        Replaces one occurrence of `old_value` in the `MaxHeap()` instance with
+        `new_value`. Finding `old_value` takes linear time, or constant time if
+        the `MaxHeap()` is indexed; then moving `new_value` to its right place
+        takes O(h).
+
+        Parameters
+        ----------
+        old_value: int or float
+            The value to be replaced.
+        new_value: int or float
+            The new numeric value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `new_value` is `None`.
+        TypeError:
+            If the given `new_value` is not a numeric value.
+        UserWarning:
+            If the `MaxHeap()` instance is empty of if `old_value` wasn't found
+            in the instance.
+
+        Example
+        -------
+        >>> max_heap = MaxHeap.heapify([2, 4, 3, 7, 9, 0, 1], indexed=True)
+        >>> max_heap
+            __9__
+           /     \\
+          7       3
+         / \\    / \\
+        2   4   0   1
+        >>> max_heap.update(0, 10)
+        >>> max_heap
+            __10__
+           /      \\
+          7        9
+         / \\      / \\
+        2   4    3   1
+        >>> max_heap.update(50, 1)
+        UserWarning: Couldn't find `50` in `extra.MaxHeap()`!!
+        """
+        super().update(old_value, new_value, is_min_heap=False)
+
+    def decrease_key(self, old_value, new_value):
+        """
+        Decreases one occurrence of `old_value` in the `MaxHeap()` instance to
+        `new_value` and moves it down to its right place. It takes O(h) when
+        the `MaxHeap()` is indexed.
+
+        Parameters
+        ----------
+        old_value: int or float
+            The value to be decreased.
+        new_value: int or float
+            The new numeric value which can't be bigger than `old_value`.
+
+        Raises
+        ------
+        ValueError:
+            If the given `new_value` is `None` or bigger than `old_value`.
+        TypeError:
+            If the given `new_value` is not a numeric value.
+        UserWarning:
+            If the `MaxHeap()` instance is empty of if `old_value` wasn't found
+            in the instance.
+
+        Example
+        -------
+        >>> max_heap = MaxHeap.heapify([2, 4, 3, 7, 9, 0, 1], indexed=True)
+        >>> max_heap
+            __9__
+           /     \\
+          7       3
+         / \\    / \\
+        2   4   0   1
+        >>> max_heap.decrease_key(7, 1)
+        >>> max_heap
+            __9__
+           /     \\
+          4       3
+         / \\     / \\
+        2   1   0   1
+        >>> max_heap.decrease_key(7, 10)
+        ValueError: Can't decrease `7` to a bigger value `10`
+        """
+        super().decrease_key(old_value, new_value, is_min_heap=False)
+
     # =============================    REMOVE    ==============================
     def remove(self, del_value):
         """
@@ -346,14 +467,14 @@ class MaxHeap(Heap):
 
     def remove_min(self):
         """
-        Removes the minimum value from the `MaxHeap()` instance which is the
-        root.
+        Removes the minimum value from the `MaxHeap()` instance which is one of
+        the leaf nodes of the instance. Finding it takes linear time as all
+        leaf nodes have to be checked.
 
         Raises
         ------
-        UserWarning:
-            If the `MaxHeap()` instance is empty of if the value wasn't found
-            in the instance.
+        IndexError:
+            If the `MaxHeap()` instance is empty.
 
         Example
         -------
@@ -372,18 +493,21 @@ class MaxHeap(Heap):
          / \\    /
         2   4   1
         """
-        self.remove(self.get_min())
+        if self.is_empty():
+            raise IndexError("Can't remove the minimum out of an empty Heap!!")
+        leaves = range(len(self) // 2, len(self))
+        min_idx = min(leaves, key=self._heap.__getitem__)
+        super()._remove_idx(min_idx, is_min_heap=False)
 
     def remove_max(self):
         """
-        Removes the maximum value from the `MaxHeap()` instance which is one of
-        the nodes at the deepest level of the instance.
+        Removes the maximum value from the `MaxHeap()` instance which is the
+        root in O(h).
 
         Raises
         ------
-        UserWarning:
-            If the `MaxHeap()` instance is empty of if the value wasn't found
-            in the instance.
+        IndexError:
+            If the `MaxHeap()` instance is empty.
 
         Example
         -------
@@ -402,7 +526,9 @@ class MaxHeap(Heap):
          / \\    /
         2   1   0
         """
-        self.remove(self.get_max())
+        if self.is_empty():
+            raise IndexError("Can't remove the maximum out of an empty Heap!!")
+        super()._remove_idx(0, is_min_heap=False)
 
     # =============================     ITER     ==============================
     def __iter__(self):
@@ -455,6 +581,42 @@ class MaxHeap(Heap):
         """
         return super().to_list()
 
+    def get_buffer(self):
+        """
+        Exposes the values of a `MaxHeap()` instance created with a `typecode`
+        through the buffer protocol without copying them. The values are
+        ordered the same way as `to_list()`.
+
+        Returns
+        -------
+        memoryview:
+            A read-only view over the `array.array` holding the values.
+
+        Raises
+        ------
+        TypeError:
+            If the `MaxHeap()` instance wasn't created with a `typecode`.
+
+        Note
+        ----
+        The `MaxHeap()` instance can't grow or shrink while the view is alive.
+        `insert()` and the removal methods will raise `BufferError` till the
+        view is released. Before Python 3.8, the view is a read-only snapshot
+        of the values instead, which is copied in O(n) and doesn't lock the
+        `MaxHeap()` instance.
+
+        Example
+        -------
+        >>> max_heap = MaxHeap.heapify([2, 4, 3, 7, 9, 0, 1], typecode="d")
+        >>> with max_heap.get_buffer() as view:
+        ...     print(view.format, view.tolist())
+        d [9.0, 7.0, 3.0, 2.0, 4.0, 0.0, 1.0]
+        >>> MaxHeap().get_buffer()
+        TypeError: Only `extra.MaxHeap()` created with a `typecode` exposes a \
+buffer!!
+        """
+        return super().get_buffer()
+
     # =============================     CLEAR    ==============================
     def clear(self):
         """
@@ -475,4 +637,4 @@ class MaxHeap(Heap):
         >>> max_heap.is_empty()
         True
         """
-        super().__init__()
+        super().clear()
@@ -28,10 +28,30 @@ class MinHeap(Heap):
 
     __name__ = "extra.MinHeap()"
 
-    def __init__(self):
+    def __init__(self, indexed=False, typecode=None):
         """
         Creates an empty `MinHeap()` object!!
 
+        Parameters
+        ----------
+        indexed: bool
+            A flag to keep a value-to-positions index alongside the heap. This
+            index makes `remove()`, `update()` & `decrease_key()` run in O(h)
+            and `__contains__()` in constant time at the cost of extra memory.
+            (default: False)
+        typecode: str, optional
+            A numeric type code of the `array` module (e.g. `'d'` for C
+            doubles). When given, the values are packed inside an
+            `array.array` which takes much less memory than a `list`.
+            (default: None)
+
+        Raises
+        ------
+        TypeError:
+            If `indexed` isn't a boolean or `typecode` isn't a string.
+        ValueError:
+            If `typecode` isn't a numeric type code of the `array` module.
+
         Example
         -------
         >>> min_heap = MinHeap()
@@ -39,11 +59,13 @@ class MinHeap(Heap):
         <class 'extra.trees.min_heap.MinHeap'>
         >>> min_heap
         / \\
+        >>> indexed_heap = MinHeap(indexed=True)
+        >>> packed_heap = MinHeap(typecode="d")
         """
-        super().__init__()
+        super().__init__(indexed, typecode)
 
     @classmethod
-    def heapify(cls, iterable):
+    def heapify(cls, iterable, indexed=False, typecode=None):
         """
         A class method which creates a `MinHeap()` instance using an iterable
         object in time-complexity of O(n) where **n** is the number of elements
@@ -54,6 +76,12 @@ class MinHeap(Heap):
         iterable: iterable
             An iterable python object that implements the `__iter__` method.
             For example, `list` and `tuple` are both iterables.
+        indexed: bool
+            A flag to keep a value-to-positions index alongside the heap.
+            (default: False)
+        typecode: str, optional
+            A numeric type code of the `array` module to pack the values in
+            an `array.array`. (default: None)
 
         Returns
         -------
@@ -95,7 +123,9 @@ class MinHeap(Heap):
         >>> min_heap_2 = MinHeap.heapify([1, min_heap_1])
         TypeError: Can't create `extra.MinHeap()` using `extra.MinHeap()`!!
         """
-        return super().heapify(iterable)
+        return super().heapify(
+            iterable, is_min_heap=True, indexed=indexed, typecode=typecode
+        )
 
     # =============================    LENGTH    ==============================
     def __len__(self):
@@ -235,7 +265,8 @@ class MinHeap(Heap):
     def __contains__(self, num):
         """
         Searches the `MinHeap()` for the given value and returns `True` if the
-        value exists and `False` if not in linear time.
+        value exists and `False` if not in linear time, or in constant time if
+        the `MinHeap()` is indexed.
 
         Parameters
         ----------
@@ -305,6 +336,96 @@ class MinHeap(Heap):
         """
         super().insert(value, is_min_heap=True)
 
+    # =============================    UPDATE    ==============================
+    def update(self, old_value, new_value):
+        """
+        Replaces one occurrence of `old_value` in the `MinHeap()` instance with
+        `new_value`. Finding `old_value` takes linear time, or constant time if
+        the `MinHeap()` is indexed; then moving `new_value` to its right place
+        takes O(h).
+
+        Parameters
+        ----------
+        old_value: int or float
+            The value to be replaced.
+        new_value: int or float
+            The new numeric value.
+
+        Raises
+        ------
+        ValueError:
+            If the given `new_value` is `None`.
+        TypeError:
+            If the given `new_value` is not a numeric value.
+        UserWarning:
+            If the `MinHeap()` instance is empty of if `old_value` wasn't found
+            in the instance.
+
+        Example
+        -------
+        >>> min_heap = MinHeap.heapify([2, 4, 3, 7, 9, 0, 1], indexed=True)
+        >>> min_heap
+            __0__
+           /     \\
+          4       1
+         / \\     / \\
+        7   9    3   2
+        >>> min_heap.update(7, 2.5)
+        >>> min_heap
+             ___0__
+            /      \\
+          2.5       1
+         /   \\     / \\
+        4     9   3   2
+        >>> min_heap.update(50, 1)
+        UserWarning: Couldn't find `50` in `extra.MinHeap()`!!
+        """
+        super().update(old_value, new_value, is_min_heap=True)
+
+    def decrease_key(self, old_value, new_value):
+        """
+        Decreases one occurrence of `old_value` in the `MinHeap()` instance to
+        `new_value` and moves it up to its right place. It takes O(h) when the
+        `MinHeap()` is indexed.
+
+        Parameters
+        ----------
+        old_value: int or float
+            The value to be decreased.
+        new_value: int or float
+            The new numeric value which can't be bigger than `old_value`.
+
+        Raises
+        ------
+        ValueError:
+            If the given `new_value` is `None` or bigger than `old_value`.
+        TypeError:
+            If the given `new_value` is not a numeric value.
+        UserWarning:
+            If the `MinHeap()` instance is empty of if `old_value` wasn't found
+            in the instance.
+
+        Example
+        -------
+        >>> min_heap = MinHeap.heapify([2, 4, 3, 7, 9, 0, 1], indexed=True)
+        >>> min_heap
+            __0__
+           /     \\
+          4       1
+         / \\     / \\
+        7   9    3   2
+        >>> min_heap.decrease_key(9, -1)
+        >>> min_heap
+            __-1__
+           /      \\
+          0        1
+         / \\      / \\
+        7   4    3   2
+        >>> min_heap.decrease_key(7, 10)
+        ValueError: Can't decrease `7` to a bigger value `10`
+        """
+        super().decrease_key(old_value, new_value, is_min_heap=True)
+
     # =============================    REMOVE    ==============================
     def remove(self, del_value):
         """
@@ -345,13 +466,12 @@ class MinHeap(Heap):
     def remove_min(self):
         """
         Removes the minimum value from the `MinHeap()` instance which is the
-        root.
+        root in O(h).
 
         Raises
         ------
-        UserWarning:
-            If the `MinHeap()` instance is empty of if the value wasn't found
-            in the instance.
+        IndexError:
+            If the `MinHeap()` instance is empty.
 
         Example
         -------
@@ -370,18 +490,20 @@ class MinHeap(Heap):
          / \\    /
         7   9   3
         """
-        self.remove(self.get_min())
+        if self.is_empty():
+            raise IndexError("Can't remove the minimum out of an empty Heap!!")
+        super()._remove_idx(0, is_min_heap=True)
 
     def remove_max(self):
         """
         Removes the maximum value from the `MinHeap()` instance which is one of
-        the nodes at the deepest level of the instance.
+        the leaf nodes of the instance. Finding it takes linear time as all
+        leaf nodes have to be checked.
 
         Raises
         ------
-        UserWarning:
-            If the `MinHeap()` instance is empty of if the value wasn't found
-            in the instance.
+        IndexError:
+            If the `MinHeap()` instance is empty.
 
         Example
         -------
@@ -396,11 +518,15 @@ class MinHeap(Heap):
         >>> min_heap
             __0__
            /     \\
-          4       1
-         /       / \\
-        7       3   2
+          2       1
+         / \\     /
+        7   4   3
         """
-        self.remove(self.get_max())
+        if self.is_empty():
+            raise IndexError("Can't remove the maximum out of an empty Heap!!")
+        leaves = range(len(self) // 2, len(self))
+        max_idx = max(leaves, key=self._heap.__getitem__)
+        super()._remove_idx(max_idx, is_min_heap=True)
 
     # =============================     ITER     ==============================
     def __iter__(self):
@@ -453,6 +579,42 @@ class MinHeap(Heap):
         """
         return super().to_list()
 
+    def get_buffer(self):
+        """
+        Exposes the values of a `MinHeap()` instance created with a `typecode`
+        through the buffer protocol without copying them. The values are
+        ordered the same way as `to_list()`.
+
+        Returns
+        -------
+        memoryview:
+            A read-only view over the `array.array` holding the values.
+
+        Raises
+        ------
+        TypeError:
+            If the `MinHeap()` instance wasn't created with a `typecode`.
+
+        Note
+        ----
+        The `MinHeap()` instance can't grow or shrink while the view is alive.
+        `insert()` and the removal methods will raise `BufferError` till the
+        view is released. Before Python 3.8, the view is a read-only snapshot
+        of the values instead, which is copied in O(n) and doesn't lock the
+        `MinHeap()` instance.
+
+        Example
+        -------
+        >>> min_heap = MinHeap.heapify([2, 4, 3, 7, 9, 0, 1], typecode="d")
+        >>> with min_heap.get_buffer() as view:
+        ...     print(view.format, view.tolist())
+        d [0.0, 4.0, 1.0, 7.0, 9.0, 3.0, 2.0]
+        >>> MinHeap().get_buffer()
+        TypeError: Only `extra.MinHeap()` created with a `typecode` exposes a \
+buffer!!
+        """
+        return super().get_buffer()
+
     # =============================     CLEAR    ==============================
     def clear(self):
         """
@@ -473,4 +635,4 @@ class MinHeap(Heap):
         >>> min_heap.is_empty()
         True
         """
-        super().__init__()
+        super().clear()
@@ -424,28 +424,34 @@ class RadixTrie(Trie):
         """
         assert type(word) == str and len(word) > 0
 
-        last_node, remaining_word = super()._follow_path(word)
+        last_node, start = super()._follow_path(word)
         curr_node = last_node
-        while remaining_word:
-            ch = remaining_word[0]
+        length = len(word)
+        while start < length:
+            ch = word[start]
             child = curr_node.get_child(ch)
             child_data = child.get_data() if child else ""
-            idx = len(get_lcp(child_data, remaining_word))
-            # couldn't find the remaining_word
+            # length of the common prefix between child_data and word[start:]
+            idx = 0
+            max_idx = min(len(child_data), length - start)
+            while idx < max_idx and child_data[idx] == word[start + idx]:
+                idx += 1
+            # couldn't find the remaining part of the word
             if idx == 0:
-                new_node = TrieNode(remaining_word)
+                new_node = TrieNode(word[start:])
                 curr_node.set_child(ch, new_node)
-                remaining_word = ""
+                start = length
                 self._nodes_count += 1
-            # child is prefix of the remaining_word
-            elif idx <= len(remaining_word) and idx != len(child_data):
+            # child is prefix of the remaining part of the word
+            elif idx != len(child_data):
                 # split child
                 new_node = TrieNode(child_data[:idx])
+                new_node._best_score = child._best_score
                 child._data = child_data[idx:]
                 new_node.set_child(child_data[idx], child)
                 # connect new_node to curr_node
                 curr_node.set_child(child_data[0], new_node)
-                remaining_word = remaining_word[idx:]
+                start += idx
                 self._nodes_count += 1
             curr_node = new_node
         # mark current node as a word
@@ -453,21 +459,29 @@ class RadixTrie(Trie):
         # return the newest created node after insertion
         return curr_node
 
-    def insert(self, word):
+    def insert(self, word, score=0):
         """
-        Inserts a `word` in the `RadixTrie()` instance.
+        Inserts a `word` in the `RadixTrie()` instance along with its score,
+        which is used to rank the word when auto-completing. Inserting an
+        existing word updates its score.
 
         Parameters
         ----------
         word: str
             The new word that will be inserted.
+        score: int or float (default 0)
+            The score of the word, the higher the better.
 
         Raises
         ------
         ValueError:
-            If the given `word` is empty.
+            This can be raised due to the following reasons:
+                1. If the given `word` is empty.
+                2. If the given `score` is NaN.
         TypeError:
-            If the type of the given `word` is not `str`.
+            This can be raised due to the following reasons:
+                1. If the type of the given `word` is not `str`.
+                2. If the given `score` isn't a number.
 
         Example
         -------
@@ -483,7 +497,9 @@ class RadixTrie(Trie):
           └── st ✓
         """
         super()._validate_item(word, accept_empty_string=False)
-        self._insert(word)
+        super()._validate_score(score)
+        last_node = self._insert(word)
+        super()._set_score(last_node, score)
 
     # =============================    REMOVE    ==============================
     def remove(self, word):
@@ -546,21 +562,63 @@ class RadixTrie(Trie):
         super().clear()
 
     # ============================= AUTOCOMPLETE ==============================
-    def auto_complete(self, prefix=""):
+    def _find_prefix_node(self, prefix):
+        """
+        Finds the node at which the given `prefix` ends. Since a prefix can end
+        in the middle of a node's data, the returned node is the one covering
+        the prefix's last character.
+
+        Parameters
+        ----------
+        prefix: str
+            The prefix to search for.
+
+        Returns
+        -------
+        TrieNode() or None:
+            The node at which the given `prefix` ends or `None` if no word in
+            the `RadixTrie()` instance starts with the given `prefix`.
+        str:
+            The characters on the path from the root to the returned node.
+        """
+        last_node, idx = super()._follow_path(prefix)
+        if idx < len(prefix):
+            child = last_node.get_child(prefix[idx])
+            child_data = child.get_data() if child else ""
+            # couldn't find the remaining prefix
+            if not child_data.startswith(prefix[idx:]):
+                return None, prefix
+            return child, prefix[:idx] + child_data
+        return last_node, prefix
+
+    def auto_complete(self, prefix="", k=None):
         """
         Parses the `RadixTrie()` instance and retrieves all the words that has
         the given `prefix`. In other words, auto-compeletes a given prefix
-        using all saved words found in the `RadixTrie()` instance.
+        using all saved words found in the `RadixTrie()` instance. When `k` is
+        given, only the `k` words with the highest scores are retrieved.
 
         Parameters
         ----------
         prefix: str (default '')
             A prefix to auto-complete.
+        k: int (default None)
+            The number of completions to be retrieved. `None` retrieves all of
+            them.
 
         Returns
         -------
         list:
-            A list of all found words that have the given `prefix`.
+            A list of all found words that have the given `prefix`. When `k`
+            is given, the list has at most `k` words sorted by their scores in
+            descending order.
+
+        Raises
+        ------
+        TypeError:
+            If the given `k` isn't an integer.
+        ValueError:
+            If the given `k` is negative.
 
         Example
         -------
@@ -580,6 +638,10 @@ class RadixTrie(Trie):
         ["cast"]
         >>> rt.auto_complete()
         ['car', 'cart', 'cast']
+        >>> rt.insert("cast", score=5)
+        >>> rt.insert("cart", score=3)
+        >>> rt.auto_complete("ca", k=2)
+        ['cast', 'cart']
 
         Note
         ----
@@ -587,34 +649,126 @@ class RadixTrie(Trie):
         `RadixTrie()` instance.
         """
 
-        super()._validate_item(prefix)
-        candidates = []
-        last_node, remaining = super()._follow_path(prefix)
-        # update prefix
-        curr_node = last_node
-        prefix = prefix[: -len(remaining)] if remaining else prefix
-        if remaining:
-            ch = remaining[0]
-            child = curr_node.get_child(ch)
-            child_data = child.get_data() if child else ""
-            # couldn't find the remaining prefix
-            if (
-                len(remaining) > len(child_data)
-                or child_data[: len(remaining)] != remaining
-            ):
-                return candidates
-            else:
-                remaining = ""
-                prefix += child_data
-                curr_node = child
-
-        # check the current node
-        if curr_node._is_word:
-            candidates.append(prefix)
-        # get candidates starting from given prefix
-        for child in curr_node.get_children():
-            candidates.extend(super()._get_candidates(child, [prefix]))
-        return candidates
+        return super().auto_complete(prefix, k)
+
+    def iter_complete(self, prefix=""):
+        """
+        Lazily auto-completes the given `prefix` using all saved words found in
+        the `RadixTrie()` instance. Words are yielded one at a time in
+        lexicographic order, so retrieving the first few completions doesn't
+        pay for all of them. The iteration can be stopped at any moment.
+
+        Parameters
+        ----------
+        prefix: str (default '')
+            A prefix to auto-complete.
+
+        Returns
+        -------
+        generator:
+            A generator yielding all words that have the given `prefix` in
+            lexicographic order.
+
+        Raises
+        ------
+        TypeError:
+            If the given `prefix` isn't a `str`.
+
+        Example
+        -------
+        >>> rt = RadixTrie()
+        >>> rt.insert("cast")
+        >>> rt.insert("car")
+        >>> rt.insert("cart")
+        >>> rt
+        ROOT
+        └─┬ ca
+          ├── st ✓
+          └─┬ r ✓
+            └── t ✓
+        >>> list(rt.iter_complete("ca"))
+        ['car', 'cart', 'cast']
+        >>> from itertools import islice
+        >>> list(islice(rt.iter_complete(), 2))
+        ['car', 'cart']
+        """
+        return super().iter_complete(prefix)
+
+    # =============================     FUZZY    ==============================
+    def search_fuzzy(self, word, max_distance=1):
+        """
+        Searches the `RadixTrie()` instance for all the words whose
+        Levenshtein distance, the minimum number of inserted, deleted and
+        substituted characters, from the given `word` is at most
+        `max_distance`. The `RadixTrie()` is walked once while carrying a row
+        of the edit-distance table for every character, so a node is pruned
+        along with its subtree once every value in its row exceeds
+        `max_distance`.
+
+        Parameters
+        ----------
+        word: str
+            The word to be searched for.
+        max_distance: int (default 1)
+            The maximum edit distance between the given `word` and the found
+            words.
+
+        Returns
+        -------
+        list:
+            A list of `(word, distance)` tuples sorted by the distance and
+            then alphabetically.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in two cases
+                1. If the type of the given `word` is not `str`.
+                2. If the given `max_distance` isn't an integer.
+        ValueError:
+            If the given `max_distance` is negative.
+
+        Example
+        -------
+        >>> rt = RadixTrie()
+        >>> rt.insert("car")
+        >>> rt.insert("cart")
+        >>> rt.insert("cast")
+        >>> rt.insert("cat")
+        >>> rt.search_fuzzy("cat")
+        [('cat', 0), ('car', 1), ('cart', 1), ('cast', 1)]
+        >>> rt.search_fuzzy("cars", max_distance=2)
+        [('car', 1), ('cart', 1), ('cast', 2), ('cat', 2)]
+        """
+        return super().search_fuzzy(word, max_distance)
+
+    # =============================    FREEZE    ==============================
+    def freeze(self):
+        """
+        Converts the `RadixTrie()` instance into an immutable `FrozenTrie()`
+        which answers the same queries while taking a small fraction of the
+        memory. The `RadixTrie()` instance itself isn't changed.
+
+        Returns
+        -------
+        FrozenTrie():
+            The frozen version of the `RadixTrie()` instance.
+
+        Example
+        -------
+        >>> rt = RadixTrie()
+        >>> rt.insert("car")
+        >>> rt.insert("cart")
+        >>> rt.insert("cast")
+        >>> ft = rt.freeze()
+        >>> ft
+        extra.FrozenTrie(3 words)
+        >>> len(ft) == len(rt)
+        True
+        >>> ft.auto_complete("ca")
+        ['car', 'cart', 'cast']
+        """
+        return super().freeze()
 
     # =============================     NODES    ==============================
     def get_nodes_per_level(self):
@@ -271,6 +271,75 @@ class RedBlackTree(BST):
         """
         super().__init__(iterable)
 
+    @classmethod
+    def from_sorted(cls, iterable):
+        """
+        A class method which bulk-loads a balanced `RedBlackTree()` instance
+        out of sorted values in time-complexity of O(n) where **n** is the
+        number of elements inside the given `iterable`. All nodes are colored
+        black except for the nodes of the deepest level which are colored red
+        when that level isn't completely filled. This way, all paths have the
+        same black height.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method.
+            For example, `list` and `tuple` are both iterables.
+
+        Returns
+        -------
+        RedBlackTree():
+            A balanced `RedBlackTree()` instance holding the given values.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in two cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is NOT a number.
+        ValueError:
+            If one of the iterable elements is `None`.
+        UserWarning:
+            For each duplicated value which gets ignored.
+
+        Example
+        -------
+        >>> rbtree = RedBlackTree.from_sorted([1, 6, 8, 11, 13, 15, 17, 25])
+        >>> rbtree
+                   ______13|B______
+                  /                \\
+               _8|B_             __17|B_
+              /     \\           /       \\
+           _6|B     11|B      15|B      25|B
+          /
+        1|R
+
+        Unsorted values are sorted first in time-complexity of O(n log(n)).
+        """
+        rbtree = super().from_sorted(iterable)
+        length = len(rbtree)
+        if length == 0:
+            return rbtree
+        # the deepest level of a perfect tree can be black as well
+        red_depth = (
+            -1 if length & (length + 1) == 0 else length.bit_length() - 1
+        )
+        level_nodes = [rbtree._root]
+        depth = 0
+        while level_nodes:
+            color = Color.RED if depth == red_depth else Color.BLACK
+            next_level = []
+            for node in level_nodes:
+                node.set_color(color)
+                if node.get_left() is not None:
+                    next_level.append(node.get_left())
+                if node.get_right() is not None:
+                    next_level.append(node.get_right())
+            level_nodes = next_level
+            depth += 1
+        return rbtree
+
     # =============================    LENGTH    ==============================
     def __len__(self):
         """
@@ -504,20 +573,21 @@ class RedBlackTree(BST):
         """
         assert isinstance(start_node, self._basic_node)
 
-        # get basic info
-        uncle = start_node.get_uncle()
-        parent = start_node.get_parent()
-        grandparent = parent.get_parent() if parent else None
-        # recolor when node has a grandparent
-        if parent is None or grandparent is None:
-            return parent if parent else start_node
-
-        # case I
-        if parent.get_color() == Color.BLACK:
-            # do nothing
-            # print("Case I")
-            return self._root
-        else:
+        curr_node = start_node
+        while True:
+            # get basic info
+            uncle = curr_node.get_uncle()
+            parent = curr_node.get_parent()
+            grandparent = parent.get_parent() if parent else None
+            # recolor when node has a grandparent
+            if parent is None or grandparent is None:
+                return parent if parent else curr_node
+
+            # case I
+            if parent.get_color() == Color.BLACK:
+                # do nothing
+                # print("Case I")
+                return self._root
             # case II
             if uncle and uncle.get_color() == Color.RED:
                 # print("Case II")
@@ -529,15 +599,15 @@ class RedBlackTree(BST):
                 # print("Case III")
                 # get great grandparent
                 great_grandparent = grandparent.get_parent()
-                grandparent = self.__recolor_case3(start_node)
+                grandparent = self.__recolor_case3(curr_node)
                 # set connection
                 if great_grandparent:
                     if great_grandparent.get_data() > grandparent.get_data():
                         great_grandparent.set_left(grandparent)
                     else:
                         great_grandparent.set_right(grandparent)
-            # recursively do the same over grandparent
-            return self.__recolor(grandparent)
+            # do the same over grandparent
+            curr_node = grandparent
 
     # =============================    INSERT    ==============================
     def insert(self, value):
@@ -293,17 +293,18 @@ class SplayTree(BST):
     def __splaying(self, start_node):
         assert isinstance(start_node, self._basic_node)
         child = start_node
-        parent = child.get_parent()
-        if parent is None:
-            return start_node
-        grand_parent = child.get_grand_parent()
-        # get the operation type
-        if grand_parent is None:
-            if child.is_left_child():
-                root = self.__zig(child)
-            else:
-                root = self.__zag(child)
-        else:
+        # keep moving the node up till it becomes the root
+        while True:
+            parent = child.get_parent()
+            if parent is None:
+                return child
+            grand_parent = child.get_grand_parent()
+            # get the operation type
+            if grand_parent is None:
+                if child.is_left_child():
+                    return self.__zig(child)
+                else:
+                    return self.__zag(child)
             # left -> left
             if parent.is_left_child() and child.is_left_child():
                 grand_parent = self.__zig_zig(child)
@@ -316,11 +317,9 @@ class SplayTree(BST):
             # right -> right
             else:
                 grand_parent = self.__zag_zag(child)
-            if grand_parent.get_parent() is not None:
-                root = self.__splaying(grand_parent)
-            else:
-                root = grand_parent
-        return root
+            if grand_parent.get_parent() is None:
+                return grand_parent
+            child = grand_parent
 
     def _splay(self, start_node):
         """
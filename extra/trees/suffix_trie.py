@@ -4,8 +4,10 @@ exports a huge amount of structural information about that string. It is able
 to perform these stuctural operations by storing all the possible suffixes of
 the given text, hence the name "Suffix Trie".
 """
+from array import array
+
 from extra.interface import Extra
-from extra.trees.radix_trie import get_lcp, TrieNode, RadixTrie
+from extra.trees.radix_trie import TrieNode, RadixTrie
 
 
 def is_palindrome(word):
@@ -48,6 +50,139 @@ def is_palindrome(word):
     return True
 
 
+def get_suffix_array(word):
+    """
+    Builds the suffix array of the given word using prefix doubling. The
+    suffixes are sorted by the ranks of their first `k` characters, then `2k`,
+    `4k`, ... etc. until all ranks are distinct. Each round sorts the pairs of
+    ranks with a two-pass radix sort, so no suffix is ever copied and the whole
+    thing takes O(n) memory-wise and O(nlog(n)) time-wise. The empty suffix
+    (the one made of the terminating "$") is the smallest suffix, so it's
+    always the first one.
+
+    Parameters
+    ----------
+    word: str
+        The word whose suffix array is needed.
+
+    Returns
+    -------
+    list:
+        The starting indices of the suffixes of the given word sorted
+        alphabetically. It has `len(word) + 1` items.
+
+    Raises
+    ------
+    AssertionError:
+        If the given word isn't a `str` object.
+
+    Example
+    -------
+    >>> get_suffix_array("banana")
+    [6, 5, 3, 1, 0, 4, 2]
+    >>> # indices associated with the following suffixes:
+    >>> # ['$', 'a', 'ana', 'anana', 'banana', 'na', 'nana']
+    """
+    assert type(word) == str
+
+    n = len(word)
+    if n == 0:
+        return [0]
+    # ranks start at one since zero is reserved for the end of the word
+    alphabet = {ch: rank for rank, ch in enumerate(sorted(set(word)), 1)}
+    ranks = [alphabet[ch] for ch in word]
+    suffix_array = sorted(range(n), key=ranks.__getitem__)
+    k = 1
+    num_ranks = len(alphabet)
+    while num_ranks < n:
+        # order by the second rank: suffixes shorter than `k` have the
+        # smallest second rank, the others follow the previous order
+        by_second = list(range(n - k, n))
+        by_second += [idx - k for idx in suffix_array if idx >= k]
+        # stable counting sort by the first rank
+        starts = [0] * (num_ranks + 2)
+        for rank in ranks:
+            starts[rank + 1] += 1
+        for rank in range(1, num_ranks + 1):
+            starts[rank + 1] += starts[rank]
+        for idx in by_second:
+            rank = ranks[idx]
+            suffix_array[starts[rank]] = idx
+            starts[rank] += 1
+        # suffixes get the same rank only if both of their ranks are equal
+        keys = [
+            first * (num_ranks + 1) + second
+            for first, second in zip(ranks, ranks[k:] + [0] * k)
+        ]
+        num_ranks = 0
+        prev_key = -1
+        for idx in suffix_array:
+            key = keys[idx]
+            if key != prev_key:
+                num_ranks += 1
+                prev_key = key
+            ranks[idx] = num_ranks
+        k *= 2
+    return [n] + suffix_array
+
+
+def get_lcp_array(word, suffix_array):
+    """
+    Builds the longest-common-prefix (LCP) array of the given word using
+    Kasai's algorithm in linear time. The i-th item is the length of the
+    longest common prefix between the suffixes at `suffix_array[i-1]` and
+    `suffix_array[i]`, while the first item is always zero.
+
+    Parameters
+    ----------
+    word: str
+        The word whose LCP array is needed.
+    suffix_array: list
+        The suffix array of the given word as returned by
+        `get_suffix_array()`.
+
+    Returns
+    -------
+    list:
+        The LCP array of the given word. It has the same length as the given
+        suffix array.
+
+    Raises
+    ------
+    AssertionError:
+        If the given word isn't a `str` object or if the suffix array doesn't
+        belong to the given word.
+
+    Example
+    -------
+    >>> suffix_array = get_suffix_array("banana")
+    >>> get_lcp_array("banana", suffix_array)
+    [0, 0, 1, 3, 0, 0, 2]
+    """
+    assert type(word) == str
+    assert len(suffix_array) == len(word) + 1
+
+    n = len(word)
+    ranks = [0] * (n + 1)
+    for rank, idx in enumerate(suffix_array):
+        ranks[idx] = rank
+    lcp_array = [0] * (n + 1)
+    lcp = 0
+    for idx in range(n):
+        # the empty suffix is always the first one, so rank > 0
+        prev_idx = suffix_array[ranks[idx] - 1]
+        while (
+            idx + lcp < n
+            and prev_idx + lcp < n
+            and word[idx + lcp] == word[prev_idx + lcp]
+        ):
+            lcp += 1
+        lcp_array[ranks[idx]] = lcp
+        if lcp > 0:
+            lcp -= 1
+    return lcp_array
+
+
 class SuffixTrie(Extra):
     """
     A suffix trie is a radix trie that stores information about a single string
@@ -56,24 +191,34 @@ class SuffixTrie(Extra):
     suffixes of the given text, hence the name "Suffix Trie".
     """
 
+    ENGINES = {"radix_trie", "suffix_array", "suffix_tree"}
     __name__ = "extra.SuffixTrie"
 
-    def __init__(self, word):
+    def __init__(self, word, engine="radix_trie"):
         """
-        Creates a `SuffixTrie()` object using the given `word` in quadratic
-        time-complexity!!
+        Creates a `SuffixTrie()` object using the given `word`. The
+        "radix_trie" engine does that in quadratic time-complexity!!
 
         Parameters
         ----------
         word: str
             The string that we want to create our `SuffixTrie()` from its
             suffixes.
+        engine: str
+            The structure used to index the suffixes. It's either "radix_trie"
+            which inserts every suffix into a `RadixTrie()` in O(n^2) or
+            "suffix_array" which only builds the suffix array in O(nlog(n))
+            & the LCP array in O(n) without copying any suffix or
+            "suffix_tree" which builds a suffix tree in O(n) using Ukkonen's
+            algorithm where edges are stored as offsets into the word.
+            (default: "radix_trie")
 
         Raises
         ------
         ValueError: It can be raised due to one of these cases:
             1. If given `word` is `None`.
             2. If the given `word` is an empty string.
+            3. If the given `engine` isn't a supported engine.
         TypeError: It can be raised due to one of these cases:
             1. If `word` is an `Extra` object.
             2. If the type of the given `word` isn't a string.
@@ -95,8 +240,15 @@ class SuffixTrie(Extra):
         │ ├── na$ ⟶ 2
         │ └── $ ⟶ 4
         └── $ ⟶ 6
+
+        The "suffix_array" and the "suffix_tree" engines are meant for long
+        strings. Methods that need the trie's labels, like printing, build it
+        on their first call:
+
+        >>> st = SuffixTrie("banana", engine="suffix_array")
+        >>> st.count_pattern_occurrences("ana")
+        2
         """
-        # Ukkonen's algorithm
         super()._validate_item(word)
         if type(word) != str:
             raise TypeError(
@@ -106,30 +258,253 @@ class SuffixTrie(Extra):
             raise ValueError(
                 f"An empty string can't be inserted to `{self.__name__}`!!"
             )
+        elif engine not in self.ENGINES:
+            raise ValueError(
+                f"`engine` has to be one of {sorted(self.ENGINES)}!!"
+            )
 
         self._word = word.replace("$", "")
+        self._engine = engine
         # dictionary containing suffix-index as key and leaf nodes as values
         self._leaf_nodes = {}
         # SuffixTrie is basically a RadixTrie
-        self._rt = RadixTrie()
-        # suffix array is a tuple of (index, suffix) entries.
-        self._suffix_array = []
-        for idx in range(len(self._word)):
-            node = self._rt._insert(self._word[idx:] + "$ ⟶ " + str(idx))
+        self._rt = None
+        # these are built lazily by the "radix_trie" engine
+        self._suffix_array = None
+        self._lcp_array = None
+        self._ranks = None
+        self._sparse_table = None
+        self._palindrome_radii = None
+        if engine == "radix_trie":
+            self._get_radix_trie()
+        elif engine == "suffix_tree":
+            self._build_suffix_tree()
+        else:
+            self._get_suffix_array()
+
+    def _get_radix_trie(self):
+        """
+        Returns the `RadixTrie()` holding all the suffixes of the word, and
+        builds it in O(n^2) if it wasn't built before.
+
+        Returns
+        -------
+        RadixTrie():
+            The radix trie containing all the suffixes of the word where each
+            leaf node ends with "$ ⟶ idx" and idx is the suffix's start index.
+        """
+        if self._rt is None:
+            self._rt = RadixTrie()
+            for idx in range(len(self._word)):
+                node = self._rt._insert(
+                    self._word[idx:] + "$ ⟶ " + str(idx)
+                )
+                node._is_word = False
+                self._leaf_nodes[idx] = node
+            # edge case
+            node = self._rt._insert("$ ⟶ " + str(len(self._word)))
             node._is_word = False
-            self._leaf_nodes[idx] = node
-            self._suffix_array.append((idx, self._word[idx:]))
-
-        # edge case
-        node = self._rt._insert("$ ⟶ " + str(len(self._word)))
-        node._is_word = False
-        self._leaf_nodes[len(self._word)] = node
-        self._suffix_array.append((len(self._word), "$"))
-        # NOTE
-        # The `self._suffix_array` isn't the actually suffix array. To obtain
-        # the suffix array, you will need to sort the suffixes alphabetically
-        # and obtain the indices only. And that's what happens in
-        # `to_suffix_array` method.
+            self._leaf_nodes[len(self._word)] = node
+        return self._rt
+
+    def _build_suffix_tree(self):
+        """
+        Builds the suffix tree of the word followed by "$" in linear time using
+        Ukkonen's algorithm. Nodes are integer ids, where the root is `0`, and
+        each one is described by a few compact arrays instead of objects:
+
+            - `_starts` & `_ends`: the offsets of the edge's label (the edge \
+                leading to the node) in the word.
+            - `_children`: a dictionary of the first character of each child \
+                edge as a key and the child id as a value. It's `None` for \
+                leaf nodes.
+            - `_parents`: the parent's id of each node.
+            - `_str_depths`: the length of the string from the root to the \
+                node.
+            - `_num_leaves`: the number of leaf nodes in the node's subtree.
+            - `_leaves`: the leaf node's id of each suffix index.
+
+        It also keeps the tree's height in `_height`.
+        """
+        text = self._word + "$"
+        n = len(text)
+        starts, ends, links = array("q", [0]), array("q", [0]), array("q", [0])
+        children = [{}]
+        # leaf edges grow with each phase, so they end at -1 while building
+        active_node = active_edge = active_length = remainder = 0
+        for i, ch in enumerate(text):
+            remainder += 1
+            last_new_node = 0
+            while remainder > 0:
+                if active_length == 0:
+                    active_edge = i
+                edge_ch = text[active_edge]
+                next_node = children[active_node].get(edge_ch)
+                if next_node is None:
+                    children[active_node][edge_ch] = len(starts)
+                    starts.append(i)
+                    ends.append(-1)
+                    links.append(0)
+                    children.append(None)
+                    if last_new_node:
+                        links[last_new_node] = active_node
+                        last_new_node = 0
+                else:
+                    end = i + 1 if ends[next_node] < 0 else ends[next_node]
+                    edge_length = end - starts[next_node]
+                    if active_length >= edge_length:
+                        # walk down to the next node
+                        active_edge += edge_length
+                        active_length -= edge_length
+                        active_node = next_node
+                        continue
+                    if text[starts[next_node] + active_length] == ch:
+                        # the suffix is already there, this phase is over
+                        if last_new_node and active_node:
+                            links[last_new_node] = active_node
+                            last_new_node = 0
+                        active_length += 1
+                        break
+                    # split the edge by a new internal node
+                    split_node = len(starts)
+                    starts.append(starts[next_node])
+                    ends.append(starts[next_node] + active_length)
+                    links.append(0)
+                    children.append({ch: split_node + 1})
+                    children[active_node][edge_ch] = split_node
+                    starts.append(i)
+                    ends.append(-1)
+                    links.append(0)
+                    children.append(None)
+                    starts[next_node] += active_length
+                    children[split_node][text[starts[next_node]]] = next_node
+                    if last_new_node:
+                        links[last_new_node] = split_node
+                    last_new_node = split_node
+                remainder -= 1
+                if active_node == 0 and active_length > 0:
+                    active_length -= 1
+                    active_edge = i - remainder + 1
+                elif active_node != 0:
+                    active_node = links[active_node]
+        # walk the tree to fill the parents, depths & leaves of each node
+        num_nodes = len(starts)
+        parents = array("q", [0]) * num_nodes
+        str_depths = array("q", [0]) * num_nodes
+        num_leaves = array("q", [0]) * num_nodes
+        leaves = array("q", [0]) * n
+        depths = array("q", [0]) * num_nodes
+        order = [0]
+        for node in order:
+            if children[node] is None:
+                ends[node] = n
+                str_depths[node] = str_depths[parents[node]] + n - starts[node]
+                leaves[n - str_depths[node]] = node
+                continue
+            for child in children[node].values():
+                parents[child] = node
+                depths[child] = depths[node] + 1
+                if children[child] is not None:
+                    str_depths[child] = (
+                        str_depths[node] + ends[child] - starts[child]
+                    )
+                order.append(child)
+        # children come after their parents, so count leaves in reverse
+        for node in reversed(order):
+            if children[node] is None:
+                num_leaves[node] = 1
+            if node:
+                num_leaves[parents[node]] += num_leaves[node]
+        self._starts, self._ends = starts, ends
+        self._children = children
+        self._parents = parents
+        self._str_depths = str_depths
+        self._num_leaves = num_leaves
+        self._leaves = leaves
+        self._height = max(depths)
+
+    def _follow_suffix_tree(self, pattern):
+        """
+        Follows the edges of the suffix tree matching the given `pattern` in
+        O(m) where `m` is the pattern's length.
+
+        Parameters
+        ----------
+        pattern: str
+            The substring to look for.
+
+        Returns
+        -------
+        int or None:
+            The id of the highest node whose path starts with the given
+            `pattern`, or `None` if the pattern doesn't exist.
+        """
+        node = idx = 0
+        while idx < len(pattern):
+            node = self._children[node].get(pattern[idx])
+            if node is None:
+                return None
+            # the terminating "$" isn't part of `self._word`, so the leaf's
+            # label gets shorter by one
+            start = self._starts[node]
+            length = min(self._ends[node] - start, len(pattern) - idx)
+            if self._word[start: start + length] != pattern[idx: idx + length]:
+                return None
+            idx += length
+        return node
+
+    def _get_suffix_array(self):
+        """
+        Returns the suffix array of the word, and builds it in O(nlog(n))
+        along with the LCP array and the rank of each suffix in O(n) if they
+        weren't built before.
+
+        Returns
+        -------
+        list:
+            The suffix array of the word.
+        """
+        if self._suffix_array is None:
+            self._suffix_array = get_suffix_array(self._word)
+            self._lcp_array = get_lcp_array(self._word, self._suffix_array)
+            self._ranks = [0] * len(self._suffix_array)
+            for rank, idx in enumerate(self._suffix_array):
+                self._ranks[idx] = rank
+        return self._suffix_array
+
+    def _find_suffix_range(self, pattern):
+        """
+        Binary-searches the suffix array for the suffixes starting with the
+        given `pattern` in O(m*log(n)) where `m` is the pattern's length.
+
+        Parameters
+        ----------
+        pattern: str
+            The prefix to look for.
+
+        Returns
+        -------
+        tuple:
+            The (start, end) range of the suffix array whose suffixes start
+            with the given `pattern`. The range is empty if none of them does.
+        """
+        suffix_array = self._get_suffix_array()
+        word, m = self._word, len(pattern)
+        lo, hi = 0, len(suffix_array)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if word[suffix_array[mid]: suffix_array[mid] + m] < pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        start, hi = lo, len(suffix_array)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if word[suffix_array[mid]: suffix_array[mid] + m] == pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        return start, lo
 
     # =============================    LENGTH    ==============================
     def __len__(self):
@@ -160,7 +535,9 @@ class SuffixTrie(Extra):
         >>> len(st)
         11
         """
-        return len(self._rt)
+        if self._engine == "suffix_tree":
+            return len(self._starts)
+        return len(self._get_radix_trie())
 
     # =============================     PRINT    ==============================
     def __repr__(self):
@@ -188,7 +565,7 @@ class SuffixTrie(Extra):
         │ └── $ ⟶ 4
         └── $ ⟶ 6
         """
-        return str(self._rt)
+        return str(self._get_radix_trie())
 
     # ============================= HEIGHT/DEPTH ==============================
     def get_height(self):
@@ -219,7 +596,9 @@ class SuffixTrie(Extra):
         >>> st.get_height()
         3
         """
-        return self._rt.get_height()
+        if self._engine == "suffix_tree":
+            return self._height
+        return self._get_radix_trie().get_height()
 
     def get_depth(self):
         """
@@ -249,7 +628,7 @@ class SuffixTrie(Extra):
         >>> st.get_depth()
         0
         """
-        return self._rt.get_depth()
+        return self._get_radix_trie().get_depth()
 
     # =============================  LEAF NODES  ==============================
     def count_leaf_nodes(self):
@@ -281,7 +660,9 @@ class SuffixTrie(Extra):
         >>> st.count_leaf_nodes()
         7
         """
-        return self._rt.count_leaf_nodes()
+        if self._engine == "suffix_tree":
+            return len(self._leaves)
+        return self._get_radix_trie().count_leaf_nodes()
 
     # =============================     ITER     ==============================
     def __iter__(self):
@@ -314,7 +695,7 @@ class SuffixTrie(Extra):
         ...     print(value, end=',')
         banana$,a,na,$,na,$,na$,$,na$,$,
         """
-        for node in self._rt.__iter__():
+        for node in self._get_radix_trie().__iter__():
             yield node.split(" ⟶ ")[0]
 
     def to_list(self):
@@ -385,7 +766,14 @@ class SuffixTrie(Extra):
         >>> st.has_substring("ab")
         False
         """
-        return self._rt.has_prefix(substr)
+        if self._engine == "radix_trie":
+            return self._rt.has_prefix(substr)
+        elif type(substr) != str:
+            return False
+        elif self._engine == "suffix_tree":
+            return self._follow_suffix_tree(substr) is not None
+        start, end = self._find_suffix_range(substr)
+        return start < end
 
     def to_suffix_array(self):
         """
@@ -418,32 +806,9 @@ class SuffixTrie(Extra):
         >>> # indices associated with the following suffixes:
         >>> # ['$', 'a', 'ana', 'anana', 'banana', 'na', 'nana']
         """
-        # sort suffixes alphabetically and obtain only the indices
-        return [k for k, v in sorted(self._suffix_array, key=lambda x: x[1])]
+        return list(self._get_suffix_array())
 
     # =============================    LCS/LRS   ==============================
-    def __get_deepest_nodes(self):
-        """
-        Returns a list of the trie nodes found in the deepest one or two levels
-        of the `SuffixTrie()` instance. It returns a list of the deepest two
-        level only if the height of the SuffixTrie exceeds 2. Other than that,
-        it returns a list of the deepest level.
-
-        Returns
-        -------
-        list:
-            A list of the deepest `TrieNode()` objects found in the
-            `SuffixTrie()` instanece.
-        """
-        if self._rt.is_empty():
-            return self._rt._root
-        level_nodes = (
-            self._rt._get_nodes_per_level(self._rt._root, 0, [], False)
-        )
-        if len(level_nodes) > 2:
-            return level_nodes[-1] + level_nodes[-2]
-        return level_nodes[-1]
-
     def _get_ancestors_data(self, node):
         """
         Gets all the data in the ancestors (parent, then grand-parent, then
@@ -528,16 +893,28 @@ class SuffixTrie(Extra):
             - `get_longest_common_substring()`.
             - `get_longest_repeated_substring()`.
         """
-        if self._rt.is_empty():
-            return []
-        lcs_set = set()
-        longest_length = 0
-        for node in self.__get_deepest_nodes():
-            lcs = self._get_ancestors_data(node)
-            longest_length = max(longest_length, len(lcs))
-            lcs_set.add(lcs)
-        # return the longest ones
-        return [substr for substr in lcs_set if len(substr) == longest_length]
+        if self._engine == "suffix_tree":
+            # the LRS is the path to the deepest internal node
+            longest_length = 0
+            lcs_set = {""}
+            for node, children in enumerate(self._children):
+                if children is None or self._str_depths[node] < longest_length:
+                    continue
+                elif self._str_depths[node] > longest_length:
+                    longest_length = self._str_depths[node]
+                    lcs_set = set()
+                end = self._ends[node]
+                lcs_set.add(self._word[end - longest_length: end])
+            return list(lcs_set)
+        # the LRS is the longest common prefix of two adjacent suffixes
+        suffix_array = self._get_suffix_array()
+        longest_length = max(self._lcp_array)
+        lcs_set = {
+            self._word[idx: idx + longest_length]
+            for idx, lcp in zip(suffix_array, self._lcp_array)
+            if lcp == longest_length
+        }
+        return list(lcs_set)
 
     def get_longest_repeated_substring(self):
         """
@@ -628,36 +1005,308 @@ class SuffixTrie(Extra):
                 f"`i` and `j` values can't exceed {len(self._word)} "
                 + f"since it is the length of given word: `{self._word}`!!"
             )
-        ith_ancestors_data = self._get_ancestors_data(self._leaf_nodes[i])
-        jth_ancestors_data = self._get_ancestors_data(self._leaf_nodes[j])
-        return get_lcp(ith_ancestors_data, jth_ancestors_data)
+        return self._word[i: i + self._get_suffix_lcp(i, j)]
+
+    def lcp(self, i, j):
+        """
+        Gets the length of the longest common prefix between two suffixes
+        defined by their indices in the `SuffixTrie()`. The first call builds
+        a sparse table over the LCP array in O(nlog(n)), then every call takes
+        constant time.
+
+        Parameters
+        ----------
+        i: int
+            The start index of the first suffix.
+        j: int
+            The start index of the second suffix.
+
+        Returns
+        -------
+        int:
+            The length of the longest common prefix between the two suffixes.
+
+        Raises
+        -------
+        TypeError:
+            If either one of the given indices were not an integer.
+        ValueError:
+            If the value of the given indices were invalid, like negative
+            number of more than the length of the base string.
+
+        Example
+        -------
+        >>> st = SuffixTrie("banana")
+        >>> st.lcp(1, 3)
+        3
+        >>> st.lcp(0, 2)
+        0
+        >>> st.lcp(2, 2)
+        4
+        """
+        if type(i) != int or type(j) != int:
+            raise TypeError("`i` and `j` should be integer values!!")
+        elif i < 0 or j < 0:
+            raise ValueError("`i` and `j` should be postive integer values!!")
+        elif i > len(self._word) or j > len(self._word):
+            raise ValueError(
+                f"`i` and `j` values can't exceed {len(self._word)} "
+                + f"since it is the length of given word: `{self._word}`!!"
+            )
+        if i == j:
+            return len(self._word) - i
+        return self._get_suffix_lcp(i, j)
+
+    def _get_sparse_table(self):
+        """
+        Returns the sparse table of the LCP array, and builds it in O(nlog(n))
+        if it wasn't built before. The k-th level holds the minimum of every
+        `2^k` consecutive values of the LCP array, so the minimum of any range
+        is the minimum of two overlapping entries of the same level.
+
+        Returns
+        -------
+        list:
+            A list of `array` levels where `table[k][idx]` is the minimum of
+            `lcp_array[idx: idx + 2^k]`.
+        """
+        if self._sparse_table is None:
+            self._get_suffix_array()
+            table = [array("i", self._lcp_array)]
+            half = 1
+            while 2 * half <= len(self._lcp_array):
+                prev = table[-1]
+                table.append(array("i", map(min, prev[:-half], prev[half:])))
+                half *= 2
+            self._sparse_table = table
+        return self._sparse_table
+
+    def _get_suffix_lcp(self, i, j):
+        """
+        Gets the length of the path between the root and the lowest common
+        ancestor of the two leaf nodes of the given suffixes in constant time.
+        That's the minimum LCP value between the ranks of the two suffixes,
+        which is found using the sparse table. When both suffixes are the
+        same, the leaf's parent is used which is the longest prefix shared
+        with any other suffix.
+
+        Parameters
+        ----------
+        i: int
+            The start index of the first suffix.
+        j: int
+            The start index of the second suffix.
+
+        Returns
+        -------
+        int:
+            The length of the lowest common ancestor's string.
+        """
+        table = self._get_sparse_table()
+        lcp_array = self._lcp_array
+        if i == j:
+            rank = self._ranks[i]
+            next_lcp = lcp_array[rank + 1] if rank + 1 < len(lcp_array) else 0
+            return max(lcp_array[rank], next_lcp)
+        lo, hi = self._ranks[i], self._ranks[j]
+        if lo > hi:
+            lo, hi = hi, lo
+        # the minimum of lcp_array[lo + 1: hi + 1]
+        level = (hi - lo).bit_length() - 1
+        return min(table[level][lo + 1], table[level][hi - (1 << level) + 1])
 
     # =============================  PALINDROME  ==============================
-    def __get_longest_palindrome(self):
-        """
-        IT'S NOT READY YET!!
-        """
-        rev = self._word[::-1]
-        longest_palindrome = ""
-        for i in range(len(rev)):
-            suffix = rev[i:]
-            node, remaining = self._rt._follow_path(suffix)
-            if not remaining:
-                remaining = "$"
-            child = node.get_child(remaining[0])
-            if child is not None and child.is_leaf():
-                child_data = child.get_data() if child else ""
-                position = int(child_data.split(" ⟶ ")[1])
-                lcp = get_lcp(child_data, remaining)
-                remaining = remaining[len(lcp):]
-                end_position = len(suffix) - len(remaining)
-                if position == len(self._word) - i - end_position:
-                    palindrome = suffix[:end_position]
-                    if is_palindrome(palindrome) and len(palindrome) > len(
-                        longest_palindrome
-                    ):
-                        longest_palindrome = palindrome
-        return longest_palindrome
+    def _get_palindrome_radii(self):
+        """
+        Returns the radii of the longest palindromes centered at each position
+        of the word, and finds them using Manacher's algorithm in linear time
+        if they weren't found before. Each palindrome found is used to skip
+        the characters mirrored inside it instead of comparing them again.
+
+        Returns
+        -------
+        tuple:
+            A tuple of two arrays `(odd, even)` where `odd[i]` is the number
+            of odd-length palindromes centered at `i` and `even[i]` is the
+            number of even-length palindromes centered between `i-1` and `i`.
+        """
+        if self._palindrome_radii is None:
+            word, n = self._word, len(self._word)
+            odd, even = array("i", [0]) * n, array("i", [0]) * n
+            # the rightmost palindrome found so far is word[left: right]
+            left = right = 0
+            for i in range(n):
+                radius = 1
+                if i < right:
+                    # start from the mirrored palindrome
+                    radius = min(odd[left + right - 1 - i], right - i)
+                while (
+                    i - radius >= 0
+                    and i + radius < n
+                    and word[i - radius] == word[i + radius]
+                ):
+                    radius += 1
+                odd[i] = radius
+                if i + radius > right:
+                    left, right = i - radius + 1, i + radius
+            left = right = 0
+            for i in range(n):
+                radius = 0
+                if i < right:
+                    radius = min(even[left + right - i], right - i)
+                while (
+                    i - radius - 1 >= 0
+                    and i + radius < n
+                    and word[i - radius - 1] == word[i + radius]
+                ):
+                    radius += 1
+                even[i] = radius
+                if i + radius > right:
+                    left, right = i - radius, i + radius
+            self._palindrome_radii = (odd, even)
+        return self._palindrome_radii
+
+    def get_longest_palindrome(self):
+        """
+        Gets the longest palindromic substring in the `SuffixTrie()` using
+        Manacher's algorithm in linear time. A palindrome is a string that
+        reads the same if reversed like "madam" or "anna".
+
+        Returns
+        -------
+        str:
+            The longest palindromic substring. If there are many of them, the
+            leftmost one is returned.
+
+        Example
+        -------
+        >>> st = SuffixTrie("banana")
+        >>> st.get_longest_palindrome()
+        'anana'
+        >>> st = SuffixTrie("abcde")
+        >>> st.get_longest_palindrome()
+        'a'
+        """
+        odd, even = self._get_palindrome_radii()
+        longest_length = start = 0
+        for i in range(len(self._word)):
+            if 2 * odd[i] - 1 > longest_length or (
+                2 * odd[i] - 1 == longest_length and i - odd[i] + 1 < start
+            ):
+                longest_length, start = 2 * odd[i] - 1, i - odd[i] + 1
+            if 2 * even[i] > longest_length or (
+                2 * even[i] == longest_length and i - even[i] < start
+            ):
+                longest_length, start = 2 * even[i], i - even[i]
+        return self._word[start: start + longest_length]
+
+    def _validate_min_len(self, min_len):
+        """
+        Makes sure the given minimum length of palindromes is valid.
+
+        Parameters
+        ----------
+        min_len: int
+            The minimum length of palindromes.
+
+        Raises
+        ------
+        TypeError:
+            If the given `min_len` isn't an integer.
+        ValueError:
+            If the given `min_len` is less than one.
+        """
+        if type(min_len) != int:
+            raise TypeError("`min_len` has to be an integer value!!")
+        elif min_len < 1:
+            raise ValueError("`min_len` has to be a positive integer!!")
+
+    def count_palindromes(self, min_len=1):
+        """
+        Counts the occurrences of palindromic substrings in the `SuffixTrie()`
+        whose lengths are at least `min_len` in linear time. Every occurrence
+        is counted, so "aa" has three palindromes: "a", "a" and "aa".
+
+        Parameters
+        ----------
+        min_len: int (default: 1)
+            The minimum length of the counted palindromes.
+
+        Returns
+        -------
+        int:
+            The number of palindromic substrings.
+
+        Raises
+        ------
+        TypeError:
+            If the given `min_len` isn't an integer.
+        ValueError:
+            If the given `min_len` is less than one.
+
+        Example
+        -------
+        >>> st = SuffixTrie("banana")
+        >>> st.count_palindromes()
+        10
+        >>> st.count_palindromes(min_len=3)
+        4
+        """
+        self._validate_min_len(min_len)
+        odd, even = self._get_palindrome_radii()
+        # the shortest radii of odd & even palindromes of `min_len` or more
+        min_odd_radius = (min_len + 2) // 2
+        min_even_radius = max((min_len + 1) // 2, 1)
+        total = 0
+        for radius in odd:
+            if radius >= min_odd_radius:
+                total += radius - min_odd_radius + 1
+        for radius in even:
+            if radius >= min_even_radius:
+                total += radius - min_even_radius + 1
+        return total
+
+    def iter_palindromes(self, min_len=1):
+        """
+        Iterates over the occurrences of palindromic substrings in the
+        `SuffixTrie()` whose lengths are at least `min_len`. They are generated
+        center by center from left to right, the longest first. Finding them
+        takes linear time, while generating them takes as long as their count.
+
+        Parameters
+        ----------
+        min_len: int (default: 1)
+            The minimum length of the generated palindromes.
+
+        Yields
+        ------
+        tuple:
+            A tuple of `(idx, palindrome)` where `idx` is the index at which
+            the palindrome starts in the word.
+
+        Raises
+        ------
+        TypeError:
+            If the given `min_len` isn't an integer.
+        ValueError:
+            If the given `min_len` is less than one.
+
+        Example
+        -------
+        >>> st = SuffixTrie("banana")
+        >>> list(st.iter_palindromes(min_len=3))
+        [(1, 'ana'), (1, 'anana'), (2, 'nan'), (3, 'ana')]
+        """
+        self._validate_min_len(min_len)
+        odd, even = self._get_palindrome_radii()
+        min_odd_radius = (min_len + 2) // 2
+        min_even_radius = max((min_len + 1) // 2, 1)
+        for i in range(len(self._word)):
+            # the even palindromes centered right before the i-th character
+            for radius in range(even[i], min_even_radius - 1, -1):
+                yield i - radius, self._word[i - radius: i + radius]
+            for radius in range(odd[i], min_odd_radius - 1, -1):
+                yield i - radius + 1, self._word[i - radius + 1: i + radius]
 
     # =============================     MATCH    ==============================
     def count_pattern_occurrences(self, pattern):
@@ -689,11 +1338,19 @@ class SuffixTrie(Extra):
         """
         if type(pattern) != str:
             return 0
-        last_node, remaining = self._rt._follow_path(pattern)
-        if remaining:
-            child = last_node.get_child(remaining[0])
+        elif self._engine == "suffix_tree":
+            node = self._follow_suffix_tree(pattern)
+            return 0 if not node else self._num_leaves[node]
+        elif self._engine == "suffix_array":
+            if not pattern:
+                return 0
+            start, end = self._find_suffix_range(pattern)
+            return end - start
+        last_node, idx = self._rt._follow_path(pattern)
+        if idx < len(pattern):
+            child = last_node.get_child(pattern[idx])
             child_data = child.get_data() if child else ""
-            if child_data[: len(remaining)] == remaining:
+            if child_data.startswith(pattern[idx:]):
                 last_node = child
             else:
                 return 0
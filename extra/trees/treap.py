@@ -248,6 +248,78 @@ class Treap(BST):
         random.seed(seed)
         super().__init__(iterable)
 
+    @classmethod
+    def from_sorted(cls, iterable, seed=None):
+        """
+        A class method which bulk-loads a balanced `Treap()` instance out of
+        sorted values in time-complexity of O(n) where **n** is the number of
+        elements inside the given `iterable`. The nodes get random priorities
+        just like `insert()` does, but they are handed out in descending order
+        level by level, so every parent has a priority greater than or equal to
+        its children's.
+
+        Parameters
+        ----------
+        iterable: iterable
+            An iterable python object that implements the `__iter__` method.
+            For example, `list` and `tuple` are both iterables.
+        seed: int or float (default: None)
+            A seed to generate consistent random numbers.
+
+        Returns
+        -------
+        Treap():
+            A balanced `Treap()` instance holding the given values.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in two cases
+                1. In case the given object isn't iterable.
+                2. If one of the elements in the iterable is NOT a number.
+        ValueError:
+            If one of the iterable elements is `None`.
+        UserWarning:
+            For each duplicated value which gets ignored.
+
+        Example
+        -------
+        >>> treap = Treap.from_sorted([1, 2, 3, 4, 5, 6, 7], seed=123)
+        >>> treap
+            __4__
+           /     \\
+          2       6
+         / \\     / \\
+        1   3   5   7
+
+        Unsorted values are sorted first in time-complexity of O(n log(n)).
+        """
+        treap = super().from_sorted(iterable)
+        random.seed(seed)
+        # counting sort over the random priorities, highest first
+        counts = [0] * 101
+        for _ in range(len(treap)):
+            counts[random.randint(0, 100)] += 1
+        priorities = [
+            priority
+            for priority in range(100, -1, -1)
+            for _ in range(counts[priority])
+        ]
+        # parents come before their children in breadth-first order
+        level_nodes = [treap._root] if treap._root is not None else []
+        idx = 0
+        while level_nodes:
+            next_level = []
+            for node in level_nodes:
+                node.set_priority(priorities[idx])
+                idx += 1
+                if node.get_left() is not None:
+                    next_level.append(node.get_left())
+                if node.get_right() is not None:
+                    next_level.append(node.get_right())
+            level_nodes = next_level
+        return treap
+
     # =============================    LENGTH    ==============================
     def __len__(self):
         """
@@ -93,7 +93,10 @@ class TreeNode(Extra):
         if type(value) == str:
             value = value.replace("\n", "\\n")
         self._data = value
+        self._parent = None
         self._children = []
+        self._subtree_size = 1
+        self._subtree_height = 0
 
     def get_data(self):
         """
@@ -165,6 +168,11 @@ class TreeNode(Extra):
                 + "object!!"
             )
         self._children.append(child)
+        child._parent = self
+        self._update_subtree_stats(
+            self._subtree_size + child._subtree_size,
+            max(self._subtree_height, 1 + child._subtree_height),
+        )
 
     def set_children(self, lst):
         """
@@ -205,7 +213,53 @@ class TreeNode(Extra):
                     + "object!!"
                 )
             children.append(item)
+        for child in self._children:
+            if child._parent is self:
+                child._parent = None
+        size, height = 1, 0
+        for child in children:
+            child._parent = self
+            size += child._subtree_size
+            height = max(height, 1 + child._subtree_height)
         self._children = children
+        self._update_subtree_stats(size, height)
+
+    def _update_subtree_stats(self, new_size, new_height):
+        """
+        Sets the cached size & height of the subtree rooted at the current
+        `TreeNode()` and propagates the change up to the ancestors. Only the
+        path to the root is visited, unless the height of an ancestor shrinks
+        which requires re-checking the heights of its direct children.
+
+        Parameters
+        ----------
+        new_size: int
+            The number of nodes in the subtree rooted at the current
+            `TreeNode()`.
+        new_height: int
+            The height of the subtree rooted at the current `TreeNode()`.
+        """
+        size_diff = new_size - self._subtree_size
+        old_height = self._subtree_height
+        self._subtree_size = new_size
+        self._subtree_height = new_height
+        child, node = self, self._parent
+        while node is not None:
+            node._subtree_size += size_diff
+            node_old_height = node._subtree_height
+            if child._subtree_height + 1 > node_old_height:
+                node._subtree_height = child._subtree_height + 1
+            elif (
+                old_height + 1 == node_old_height
+                and child._subtree_height < old_height
+            ):
+                node._subtree_height = max(
+                    1 + sibling._subtree_height for sibling in node._children
+                )
+            if size_diff == 0 and node._subtree_height == node_old_height:
+                break
+            old_height = node_old_height
+            child, node = node, node._parent
 
     def is_leaf(self):
         """
@@ -443,7 +497,8 @@ class Tree(Extra):
     def __len__(self):
         """
         Gets the length of the `Tree()` instance. Length is the number of nodes
-        in the instance.
+        in the instance. It takes constant time as the root keeps a cached
+        count of its subtree that gets updated whenever a child is set.
 
         Returns
         -------
@@ -470,6 +525,8 @@ class Tree(Extra):
         """
         if self.is_empty():
             return 0
+        elif hasattr(self._root, "_subtree_size"):
+            return self._root._subtree_size
         return self.__count_nodes(self._root)
 
     def is_empty(self):
@@ -632,7 +689,8 @@ class Tree(Extra):
         """
         Gets the height of the subtree defined by the given `start_node`
         parameter. The tree's height is the number of edges between the given
-        `start_node` and the furthest leaf node.
+        `start_node` and the furthest leaf node. The height is cached on each
+        `TreeNode()`, so it's returned in constant time.
 
         Returns
         -------
@@ -669,6 +727,8 @@ class Tree(Extra):
         """
         assert isinstance(start_node, TreeNode)
 
+        if hasattr(start_node, "_subtree_height"):
+            return start_node._subtree_height
         height = 0
         for child in start_node.get_children():
             height = max(height, 1 + self._get_height(child))
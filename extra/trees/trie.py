@@ -5,8 +5,10 @@ word "retrieval". The primary query operations that tries support is "prefix
 matching" which involves being given a string and looking for all the sequences
 that contain the given string as a prefix.
 """
+import heapq
 import warnings
 from extra.trees.tree import TreeNode, Tree
+from extra.trees.frozen_trie import FrozenTrie
 
 
 class TrieNode(TreeNode):
@@ -40,6 +42,10 @@ class TrieNode(TreeNode):
         self._data = value
         self._children = {}
         self._is_word = False
+        # the score of the word ending at this node and the best score of all
+        # words found within the subtree rooted at this node
+        self._score = None
+        self._best_score = None
 
     def get_characters(self):
         """
@@ -176,6 +182,110 @@ class TrieNode(TreeNode):
             return self._data
 
 
+class LevenshteinAutomaton:
+    """
+    A Levenshtein automaton accepts all the strings within a certain edit
+    distance from a given word. It's built lazily: each state is a row of the
+    edit-distance table between the string read so far and every prefix of the
+    word, with the values capped at `max_distance + 1`, and the transitions
+    are computed once and cached. The dead state, from which no string can be
+    accepted, is -1.
+    """
+
+    def __init__(self, word, max_distance):
+        """
+        Creates a `LevenshteinAutomaton()` of the given word.
+
+        Parameters
+        ----------
+        word: str
+            The word to compute the edit distances from.
+        max_distance: int
+            The maximum edit distance of the accepted strings.
+        """
+        self._word = word
+        self._cap = max_distance + 1
+        self._rows = []
+        self._state_ids = {}
+        self._transitions = []
+        self._live_moves = []
+        self.start_state = self._add_state(
+            tuple(min(i, self._cap) for i in range(len(word) + 1))
+        )
+
+    def _add_state(self, row):
+        """
+        Returns the id of the state of the given row after adding it if it's
+        new, or -1 if it's the dead state.
+        """
+        if min(row) == self._cap:
+            return -1
+        elif row not in self._state_ids:
+            self._state_ids[row] = len(self._rows)
+            self._rows.append(row)
+            self._transitions.append({})
+            self._live_moves.append(False)
+        return self._state_ids[row]
+
+    def step(self, state, ch):
+        """
+        Returns the state reached after reading the given character at the
+        given state.
+        """
+        next_state = self._transitions[state].get(ch)
+        if next_state is None:
+            row, cap = self._rows[state], self._cap
+            value = row[0] + 1 if row[0] < cap else cap
+            next_row = [value]
+            for i, word_ch in enumerate(self._word):
+                # insertion, deletion, then substitution
+                value += 1
+                if row[i + 1] < value:
+                    value = row[i + 1] + 1
+                if word_ch == ch and row[i] < value:
+                    value = row[i]
+                elif row[i] + 1 < value:
+                    value = row[i] + 1
+                if value > cap:
+                    value = cap
+                next_row.append(value)
+            next_state = self._add_state(tuple(next_row))
+            self._transitions[state][ch] = next_state
+        return next_state
+
+    def get_live_moves(self, state):
+        """
+        Returns the characters that don't lead to the dead state from the
+        given state along with the states they lead to, or `None` if any
+        character doesn't.
+        """
+        if self._live_moves[state] is False:
+            # a character that isn't part of the word
+            if self.step(state, None) != -1:
+                self._live_moves[state] = None
+            else:
+                moves = [(ch, self.step(state, ch)) for ch in set(self._word)]
+                self._live_moves[state] = [
+                    (ch, next_state)
+                    for ch, next_state in moves
+                    if next_state != -1
+                ]
+        return self._live_moves[state]
+
+    def get_distance(self, state):
+        """
+        Returns the edit distance between the string read so far and the word.
+        """
+        return self._rows[state][-1]
+
+    def is_accepting(self, state):
+        """
+        Checks if the string read so far is within the maximum edit distance
+        from the word.
+        """
+        return self._rows[state][-1] < self._cap
+
+
 class Trie(Tree):
     """
     A trie is a tree-based data structure that can be defined recursively using
@@ -234,6 +344,28 @@ class Trie(Tree):
                 f"White-spaces can't be used with `{self.__name__}`!!"
             )
 
+    def _validate_score(self, score):
+        """
+        Makes sure the given score of a word is a number that isn't NaN, since
+        NaN can't be ranked and marks the non-word nodes of `FrozenTrie()`.
+
+        Parameters
+        ----------
+        score: int or float
+            The score of a word.
+
+        Raises
+        -------
+        TypeError:
+            If the given `score` isn't a number.
+        ValueError:
+            If the given `score` is NaN.
+        """
+        if type(score) not in {int, float}:
+            raise TypeError("Given score has to be a number!!")
+        elif score != score:
+            raise ValueError("Given score can't be NaN!!")
+
     # =============================    LENGTH    ==============================
     def __len__(self):
         """
@@ -484,7 +616,10 @@ class Trie(Tree):
     def _follow_path(self, word):
         """
         Parses the `Trie()` instance and returns the last accessed node along
-        side with the part of the word that can't be parsed.
+        side with the index of the first character of the word that can't be
+        parsed. The word is matched in place against the data of each node
+        without slicing it, so following a path is linear in the word's
+        length.
 
         Parameters
         ----------
@@ -495,9 +630,10 @@ class Trie(Tree):
         -------
         TrieNode():
             A reference to the last accessed node in the `Trie()` instance.
-        str:
-            The part of the given `word` that wasn't found in the `Trie()`
-            instance.
+        int:
+            The number of characters at the start of the given `word` that
+            were found in the `Trie()` instance. `word[idx:]` is the part
+            that wasn't found.
 
         Raises
         ------
@@ -518,26 +654,23 @@ class Trie(Tree):
             │ └── t ✓
             └─┬ s
               └── t ✓
-        >>> node, remaining = t._follow_path("case")
+        >>> node, idx = t._follow_path("case")
         >>> node
         TrieNode(s)
-        >>> remaining
-        'e'
+        >>> idx
+        3
         """
         assert type(word) == str
 
         curr_node = self._root
-        while word:
-            ch = word[0]
-            child = curr_node.get_child(ch)
-            child_data = child.get_data() if child else "}"
-            # '}' is used to break the following if-condition
-            if child_data == word[: len(child_data)]:
-                word = word[len(child_data):]
-                curr_node = child
-            else:
+        idx, length = 0, len(word)
+        while idx < length:
+            child = curr_node.get_child(word[idx])
+            if child is None or not word.startswith(child.get_data(), idx):
                 break
-        return curr_node, word
+            idx += len(child.get_data())
+            curr_node = child
+        return curr_node, idx
 
     def __contains__(self, word):
         """
@@ -578,8 +711,8 @@ class Trie(Tree):
         """
         if type(word) != str:
             return False
-        last_node, remaining_word = self._follow_path(word)
-        return remaining_word == "" and last_node._is_word
+        last_node, idx = self._follow_path(word)
+        return idx == len(word) and last_node._is_word
 
     def has_prefix(self, prefix):
         """
@@ -620,29 +753,86 @@ class Trie(Tree):
         """
         if type(prefix) != str:
             return False
-        last_node, remaining = self._follow_path(prefix)
-        if remaining:
-            child = last_node.get_child(remaining[0])
+        last_node, idx = self._follow_path(prefix)
+        if idx < len(prefix):
+            child = last_node.get_child(prefix[idx])
             child_data = child.get_data() if child else ""
-            return child_data[: len(remaining)] == remaining
+            return child_data.startswith(prefix[idx:])
         return True
 
+    # =============================    SCORES    ==============================
+    def _update_best_scores(self, start_node):
+        """
+        Recomputes the best score cached within the given node and its
+        ancestors after a word below them was removed or got a lower score.
+
+        Parameters
+        ----------
+        start_node: TrieNode()
+            The deepest node whose cached best score may be outdated.
+        """
+        curr_node = start_node
+        while curr_node is not None:
+            best_score = curr_node._score if curr_node._is_word else None
+            for child in curr_node._children.values():
+                if child._best_score is not None and (
+                    best_score is None or child._best_score > best_score
+                ):
+                    best_score = child._best_score
+            if best_score == curr_node._best_score:
+                # the ancestors are up-to-date
+                break
+            curr_node._best_score = best_score
+            curr_node = curr_node._parent
+
+    def _set_score(self, word_node, score):
+        """
+        Sets the score of the word ending at the given node and updates the
+        best scores cached within its ancestors.
+
+        Parameters
+        ----------
+        word_node: TrieNode()
+            The node at which the word ends.
+        score: int or float
+            The new score of the word.
+        """
+        old_score = word_node._score
+        word_node._score = score
+        if old_score is not None and score < old_score:
+            self._update_best_scores(word_node)
+            return
+        curr_node = word_node
+        while curr_node is not None and (
+            curr_node._best_score is None or curr_node._best_score < score
+        ):
+            curr_node._best_score = score
+            curr_node = curr_node._parent
+
     # =============================    INSERT    ==============================
-    def insert(self, word):
+    def insert(self, word, score=0):
         """
-        Inserts a `word` in the `Trie()` instance.
+        Inserts a `word` in the `Trie()` instance along with its score, which
+        is used to rank the word when auto-completing. Inserting an existing
+        word updates its score.
 
         Parameters
         ----------
         word: str
             The new word that will be inserted.
+        score: int or float (default 0)
+            The score of the word, the higher the better.
 
         Raises
         ------
         ValueError:
-            If the given `word` is empty.
+            This can be raised due to the following reasons:
+                1. If the given `word` is empty.
+                2. If the given `score` is NaN.
         TypeError:
-            If the type of the given `word` is not `str`.
+            This can be raised due to the following reasons:
+                1. If the type of the given `word` is not `str`.
+                2. If the given `score` isn't a number.
 
         Example
         -------
@@ -660,14 +850,16 @@ class Trie(Tree):
               └── t ✓
         """
         self._validate_item(word, accept_empty_string=False)
-        last_node, remaining_word = self._follow_path(word)
+        self._validate_score(score)
+        last_node, idx = self._follow_path(word)
         curr_node = last_node
-        for ch in remaining_word:
+        for ch in word[idx:]:
             child = TrieNode(ch)
             curr_node.set_child(ch, child)
             self._nodes_count += 1
             curr_node = child
         curr_node._is_word = True
+        self._set_score(curr_node, score)
 
     # =============================    REMOVE    ==============================
     def remove(self, word):
@@ -715,16 +907,22 @@ class Trie(Tree):
             return
         elif word == "":
             return
-        last_node, remaining_word = self._follow_path(word)
-        if remaining_word == "":  # found the whole word
+        last_node, idx = self._follow_path(word)
+        if idx == len(word) and last_node._is_word:  # found the whole word
             curr_node = last_node
             curr_node._is_word = False
-            while not curr_node._is_word and curr_node.is_leaf():
+            curr_node._score = None
+            while (
+                curr_node is not self._root
+                and not curr_node._is_word
+                and curr_node.is_leaf()
+            ):
                 ch = curr_node.get_data()[0]
                 parent = curr_node.get_parent()
                 del parent._children[ch]
                 self._nodes_count -= 1
                 curr_node = parent
+            self._update_best_scores(curr_node)
 
     def clear(self):
         """
@@ -753,6 +951,28 @@ class Trie(Tree):
         super().clear()
 
     # ============================= AUTOCOMPLETE ==============================
+    def _find_prefix_node(self, prefix):
+        """
+        Finds the node at which the given `prefix` ends.
+
+        Parameters
+        ----------
+        prefix: str
+            The prefix to search for.
+
+        Returns
+        -------
+        TrieNode() or None:
+            The node at which the given `prefix` ends or `None` if no word in
+            the `Trie()` instance starts with the given `prefix`.
+        str:
+            The characters on the path from the root to the returned node.
+        """
+        last_node, idx = self._follow_path(prefix)
+        if idx < len(prefix):
+            return None, prefix
+        return last_node, prefix
+
     def _get_candidates(self, start_node, prev_prefixes):
         """
         A helper method to the auto-complete() method.
@@ -769,21 +989,105 @@ class Trie(Tree):
             output.extend(self._get_candidates(child, prefixes))
         return output
 
-    def auto_complete(self, prefix=""):
+    def _validate_k(self, k):
+        """
+        Makes sure the number of requested completions is a valid one.
+
+        Parameters
+        ----------
+        k: int
+            The number of completions to be retrieved.
+
+        Raises
+        ------
+        TypeError:
+            If the given `k` isn't an integer.
+        ValueError:
+            If the given `k` is negative.
+        """
+        if type(k) != int:
+            raise TypeError("`k` has to be an integer!!")
+        elif k < 0:
+            raise ValueError("`k` can't be a negative number!!")
+
+    def _get_top_candidates(self, start_node, start_prefix, k):
+        """
+        A helper method to the auto-complete() method which retrieves the `k`
+        words with the highest scores found within the subtree rooted at the
+        given node. It runs a best-first search ordered by the best score
+        cached within every node, so only the paths leading to these words and
+        their siblings get visited.
+
+        Parameters
+        ----------
+        start_node: TrieNode()
+            The node to start searching from.
+        start_prefix: str
+            The characters on the path from the root to the `start_node`.
+        k: int
+            The number of words to be retrieved.
+
+        Returns
+        -------
+        list:
+            At most `k` words sorted by their scores in descending order. Words
+            with equal scores are sorted alphabetically.
+        """
+        candidates = []
+        if start_node._best_score is None or k == 0:
+            return candidates
+        # a node entry is never greater than the entries of the words below it
+        # since its best score is at least as high as theirs and its path is
+        # a prefix of theirs. So, words are popped in the right order.
+        heap = [(-start_node._best_score, start_prefix, 1, start_node)]
+        while heap and len(candidates) < k:
+            _, prefix, is_node, node = heapq.heappop(heap)
+            if not is_node:
+                candidates.append(prefix)
+                continue
+            if node._is_word:
+                heapq.heappush(heap, (-node._score, prefix, 0, None))
+            for child in node._children.values():
+                if child._best_score is not None:
+                    heapq.heappush(
+                        heap,
+                        (
+                            -child._best_score,
+                            prefix + child._data,
+                            1,
+                            child,
+                        ),
+                    )
+        return candidates
+
+    def auto_complete(self, prefix="", k=None):
         """
         Parses the `Trie()` instance and retrieves all the words that has the
         given `prefix`. In other words, auto-compeletes a given prefix using
-        all saved words found in the `Trie()` instance.
+        all saved words found in the `Trie()` instance. When `k` is given,
+        only the `k` words with the highest scores are retrieved.
 
         Parameters
         ----------
         prefix: str (default '')
             A prefix to auto-complete.
+        k: int (default None)
+            The number of completions to be retrieved. `None` retrieves all of
+            them.
 
         Returns
         -------
         list:
-            A list of all found words that have the given `prefix`.
+            A list of all found words that have the given `prefix`. When `k`
+            is given, the list has at most `k` words sorted by their scores in
+            descending order.
+
+        Raises
+        ------
+        TypeError:
+            If the given `k` isn't an integer.
+        ValueError:
+            If the given `k` is negative.
 
         Example
         -------
@@ -805,6 +1109,10 @@ class Trie(Tree):
         ["cast"]
         >>> t.auto_complete()
         ['car', 'cart', 'cast']
+        >>> t.insert("cast", score=5)
+        >>> t.insert("cart", score=3)
+        >>> t.auto_complete("ca", k=2)
+        ['cast', 'cart']
 
         Note
         ----
@@ -812,17 +1120,216 @@ class Trie(Tree):
         `Trie()` instance.
         """
         self._validate_item(prefix)
-        last_node, remaining = self._follow_path(prefix)
+        if k is not None:
+            self._validate_k(k)
+        curr_node, prefix = self._find_prefix_node(prefix)
         candidates = []
-        if remaining == "":
-            curr_node = last_node
-            # get candidates starting from given prefix
-            if curr_node._is_word:
-                candidates.append(prefix)
-            for child in curr_node.get_children():
-                candidates.extend(self._get_candidates(child, [prefix]))
+        if curr_node is None:
+            return candidates
+        elif k is not None:
+            return self._get_top_candidates(curr_node, prefix, k)
+        # get candidates starting from given prefix
+        if curr_node._is_word:
+            candidates.append(prefix)
+        for child in curr_node.get_children():
+            candidates.extend(self._get_candidates(child, [prefix]))
         return candidates
 
+    def _iter_candidates(self, start_node, start_prefix):
+        """
+        A helper method to the iter_complete() method which lazily yields the
+        words found within the subtree rooted at the given node in
+        lexicographic order. It uses an explicit stack of nodes and a shared
+        buffer holding the data of the nodes on the current path.
+
+        Parameters
+        ----------
+        start_node: TrieNode()
+            The node to start iterating from.
+        start_prefix: str
+            The characters on the path from the root to the `start_node`.
+
+        Yields
+        ------
+        str:
+            The words found within the subtree rooted at `start_node`.
+        """
+        buffer = [start_prefix]
+        # each item is a node and the buffer's length before visiting it
+        stack = [(start_node, 0)]
+        while stack:
+            curr_node, buffer_length = stack.pop()
+            if buffer_length:
+                del buffer[buffer_length:]
+                buffer.append(curr_node._data)
+            if curr_node._is_word:
+                yield "".join(buffer)
+            children = curr_node._children
+            for ch in sorted(children, reverse=True):
+                stack.append((children[ch], len(buffer)))
+
+    def iter_complete(self, prefix=""):
+        """
+        Lazily auto-completes the given `prefix` using all saved words found in
+        the `Trie()` instance. Words are yielded one at a time in
+        lexicographic order, so retrieving the first few completions doesn't
+        pay for all of them. The iteration can be stopped at any moment.
+
+        Parameters
+        ----------
+        prefix: str (default '')
+            A prefix to auto-complete.
+
+        Returns
+        -------
+        generator:
+            A generator yielding all words that have the given `prefix` in
+            lexicographic order.
+
+        Raises
+        ------
+        TypeError:
+            If the given `prefix` isn't a `str`.
+
+        Example
+        -------
+        >>> t = Trie()
+        >>> t.insert("cast")
+        >>> t.insert("car")
+        >>> t.insert("cart")
+        >>> t
+        ROOT
+        └─┬ c
+          └─┬ a
+            ├─┬ s
+            │ └── t ✓
+            └─┬ r ✓
+              └── t ✓
+        >>> list(t.iter_complete("ca"))
+        ['car', 'cart', 'cast']
+        >>> from itertools import islice
+        >>> list(islice(t.iter_complete(), 2))
+        ['car', 'cart']
+        """
+        self._validate_item(prefix)
+        curr_node, prefix = self._find_prefix_node(prefix)
+        if curr_node is None:
+            return iter(())
+        return self._iter_candidates(curr_node, prefix)
+
+    # =============================     FUZZY    ==============================
+    def search_fuzzy(self, word, max_distance=1):
+        """
+        Searches the `Trie()` instance for all the words whose Levenshtein
+        distance, the minimum number of inserted, deleted and substituted
+        characters, from the given `word` is at most `max_distance`. The
+        `Trie()` is walked once while carrying a row of the edit-distance
+        table for every node, so a node is pruned along with its subtree once
+        every value in its row exceeds `max_distance`. Rows are shared between
+        nodes as the states of a lazily built Levenshtein automaton.
+
+        Parameters
+        ----------
+        word: str
+            The word to be searched for.
+        max_distance: int (default 1)
+            The maximum edit distance between the given `word` and the found
+            words.
+
+        Returns
+        -------
+        list:
+            A list of `(word, distance)` tuples sorted by the distance and
+            then alphabetically.
+
+        Raises
+        ------
+        TypeError:
+            It can be raised in two cases
+                1. If the type of the given `word` is not `str`.
+                2. If the given `max_distance` isn't an integer.
+        ValueError:
+            If the given `max_distance` is negative.
+
+        Example
+        -------
+        >>> t = Trie()
+        >>> t.insert("car")
+        >>> t.insert("cart")
+        >>> t.insert("cast")
+        >>> t.insert("cat")
+        >>> t.search_fuzzy("cat")
+        [('cat', 0), ('car', 1), ('cart', 1), ('cast', 1)]
+        >>> t.search_fuzzy("cars", max_distance=2)
+        [('car', 1), ('cart', 1), ('cast', 2), ('cat', 2)]
+        """
+        self._validate_item(word)
+        if type(max_distance) != int:
+            raise TypeError("`max_distance` has to be an integer!!")
+        elif max_distance < 0:
+            raise ValueError("`max_distance` can't be a negative number!!")
+        automaton = LevenshteinAutomaton(word, max_distance)
+        matches = []
+        # each item is a node, the characters on the path from the root to it
+        # and the automaton's state after reading them
+        stack = [(self._root, "", automaton.start_state)]
+        while stack:
+            curr_node, prefix, state = stack.pop()
+            if curr_node._is_word and automaton.is_accepting(state):
+                matches.append((prefix, automaton.get_distance(state)))
+            children = curr_node._children
+            live_moves = automaton.get_live_moves(state)
+            if live_moves is None:
+                # any character keeps the automaton alive
+                candidates = [
+                    (child, automaton.step(state, ch))
+                    for ch, child in children.items()
+                ]
+            else:
+                candidates = [
+                    (children[ch], next_state)
+                    for ch, next_state in live_moves
+                    if ch in children
+                ]
+            for child, child_state in candidates:
+                data = child._data
+                for i in range(1, len(data)):
+                    if child_state == -1:
+                        break
+                    child_state = automaton.step(child_state, data[i])
+                if child_state != -1:
+                    stack.append((child, prefix + data, child_state))
+        matches.sort(key=lambda item: (item[1], item[0]))
+        return matches
+
+    # =============================    FREEZE    ==============================
+    def freeze(self):
+        """
+        Converts the `Trie()` instance into an immutable `FrozenTrie()` which
+        answers the same queries while taking a small fraction of the memory.
+        The `Trie()` instance itself isn't changed.
+
+        Returns
+        -------
+        FrozenTrie():
+            The frozen version of the `Trie()` instance.
+
+        Example
+        -------
+        >>> t = Trie()
+        >>> t.insert("car")
+        >>> t.insert("cart")
+        >>> t.insert("cast")
+        >>> ft = t.freeze()
+        >>> ft
+        extra.FrozenTrie(3 words)
+        >>> "cart" in ft
+        True
+        >>> ft.auto_complete("car")
+        ['car', 'cart']
+        """
+        return FrozenTrie._from_root(self._root)
+
     # =============================     NODES    ==============================
     def get_nodes_per_level(self):
         """
@@ -128,21 +128,75 @@ class Helper:
         )
 
     @staticmethod
-    def verify_skiplist(skiplist):
+    def get_skiplist_levels(skiplist):
+        # returns the (value, width) pairs found at each level
+        levels = []
         for level in range(skiplist.get_height()):
-            curr_node = skiplist._level_lists[level]._head
-            if curr_node.get_data() != float("-inf"):
+            pairs = []
+            if skiplist._engine == "linked_list":
+                curr_node = skiplist._level_lists[level]._head
+                while curr_node is not None:
+                    pairs.append((curr_node.get_data(), curr_node._width))
+                    curr_node = curr_node.get_next()
+            else:
+                curr_node = skiplist._head
+                while curr_node is not None:
+                    pairs.append(
+                        (curr_node.get_data(), curr_node._links[2 * level + 1])
+                    )
+                    curr_node = curr_node._links[2 * level]
+            levels.append(pairs)
+        return levels
+
+    @staticmethod
+    def verify_skiplist(skiplist):
+        if skiplist._engine == "linked_list":
+            for level in range(skiplist.get_height()):
+                curr_node = skiplist._level_lists[level]._head
+                while curr_node.get_next() is not None:
+                    if not (
+                        curr_node.get_down() is None
+                        or curr_node.get_down().get_data()
+                        == curr_node.get_data()
+                    ):
+                        return False
+                    curr_node = curr_node.get_next()
+        else:
+            heights = []
+            curr_node = skiplist._head
+            while curr_node is not None:
+                heights.append(curr_node.get_height())
+                curr_node = curr_node.get_next()
+            if heights[0] != skiplist.get_height():
+                return False
+        levels = Helper.get_skiplist_levels(skiplist)
+        # verify the span widths against the positions at the zeroth level
+        positions = {value: pos for pos, (value, _) in enumerate(levels[0])}
+        if len(levels[0]) != len(skiplist) + 1:
+            return False
+        for level, pairs in enumerate(levels):
+            if pairs[0][0] != float("-inf"):
+                return False
+            # upper levels can't be empty
+            if level > 0 and len(pairs) == 1:
+                return False
+            if skiplist._engine == "array" and len(pairs) != sum(
+                1 for height in heights if height > level
+            ):
                 return False
-            while curr_node.get_next() is not None:
-                next_node = curr_node.get_next()
-                if curr_node.get_data() >= next_node.get_data():
+            for i, (value, width) in enumerate(pairs):
+                # upper levels hold a subset of the zeroth level
+                if value not in positions:
                     return False
-                if not (
-                    curr_node.get_down() is None
-                    or curr_node.get_down().get_data() == curr_node.get_data()
-                ):
+                if i + 1 < len(pairs):
+                    next_value = pairs[i + 1][0]
+                    if value >= next_value:
+                        return False
+                    end = positions[next_value]
+                else:
+                    end = len(skiplist) + 1
+                if width != end - positions[value]:
                     return False
-                curr_node = next_node
         return True
 
 
@@ -446,3 +446,25 @@ def test_split_method(helper):
     cll.add_end("apple")
     assert cll._length == len(cll) == len(lst) + 2
     assert cll.to_list() == [0] + lst + ["apple"]
+
+
+def test_tail_reference(helper):
+    lst = helper.get_list(length=100)
+    cll = CircularLinkedList(lst)
+    assert cll._tail.get_data() == lst[-1]
+    assert cll._tail.get_next() is cll._head
+    cll.add_end("apple")
+    assert cll._tail.get_data() == "apple"
+    assert cll._tail.get_next() is cll._head
+    cll.remove_end()
+    assert cll._tail.get_data() == lst[-1]
+    cll.extend(CircularLinkedList([1, 2]))
+    assert cll.to_list() == lst + [1, 2]
+    assert cll._tail.get_data() == 2
+    assert cll._tail.get_next() is cll._head
+    # adding in front of a single-node list
+    cll = CircularLinkedList([1])
+    cll.add_front(0)
+    assert cll._tail.get_data() == 1
+    cll.add_end(2)
+    assert cll.to_list() == [0, 1, 2]
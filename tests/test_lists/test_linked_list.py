@@ -454,3 +454,41 @@ def test_split_method(helper):
     ll.add_end("apple")
     assert ll._length == len(ll) == len(lst) + 2
     assert ll.to_list() == [0] + lst + ["apple"]
+
+
+def test_tail_reference(helper):
+    lst = helper.get_list(length=100)
+    ll = LinkedList(lst)
+    assert ll._tail.get_data() == lst[-1]
+    assert ll._tail.get_next() is None
+    # adding at the end moves the tail
+    ll.add_end("apple")
+    ll.insert(len(ll), "banana")
+    assert ll._tail.get_data() == "banana"
+    assert ll.to_list() == lst + ["apple", "banana"]
+    # removing the last node moves the tail backwards
+    ll.remove_end()
+    assert ll._tail.get_data() == "apple"
+    ll.remove("apple")
+    assert ll._tail.get_data() == lst[-1]
+    # removing the head of a two-node list leaves one node as head & tail
+    ll = LinkedList([1, 2])
+    ll.remove_front()
+    assert ll._head is ll._tail
+    ll.add_end(3)
+    assert ll.to_list() == [2, 3]
+    # extend, split, copy & rotate keep the tail up-to-date
+    ll = LinkedList(lst)
+    ll.extend(LinkedList([1, 2]))
+    assert ll._tail.get_data() == 2
+    left_list, right_list = ll.split(50)
+    assert left_list._tail.get_data() == lst[49]
+    assert right_list._tail.get_data() == 2
+    assert ll.copy()._tail.get_data() == 2
+    ll.rotate_left(1)
+    assert ll._tail.get_data() == lst[0]
+    ll.add_end(0)
+    assert ll.to_list() == lst[1:] + [1, 2, lst[0], 0]
+    # clear resets the tail
+    ll.clear()
+    assert ll._tail is None
@@ -138,3 +138,51 @@ def test_queue_with_known_values():
     assert q.is_empty()
     assert q._max_capacity == 3
     assert q.is_full() is False
+
+
+def test_priority_queue_engines(helper):
+    with pytest.raises(ValueError):
+        PriorityQueue(engine="array")
+    # both engines dequeue the same priorities
+    priorities = [helper.get_int() for _ in range(500)]
+    heap_q = PriorityQueue(engine="heap")
+    linked_q = PriorityQueue(engine="linked_list")
+    for i, priority in enumerate(priorities):
+        heap_q.enqueue(i, priority=priority)
+        linked_q.enqueue(i, priority=priority)
+    for i in range(len(priorities)):
+        lowest = i % 3 == 0
+        expected = linked_q.dequeue(lowest_priority=lowest)
+        value = heap_q.dequeue(lowest_priority=lowest)
+        assert priorities[value] == priorities[expected]
+        if not heap_q.is_empty():
+            assert heap_q._min_priority == linked_q._min_priority
+            assert heap_q._max_priority == linked_q._max_priority
+    assert heap_q.is_empty()
+    # equal priorities are dequeued in FIFO order from both ends
+    q = PriorityQueue()
+    for i in range(10):
+        q.enqueue(i, priority=5)
+    assert q.dequeue() == 0
+    assert q.dequeue(lowest_priority=True) == 1
+    assert [q.dequeue() for _ in range(8)] == list(range(2, 10))
+    # clear() keeps the engine
+    q = PriorityQueue(engine="linked_list")
+    q.clear()
+    assert q._engine == "linked_list"
+
+
+def test_heap_engine_with_max_capacity():
+    q = PriorityQueue(max_capacity=3)
+    q.enqueue("a", priority=100)
+    q.enqueue("b", priority=1)
+    q.enqueue("c", priority=50)
+    with pytest.warns(UserWarning):
+        q.enqueue("d", priority=-10)  # pushes "a" out
+    assert len(q) == 3
+    assert q.top() == "b"
+    assert q._max_priority == 50
+    assert q.dequeue() == "c"
+    assert q.dequeue(lowest_priority=True) == "d"
+    assert q.dequeue() == "b"
+    assert q.is_empty()
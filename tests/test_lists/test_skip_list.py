@@ -1,6 +1,7 @@
 import pytest
 import random
-from extra.lists.skip_list import SkipNode, SkipList
+from bisect import bisect_left, bisect_right
+from extra.lists.skip_list import SkipNode, ArraySkipNode, SkipList
 
 
 def test_skip_node(helper):
@@ -21,14 +22,58 @@ def test_skip_node(helper):
     assert node.get_down() == node._down is None
 
 
-def test_empty_skiplist(helper):
-    sl = SkipList()
+def test_array_skip_node(helper):
+    with pytest.raises(ValueError):
+        ArraySkipNode(None)
+    with pytest.raises(TypeError):
+        ArraySkipNode(ArraySkipNode(10))
+    with pytest.raises(TypeError):
+        ArraySkipNode(helper.get_string())
+    val = helper.get_float()
+    height = helper.get_pos_int(b=10)
+    node = ArraySkipNode(val, height)
+    assert node.get_data() == node._data == val
+    assert node.get_next() is None
+    assert node.get_height() == height
+    assert node._links == [None, 1] * height
+    # slotted nodes don't have `__dict__`
+    with pytest.raises(AttributeError):
+        node.__dict__
+
+
+def test_skiplist_engines(helper):
+    with pytest.raises(ValueError):
+        SkipList(engine=helper.get_string())
+    with pytest.raises(TypeError):
+        SkipList(helper.get_int(), engine="array")
+    # both engines build the same levels using the same coin flips
+    lst = [helper.get_int() for _ in range(helper.get_pos_int())]
+    seed = helper.get_int()
+    array_sl = SkipList(lst, engine="array", seed=seed)
+    linked_sl = SkipList(lst, engine="linked_list", seed=seed)
+    assert helper.get_skiplist_levels(array_sl) == \
+        helper.get_skiplist_levels(linked_sl)
+    assert repr(array_sl) == repr(linked_sl)
+    # copying a SkipList doesn't share its nodes
+    copy_sl = SkipList(array_sl, engine="linked_list")
+    assert copy_sl.to_list() == array_sl.to_list()
+    array_sl.clear()
+    assert array_sl.is_empty() and array_sl._engine == "array"
+    assert copy_sl.to_list() == sorted(set(lst))
+
+
+@pytest.mark.parametrize("engine", sorted(SkipList.ENGINES))
+def test_empty_skiplist(helper, engine):
+    sl = SkipList(engine=engine)
     assert sl.is_empty()
     assert sl.to_list() == [_ for _ in sl] == []
-    assert sl.get_height() == len(sl._level_lists) == 1
-    assert len(sl._level_lists[0]) == 1
-    assert isinstance(sl._level_lists[0]._head, SkipNode)
-    assert sl._level_lists[0]._head.get_data() == float("-inf")
+    assert sl.get_height() == len(helper.get_skiplist_levels(sl)) == 1
+    assert len(helper.get_skiplist_levels(sl)[0]) == 1
+    if engine == "linked_list":
+        assert isinstance(sl._get_head(), SkipNode)
+    else:
+        assert isinstance(sl._get_head(), ArraySkipNode)
+    assert sl._get_head().get_data() == float("-inf")
     assert helper.get_value() not in sl
     assert helper.get_string() not in sl
     assert helper.get_list() not in sl
@@ -47,9 +92,10 @@ def test_empty_skiplist(helper):
     sl.clear()
 
 
-def test_skiplist_with_one_element(helper):
+@pytest.mark.parametrize("engine", sorted(SkipList.ENGINES))
+def test_skiplist_with_one_element(helper, engine):
     val = helper.get_float()
-    sl = SkipList()
+    sl = SkipList(engine=engine)
     sl.insert(val)
     assert len(sl) == 1
     assert not sl.is_empty()
@@ -61,14 +107,15 @@ def test_skiplist_with_one_element(helper):
     sl.remove(val)
     assert sl.is_empty()
     assert sl.to_list() == [_ for _ in sl] == []
-    assert sl.get_height() == len(sl._level_lists) == 1
-    assert len(sl._level_lists[0]) == 1
+    assert sl.get_height() == len(helper.get_skiplist_levels(sl)) == 1
+    assert len(helper.get_skiplist_levels(sl)[0]) == 1
 
 
-def test_skiplist_with_same_value(helper):
+@pytest.mark.parametrize("engine", sorted(SkipList.ENGINES))
+def test_skiplist_with_same_value(helper, engine):
     val = helper.get_float()
     # ========== using insert() ==========
-    sl = SkipList()
+    sl = SkipList(engine=engine)
     for _ in range(helper.get_pos_int()):
         sl.insert(val)
     assert len(sl) == 1
@@ -81,11 +128,11 @@ def test_skiplist_with_same_value(helper):
     sl.remove(val)
     assert sl.is_empty()
     assert sl.to_list() == [_ for _ in sl] == []
-    assert sl.get_height() == len(sl._level_lists) == 1
-    assert len(sl._level_lists[0]) == 1
+    assert sl.get_height() == len(helper.get_skiplist_levels(sl)) == 1
+    assert len(helper.get_skiplist_levels(sl)[0]) == 1
     # ========== using from_iterable ==========
     val = helper.get_float()
-    sl = SkipList([val for _ in range(helper.get_pos_int())])
+    sl = SkipList([val for _ in range(helper.get_pos_int())], engine=engine)
     assert len(sl) == 1
     assert not sl.is_empty()
     assert sl.get_height() >= 1
@@ -96,13 +143,39 @@ def test_skiplist_with_same_value(helper):
     sl.remove(val)
     assert sl.is_empty()
     assert sl.to_list() == [_ for _ in sl] == []
-    assert sl.get_height() == len(sl._level_lists) == 1
-    assert len(sl._level_lists[0]) == 1
+    assert sl.get_height() == len(helper.get_skiplist_levels(sl)) == 1
+    assert len(helper.get_skiplist_levels(sl)[0]) == 1
+
+
+@pytest.mark.parametrize("engine", sorted(SkipList.ENGINES))
+def test_skiplist_with_negative_infinity(helper, engine):
+    # -∞ is the sentinel, so it's always considered inserted
+    lst = [helper.get_int() for _ in range(helper.get_pos_int())]
+    expected = sorted(set(lst))
+    sl = SkipList(lst, engine=engine)
+    sl.insert(float("-inf"))
+    assert sl.to_list() == list(sl) == expected
+    assert len(sl) == len(expected)
+    assert helper.verify_skiplist(sl)
+    sl = SkipList(lst + [float("-inf")], engine=engine)
+    assert sl.to_list() == expected
+    sl.update([float("-inf"), float("-inf")])
+    assert sl.to_list() == expected
+    assert helper.verify_skiplist(sl)
+    sl = SkipList.from_sorted([float("-inf")] + lst, engine=engine)
+    assert sl.to_list() == expected
+    assert len(sl) == len(expected)
+    assert helper.verify_skiplist(sl)
+    sl = SkipList(engine=engine)
+    sl.insert(float("-inf"))
+    sl.update([float("-inf")])
+    assert sl.is_empty()
+    assert sl.to_list() == []
 
 
-def test_skiplist_with_known_values(helper):
-    random.seed(1)
-    sl = SkipList()
+@pytest.mark.parametrize("engine", sorted(SkipList.ENGINES))
+def test_skiplist_with_known_values(helper, engine):
+    sl = SkipList(engine=engine, seed=108)
     sl.insert(2)
     sl.insert(2)  # do nothing
     sl.insert(0)
@@ -120,9 +193,9 @@ def test_skiplist_with_known_values(helper):
     assert sl.get_height() == 3
     assert sl.to_list() == [0, 2, 10, 50, 100]
     # check the structure
-    assert len(sl._level_lists[0]) == 6
-    assert len(sl._level_lists[1]) == 3
-    assert len(sl._level_lists[2]) == 2
+    assert len(helper.get_skiplist_levels(sl)[0]) == 6
+    assert len(helper.get_skiplist_levels(sl)[1]) == 3
+    assert len(helper.get_skiplist_levels(sl)[2]) == 2
     assert helper.verify_skiplist(sl)
     # remove an item
     sl.remove(2)
@@ -136,8 +209,8 @@ def test_skiplist_with_known_values(helper):
     assert 20 not in sl
     assert sl.to_list() == [0, 10, 50, 100]
     # check the structure
-    assert len(sl._level_lists[0]) == 5
-    assert len(sl._level_lists[1]) == 2
+    assert len(helper.get_skiplist_levels(sl)[0]) == 5
+    assert len(helper.get_skiplist_levels(sl)[1]) == 2
     assert helper.verify_skiplist(sl)
     # clear
     sl.clear()
@@ -146,9 +219,10 @@ def test_skiplist_with_known_values(helper):
     assert sl.is_empty()
 
 
-def test_skiplist_with_random_numbers(helper):
+@pytest.mark.parametrize("engine", sorted(SkipList.ENGINES))
+def test_skiplist_with_random_numbers(helper, engine):
     length = helper.get_pos_int()
-    sl = SkipList()
+    sl = SkipList(engine=engine)
     # ========== insert at the end & remove by value ==========
     # insert at the end
     for i in range(length):
@@ -156,7 +230,7 @@ def test_skiplist_with_random_numbers(helper):
     assert len(sl) == length
     assert not sl.is_empty()
     assert sl.to_list() == [i for i in range(length)]
-    assert sl.get_height() == len(sl._level_lists)
+    assert sl.get_height() == len(helper.get_skiplist_levels(sl))
     # search
     for i in range(length):
         assert sl[i] == i
@@ -175,7 +249,7 @@ def test_skiplist_with_random_numbers(helper):
     assert len(sl) == length
     assert not sl.is_empty()
     assert sl.to_list() == [i for i in range(length)]
-    assert sl.get_height() == len(sl._level_lists)
+    assert sl.get_height() == len(helper.get_skiplist_levels(sl))
     # search
     for i in range(length):
         assert sl[i] == i
@@ -189,13 +263,14 @@ def test_skiplist_with_random_numbers(helper):
     assert sl.to_list() == []
 
 
-def test_skiplist_with_from_iterable(helper):
+@pytest.mark.parametrize("engine", sorted(SkipList.ENGINES))
+def test_skiplist_with_from_iterable(helper, engine):
     _set = {helper.get_float() for i in range(helper.get_pos_int())}
-    sl = SkipList(_set)
+    sl = SkipList(_set, engine=engine)
     assert len(sl) == len(_set)
     assert not sl.is_empty()
     assert sl.to_list() == sorted(_set)
-    assert sl.get_height() == len(sl._level_lists)
+    assert sl.get_height() == len(helper.get_skiplist_levels(sl))
     # search
     for i in _set:
         assert i in sl
@@ -206,3 +281,253 @@ def test_skiplist_with_from_iterable(helper):
     assert len(sl) == 0
     assert sl.get_height() == 1
     assert sl.to_list() == []
+
+
+@pytest.mark.parametrize("engine", sorted(SkipList.ENGINES))
+def test_skiplist_order_statistics(helper, engine):
+    lst = sorted({helper.get_int() for _ in range(helper.get_pos_int())})
+    sl = SkipList(lst, engine=engine)
+    assert helper.verify_skiplist(sl)
+    assert [sl[i] for i in range(len(lst))] == lst
+    assert [sl.select(i) for i in range(len(lst))] == lst
+    assert sl.select(-1) == lst[-1]
+    assert sl.select(-len(lst)) == lst[0]
+    with pytest.raises(IndexError):
+        sl.select(len(lst))
+    with pytest.raises(IndexError):
+        sl.select(-len(lst) - 1)
+    with pytest.raises(TypeError):
+        sl.select(helper.get_string())
+    for i, val in enumerate(lst):
+        assert sl.rank(val) == i
+        assert sl.rank(val + 0.5) == i + 1
+        assert sl.rank(val - 0.5) == i
+    with pytest.raises(TypeError):
+        sl.rank(helper.get_string())
+    with pytest.raises(ValueError):
+        sl.rank(None)
+    # delete by random indices
+    while lst:
+        idx = random.randint(0, len(lst) - 1)
+        del sl[idx]
+        del lst[idx]
+        assert sl.to_list() == lst
+        assert len(sl) == len(lst)
+        assert helper.verify_skiplist(sl)
+    assert sl.get_height() == 1
+    assert sl.rank(helper.get_int()) == 0
+    # insert in random order
+    vals = [helper.get_float() for _ in range(helper.get_pos_int())]
+    for val in vals:
+        sl.insert(val)
+        assert helper.verify_skiplist(sl)
+    lst = sorted(set(vals))
+    assert [sl[i] for i in range(len(lst))] == lst
+
+
+@pytest.mark.parametrize("engine", sorted(SkipList.ENGINES))
+def test_skiplist_range_queries(helper, engine):
+    lst = sorted({helper.get_int() for _ in range(helper.get_pos_int())})
+    sl = SkipList(lst, engine=engine)
+    # empty skiplist
+    assert list(SkipList(engine=engine).irange()) == []
+    assert SkipList(engine=engine).count_range() == 0
+    assert SkipList(engine=engine).floor(helper.get_int()) is None
+    assert SkipList(engine=engine).ceiling(helper.get_int()) is None
+    # invalid input
+    with pytest.raises(TypeError):
+        sl.irange(helper.get_string())
+    with pytest.raises(TypeError):
+        sl.irange(hi=helper.get_list())
+    with pytest.raises(TypeError):
+        sl.irange(inclusive=True)
+    with pytest.raises(TypeError):
+        sl.count_range(inclusive=(True, 1))
+    with pytest.raises(TypeError):
+        sl.floor(helper.get_string())
+    with pytest.raises(ValueError):
+        sl.ceiling(None)
+    # compare against a sorted list
+    assert list(sl.irange()) == lst
+    assert sl.count_range() == len(lst)
+    for _ in range(100):
+        lo, hi = sorted(random.choice(lst) + random.choice([0, 0.5])
+                        for _ in range(2))
+        assert sl.bisect_left(lo) == bisect_left(lst, lo)
+        assert sl.bisect_right(lo) == bisect_right(lst, lo)
+        below = [x for x in lst if x <= lo]
+        above = [x for x in lst if x >= lo]
+        assert sl.floor(lo) == (below[-1] if below else None)
+        assert sl.ceiling(lo) == (above[0] if above else None)
+        for inclusive in [(True, True), (True, False),
+                          (False, True), (False, False)]:
+            expected = [
+                x for x in lst
+                if (lo < x or inclusive[0] and lo == x)
+                and (x < hi or inclusive[1] and x == hi)
+            ]
+            assert list(sl.irange(lo, hi, inclusive)) == expected
+            assert sl.count_range(lo, hi, inclusive) == len(expected)
+            # reversed boundaries
+            if lo != hi:
+                assert list(sl.irange(hi, lo, inclusive)) == []
+                assert sl.count_range(hi, lo, inclusive) == 0
+        assert list(sl.irange(lo=lo)) == above
+        assert list(sl.irange(hi=lo)) == below
+        assert sl.count_range(lo=lo) == len(above)
+        assert sl.count_range(hi=lo) == len(below)
+    # irange is lazy
+    gen = sl.irange()
+    assert next(gen) == lst[0]
+
+
+@pytest.mark.parametrize("engine", sorted(SkipList.ENGINES))
+def test_skiplist_level_generator(helper, engine):
+    # invalid parameters
+    with pytest.raises(TypeError):
+        SkipList(engine=engine, probability=helper.get_string())
+    with pytest.raises(ValueError):
+        SkipList(engine=engine, probability=0)
+    with pytest.raises(ValueError):
+        SkipList(engine=engine, probability=1)
+    with pytest.raises(TypeError):
+        SkipList(engine=engine, max_height=helper.get_float())
+    with pytest.raises(ValueError):
+        SkipList(engine=engine, max_height=0)
+    # the same seed builds the same levels and isn't affected by `random`
+    lst = [helper.get_int() for _ in range(helper.get_pos_int())]
+    seed = helper.get_int()
+    sl_1 = SkipList(lst, engine=engine, seed=seed)
+    random.seed(helper.get_int())
+    sl_2 = SkipList(lst, engine=engine, seed=seed)
+    assert helper.get_skiplist_levels(sl_1) == \
+        helper.get_skiplist_levels(sl_2)
+    # heights never exceed `max_height`
+    for probability in [0.5, 0.25, 0.3, 0.9]:
+        max_height = helper.get_pos_int(b=5)
+        sl = SkipList(
+            lst, engine=engine, probability=probability, max_height=max_height
+        )
+        assert sl.get_height() <= max_height
+        assert sl.to_list() == sorted(set(lst))
+        assert helper.verify_skiplist(sl)
+        heights = [sl._draw_height() for _ in range(1000)]
+        assert all(1 <= h <= max_height for h in heights)
+    # heights follow a geometric distribution
+    for probability in [0.5, 0.25, 0.3]:
+        sl = SkipList(engine=engine, seed=seed, probability=probability)
+        n = 20000
+        heights = [sl._draw_height() for _ in range(n)]
+        for level in range(1, 4):
+            ratio = sum(1 for h in heights if h > level) / n
+            assert abs(ratio - probability ** level) < 0.02
+    # a single level makes a sorted linked list
+    sl = SkipList(lst, engine=engine, max_height=1)
+    assert sl.get_height() == 1
+    assert sl.to_list() == sorted(set(lst))
+    # clearing keeps the parameters
+    sl.clear()
+    sl.insert(helper.get_int())
+    assert sl.get_height() == 1
+
+
+@pytest.mark.parametrize("engine", sorted(SkipList.ENGINES))
+def test_skiplist_from_sorted(helper, engine):
+    # invalid input
+    with pytest.raises(TypeError):
+        SkipList.from_sorted(helper.get_int(), engine=engine)
+    with pytest.raises(TypeError):
+        SkipList.from_sorted([1, helper.get_string()], engine=engine)
+    with pytest.raises(ValueError):
+        SkipList.from_sorted([1, None], engine=engine)
+    with pytest.raises(ValueError):
+        SkipList.from_sorted([1, 2], engine=helper.get_string())
+    # empty input
+    sl = SkipList.from_sorted([], engine=engine)
+    assert sl.is_empty()
+    assert sl.get_height() == 1
+    assert helper.verify_skiplist(sl)
+    # unsorted values with duplicates
+    lst = [helper.get_int() for _ in range(helper.get_pos_int())]
+    for probability in [0.5, 0.25, 0.3]:
+        sl = SkipList.from_sorted(lst, engine=engine, probability=probability)
+        assert sl.to_list() == sorted(set(lst))
+        assert len(sl) == len(set(lst))
+        assert helper.verify_skiplist(sl)
+    # the same seed builds the same levels
+    seed = helper.get_int()
+    sl_1 = SkipList.from_sorted(lst, engine=engine, seed=seed)
+    sl_2 = SkipList.from_sorted(lst, engine=engine, seed=seed)
+    assert helper.get_skiplist_levels(sl_1) == \
+        helper.get_skiplist_levels(sl_2)
+    # deterministic promotion
+    sl = SkipList.from_sorted(range(1, 17), engine=engine, deterministic=True)
+    assert sl.get_height() == 5
+    levels = helper.get_skiplist_levels(sl)
+    for level, pairs in enumerate(levels):
+        assert [value for value, _ in pairs[1:]] == \
+            list(range(2 ** level, 17, 2 ** level))
+    sl = SkipList.from_sorted(
+        range(1, 101), engine=engine, deterministic=True, max_height=3
+    )
+    assert sl.get_height() == 3
+    assert helper.verify_skiplist(sl)
+    # the skip list keeps working afterwards
+    sl.insert(0)
+    sl.remove(50)
+    assert sl.to_list() == [0] + list(range(1, 50)) + list(range(51, 101))
+    assert sl[50] == 51
+    assert helper.verify_skiplist(sl)
+
+
+@pytest.mark.parametrize("engine", sorted(SkipList.ENGINES))
+def test_skiplist_update(helper, engine):
+    lst = [helper.get_int() for _ in range(helper.get_pos_int())]
+    sl = SkipList(lst, engine=engine)
+    # invalid input doesn't change the skip list
+    with pytest.raises(TypeError):
+        sl.update(helper.get_int())
+    with pytest.raises(TypeError):
+        sl.update([1, helper.get_string()])
+    with pytest.raises(ValueError):
+        sl.update([1, None])
+    assert sl.to_list() == sorted(set(lst))
+    # empty input
+    sl.update([])
+    assert sl.to_list() == sorted(set(lst))
+    # values mixed with the existing ones
+    reference = set(lst)
+    for _ in range(3):
+        values = [helper.get_int() for _ in range(helper.get_pos_int())]
+        sl.update(values)
+        reference.update(values)
+        assert sl.to_list() == sorted(reference)
+        assert len(sl) == len(reference)
+        assert helper.verify_skiplist(sl)
+    # values greater than the maximum
+    sl.update([max(reference) + 2, max(reference) + 1])
+    assert sl.to_list()[-2:] == [max(reference) + 1, max(reference) + 2]
+    assert helper.verify_skiplist(sl)
+    # updating an empty skip list
+    sl = SkipList(engine=engine)
+    sl.update(lst)
+    assert sl.to_list() == sorted(set(lst))
+    assert helper.verify_skiplist(sl)
+    # +∞ is a valid value and stays the maximum
+    sl = SkipList([1, 2, float("inf")], engine=engine)
+    sl.update([5])
+    assert sl.to_list() == [1, 2, 5, float("inf")]
+    sl = SkipList([1, float("inf")], engine=engine)
+    sl.update([float("inf"), 3])
+    assert sl.to_list() == [1, 3, float("inf")]
+    assert helper.verify_skiplist(sl)
+    sl = SkipList(lst + [float("inf")], engine=engine)
+    sl.update([max(lst) + 1, float("inf"), min(lst) - 1])
+    assert sl.to_list() == \
+        [min(lst) - 1] + sorted(set(lst)) + [max(lst) + 1, float("inf")]
+    assert helper.verify_skiplist(sl)
+    sl = SkipList(lst, engine=engine)
+    sl.update([float("inf"), max(lst) + 1])
+    sl.update([float("inf")])
+    assert sl.to_list() == sorted(set(lst)) + [max(lst) + 1, float("inf")]
+    assert helper.verify_skiplist(sl)
@@ -501,3 +501,27 @@ def test_random_avl(helper):
     for num in lst:
         avl.remove(num)
         assert avl.is_balanced()
+
+
+def test_avl_from_sorted(helper):
+    lst = sorted({helper.get_int() for _ in range(500)})
+    avl = AVL.from_sorted(lst)
+    assert len(avl) == len(lst)
+    assert helper.verify_bst_rules(avl._root)
+    assert avl.is_balanced()
+    assert avl.traverse() == lst
+    # every node knows its height
+    nodes = [avl._root]
+    while nodes:
+        node = nodes.pop()
+        assert node.get_height() == max(node.get_children_heights())
+        nodes.extend(child for child in node.get_children() if child)
+    assert avl._root.get_height() == len(lst).bit_length() - 1
+    # the tree keeps balancing itself afterwards
+    for num in lst[: len(lst) // 2]:
+        avl.remove(num)
+        assert avl.is_balanced()
+    # insert values that aren't stored yet
+    for num in random.sample(range(1001, 2001), 100):
+        avl.insert(num)
+        assert avl.is_balanced()
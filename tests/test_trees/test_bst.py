@@ -1,3 +1,5 @@
+import random
+import sys
 import pytest
 
 from extra.trees.bst import BSTNode, BST
@@ -244,3 +246,63 @@ def test_bst_big_example(helper):
     test_empty_bst(bst)
     # validate
     test_search_insert_remove_input(helper, bst)
+
+
+def test_degenerate_bst(helper):
+    # sorted input builds a linked-list shaped tree deeper than the
+    # recursion limit
+    length = sys.getrecursionlimit() + 500
+    bst = BST(range(length))
+    assert len(bst) == length
+    assert bst.get_min() == 0
+    assert bst.get_max() == length - 1
+    for value in [0, length // 2, length - 1]:
+        assert value in bst
+    assert -1 not in bst
+    with pytest.warns(UserWarning):
+        bst.insert(length // 2)
+    bst.remove(0)
+    bst.remove(length - 1)
+    assert len(bst) == length - 2
+    assert bst.get_min() == 1
+    assert bst.get_max() == length - 2
+
+
+def test_remove_with_replacement_having_subtree(helper):
+    # the replacement of `4` is `3` whose left child has a right child
+    bst = BST([4, 3, 1, 2])
+    bst.remove(4)
+    assert helper.verify_bst_rules(bst._root)
+    assert len(bst) == 3
+    assert bst.traverse() == [1, 2, 3]
+    bst = BST([1, 2, 4, 3])
+    bst.remove(1)
+    assert helper.verify_bst_rules(bst._root)
+    assert bst.traverse() == [2, 3, 4]
+
+
+def test_bst_from_sorted(helper):
+    with pytest.raises(TypeError):
+        BST.from_sorted(helper.get_int())
+    with pytest.raises(TypeError):
+        BST.from_sorted([1, helper.get_string()])
+    with pytest.raises(ValueError):
+        BST.from_sorted([1, None])
+    test_empty_bst(BST.from_sorted([]))
+    for length in [1, 2, 3, 10, 100, 1000]:
+        lst = sorted({helper.get_float() for _ in range(length)})
+        bst = BST.from_sorted(lst)
+        assert len(bst) == len(lst)
+        assert helper.verify_bst_rules(bst._root)
+        # the minimum height possible
+        assert bst.get_height() == len(lst).bit_length() - 1
+        assert bst.traverse() == lst
+        # unsorted input gets sorted
+        random_lst = list(lst)
+        random.shuffle(random_lst)
+        assert BST.from_sorted(random_lst).to_list() == bst.to_list()
+    # duplicates are ignored
+    with pytest.warns(UserWarning):
+        bst = BST.from_sorted([1, 2, 2, 3])
+    assert bst.traverse() == [1, 2, 3]
+    assert len(bst) == 3
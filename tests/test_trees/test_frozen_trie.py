@@ -0,0 +1,111 @@
+import pytest
+import random
+
+from extra.trees.trie import Trie
+from extra.trees.radix_trie import RadixTrie
+from extra.trees.frozen_trie import FrozenTrie
+
+
+def test_empty_frozen_trie(helper):
+    ft = Trie().freeze()
+    assert ft.is_empty()
+    assert len(ft) == 1
+    assert ft.count_words() == 0
+    assert str(ft) == "extra.FrozenTrie(0 words)"
+    assert "" not in ft
+    assert helper.get_string() not in ft
+    assert ft.auto_complete() == []
+    assert ft.auto_complete(k=3) == []
+    assert list(ft.iter_complete()) == []
+    with pytest.raises(TypeError):
+        ft.auto_complete(helper.get_int())
+    with pytest.raises(TypeError):
+        ft.auto_complete("", k="1")
+    with pytest.raises(ValueError):
+        ft.auto_complete("", k=-1)
+    with pytest.raises(TypeError):
+        FrozenTrie(helper.get_int())
+    with pytest.raises(ValueError):
+        FrozenTrie(b"not a frozen trie")
+
+
+def test_frozen_trie_with_simple_example():
+    t = Trie()
+    for word in ["cast", "car", "cart", "café", "ca€", "try"]:
+        t.insert(word)
+    t.insert("cart", score=4)
+    t.insert("café", score=2)
+    ft = t.freeze()
+    assert len(ft) == len(t)
+    assert ft.count_words() == 6
+    assert "café" in ft
+    assert "caf" not in ft
+    assert 1 not in ft
+    assert ft.has_prefix("caf")
+    assert ft.has_prefix("ca€")
+    assert not ft.has_prefix("cb")
+    assert not ft.has_prefix(None)
+    assert ft.auto_complete("ca") == ["café", "car", "cart", "cast", "ca€"]
+    assert ft.auto_complete("ca", k=3) == ["cart", "café", "car"]
+    assert ft.auto_complete("x") == []
+    # freezing doesn't change the trie
+    t.remove("cast")
+    assert "cast" in ft
+    # loading the serialized bytes
+    loaded = FrozenTrie(ft.to_bytes())
+    assert loaded.auto_complete() == ft.auto_complete()
+    assert loaded.auto_complete(k=2) == ["cart", "café"]
+
+
+def test_frozen_trie_against_trie():
+    rng = random.Random(0)
+    for trie_class in [Trie, RadixTrie]:
+        trie, words = trie_class(), set()
+        for _ in range(300):
+            word = "".join(
+                rng.choice("abcé€") for _ in range(rng.randint(1, 7))
+            )
+            trie.insert(word, rng.randint(0, 20))
+            words.add(word)
+        ft = trie.freeze()
+        assert len(ft) == len(trie)
+        assert ft.count_words() == len(words)
+        for _ in range(300):
+            query = "".join(
+                rng.choice("abcé€") for _ in range(rng.randint(0, 4))
+            )
+            assert (query in ft) == (query in words)
+            assert ft.has_prefix(query) == trie.has_prefix(query)
+            assert ft.auto_complete(query) == sorted(
+                trie.auto_complete(query)
+            )
+            assert ft.auto_complete(query, k=4) == trie.auto_complete(
+                query, k=4
+            )
+
+
+def test_frozen_trie_save_and_load(tmp_path):
+    rt = RadixTrie()
+    for word in ["toaster", "toasting", "slow", "slowly", "café"]:
+        rt.insert(word, len(word))
+    path = str(tmp_path / "words.trie")
+    rt.freeze().save(path)
+    ft = FrozenTrie.load(path)
+    assert len(ft) == len(rt)
+    assert "slowly" in ft
+    assert "slowl" not in ft
+    assert ft.has_prefix("toas")
+    assert ft.auto_complete("to") == ["toaster", "toasting"]
+    assert ft.auto_complete(k=2) == ["toasting", "toaster"]
+    assert ft.to_bytes() == rt.freeze().to_bytes()
+    # invalid files
+    empty_path = str(tmp_path / "empty.trie")
+    open(empty_path, "wb").close()
+    with pytest.raises(ValueError):
+        FrozenTrie.load(empty_path)
+    buffer = ft.to_bytes()
+    with pytest.raises(ValueError):
+        FrozenTrie(buffer[:-1])
+    swapped = buffer[:6] + (b"B" if buffer[6:7] == b"L" else b"L") + buffer[7:]
+    with pytest.raises(ValueError):
+        FrozenTrie(swapped)
@@ -0,0 +1,97 @@
+import random
+
+import pytest
+
+from extra.trees.generalized_suffix_trie import GeneralizedSuffixTrie
+
+
+def brute_force_lcs(docs, k):
+    substrings = {
+        doc[i:j]
+        for doc in docs
+        for i in range(len(doc))
+        for j in range(i + 1, len(doc) + 1)
+    }
+    common = [
+        substr
+        for substr in substrings
+        if sum(substr in doc for doc in docs) >= k
+    ]
+    if not common:
+        return [""]
+    longest_length = max(len(substr) for substr in common)
+    return sorted(substr for substr in common if len(substr) == longest_length)
+
+
+def test_empty_generalized_suffix_trie(helper):
+    gst = GeneralizedSuffixTrie()
+    assert len(gst) == 0
+    assert gst.is_empty()
+    assert not gst.has_substring(helper.get_string())
+    assert gst.count_pattern_occurrences(helper.get_string()) == 0
+    assert gst.get_occurrences(helper.get_string()) == []
+    assert gst.get_longest_common_substring() == []
+    with pytest.raises(TypeError):
+        GeneralizedSuffixTrie(helper.get_int())
+    with pytest.raises(TypeError):
+        gst.add(helper.get_int())
+    with pytest.raises(ValueError):
+        gst.add("")
+    with pytest.raises(ValueError):
+        gst.add(None)
+
+
+def test_generalized_suffix_trie_with_known_values():
+    gst = GeneralizedSuffixTrie(["banana", "ananas"])
+    assert gst.add("cabana") == 2
+    assert len(gst) == 3
+    assert not gst.is_empty()
+    assert gst.has_substring("nas")
+    assert not gst.has_substring("nab")
+    assert not gst.has_substring(1)
+    assert gst.count_pattern_occurrences("ana") == 5
+    assert gst.count_pattern_occurrences("") == 0
+    assert gst.get_occurrences("ana") == [
+        (0, 1), (0, 3), (1, 0), (1, 2), (2, 3)
+    ]
+    assert gst.get_occurrences("bann") == []
+    assert gst.get_longest_common_substring() == ["ana"]
+    assert gst.get_longest_common_substring(k=2) == ["anana"]
+    assert sorted(gst.get_longest_common_substring(k=1)) == [
+        "ananas", "banana", "cabana"
+    ]
+    with pytest.raises(TypeError):
+        gst.get_longest_common_substring(k="2")
+    with pytest.raises(ValueError):
+        gst.get_longest_common_substring(k=4)
+    gst.clear()
+    assert gst.is_empty()
+    assert gst.add("banana") == 0
+
+
+def test_generalized_suffix_trie_against_brute_force():
+    for _ in range(100):
+        docs = [
+            "".join(random.choice("abc") for _ in range(random.randint(1, 10)))
+            for _ in range(random.randint(1, 6))
+        ]
+        gst = GeneralizedSuffixTrie()
+        for doc_id, doc in enumerate(docs):
+            assert gst.add(doc) == doc_id
+        for _ in range(10):
+            pattern = "".join(
+                random.choice("abc") for _ in range(random.randint(1, 4))
+            )
+            expected = [
+                (doc_id, offset)
+                for doc_id, doc in enumerate(docs)
+                for offset in range(len(doc))
+                if doc.startswith(pattern, offset)
+            ]
+            assert gst.get_occurrences(pattern) == expected
+            assert gst.count_pattern_occurrences(pattern) == len(expected)
+            assert gst.has_substring(pattern) == bool(expected)
+        for k in range(1, len(docs) + 1):
+            assert sorted(
+                gst.get_longest_common_substring(k)
+            ) == brute_force_lcs(docs, k)
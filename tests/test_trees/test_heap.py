@@ -1,3 +1,5 @@
+import array
+import random
 import pytest
 
 from extra.trees._heap import Heap, HeapNode
@@ -194,7 +196,7 @@ def test_heapify_of_max_heap_big_example(helper):
     assert heap.get_max() == max(lst)
     assert heap.get_min() == min(lst)
     for node, value in zip(
-        heap, [190, 15, 102, 8, 13, 17, 100, 1, 5, 4, 9, 3, 10, 6, 90]
+        heap, [190, 17, 102, 9, 15, 100, 10, 4, 8, 3, 6, 90, 13, 5, 1]
     ):
         assert node == value
     for num in lst:
@@ -233,3 +235,147 @@ def test_insert_remove_max_heap(helper):
     assert heap.get_min() == 14
     assert heap.get_max() == 42
     assert helper.verify_max_heap(heap._transform()._root)
+
+
+def test_heapify_builds_from_any_iterable(helper):
+    lst = [helper.get_float() for _ in range(1000)]
+    for HeapClass in [MinHeap, MaxHeap]:
+        for iterable in [lst, tuple(lst), array.array("d", lst), iter(lst)]:
+            heap = HeapClass.heapify(iterable)
+            assert len(heap) == len(lst)
+            assert sorted(heap.to_list()) == sorted(lst)
+            assert heap.get_min() == min(lst)
+            assert heap.get_max() == max(lst)
+            if HeapClass == MinHeap:
+                assert helper.verify_min_heap(heap._transform()._root)
+            else:
+                assert helper.verify_max_heap(heap._transform()._root)
+        with pytest.raises(ValueError):
+            HeapClass.heapify(lst + [None])
+        with pytest.raises(TypeError):
+            HeapClass.heapify(lst + [helper.get_string()])
+
+
+def verify_positions(heap):
+    positions = {}
+    for idx, value in enumerate(heap._heap):
+        positions.setdefault(value, set()).add(idx)
+    return heap._positions == positions
+
+
+def test_indexed_heap(helper):
+    with pytest.raises(TypeError):
+        MinHeap(indexed=helper.get_string())
+    for HeapClass in [MinHeap, MaxHeap]:
+        lst = [helper.get_int(-50, 50) for _ in range(300)]
+        heap = HeapClass.heapify(lst, indexed=True)
+        assert verify_positions(heap)
+        for _ in range(200):
+            heap.insert(helper.get_int(-50, 50))
+            value = random.choice(heap.to_list())
+            heap.remove(value)
+            value = random.choice(heap.to_list())
+            heap.update(value, helper.get_int(-50, 50))
+            value = random.choice(heap.to_list())
+            heap.decrease_key(value, value - helper.get_pos_int(b=10))
+            assert verify_positions(heap)
+        if HeapClass == MinHeap:
+            assert helper.verify_min_heap(heap._transform()._root)
+        else:
+            assert helper.verify_max_heap(heap._transform()._root)
+        assert 1000 not in heap
+        with pytest.warns(UserWarning):
+            heap.remove(1000)
+        with pytest.warns(UserWarning):
+            heap.update(1000, 1)
+        with pytest.raises(ValueError):
+            heap.decrease_key(heap.get_min(), heap.get_min() + 1)
+        # the heap keeps being indexed after being emptied
+        while not heap.is_empty():
+            heap.remove_min()
+            assert verify_positions(heap)
+        heap.clear()
+        assert heap._positions == {}
+
+
+def test_remove_moves_last_value_up_when_needed(helper):
+    # removing a leaf of the right subtree brings a smaller value under a
+    # bigger parent of the left subtree
+    heap = MinHeap.heapify([0, 10, 1, 11, 12, 2, 3])
+    heap.remove(11)
+    assert helper.verify_min_heap(heap._transform()._root)
+    assert heap.to_list() == [0, 3, 1, 10, 12, 2]
+    heap = MaxHeap.heapify([100, 10, 90, 9, 8, 89, 88])
+    heap.remove(9)
+    assert helper.verify_max_heap(heap._transform()._root)
+    assert heap.to_list() == [100, 88, 90, 10, 8, 89]
+
+
+def test_iter_and_repr_use_list_shaped_heap(helper):
+    for HeapClass in [MinHeap, MaxHeap]:
+        assert list(HeapClass()) == []
+        for length in [1, 2, 3, 7, 10, 31, 100]:
+            lst = [helper.get_float() for _ in range(length)]
+            heap = HeapClass.heapify(lst)
+            assert list(heap) == heap.to_list()
+            # same drawing as the tree-shaped heap
+            assert repr(heap) == repr(heap._transform())
+
+
+def test_packed_heap(helper):
+    with pytest.raises(TypeError):
+        MinHeap(typecode=helper.get_int())
+    with pytest.raises(ValueError):
+        MinHeap(typecode="u")
+    for HeapClass in [MinHeap, MaxHeap]:
+        lst = [helper.get_float() for _ in range(300)]
+        packed_heap = HeapClass.heapify(lst, indexed=True, typecode="d")
+        heap = HeapClass.heapify(lst, indexed=True)
+        assert isinstance(packed_heap._heap, array.array)
+        assert packed_heap.to_list() == heap.to_list()
+        for _ in range(100):
+            value = helper.get_float()
+            packed_heap.insert(value)
+            heap.insert(value)
+            value = random.choice(heap.to_list())
+            packed_heap.remove(value)
+            heap.remove(value)
+            value = random.choice(heap.to_list())
+            packed_heap.decrease_key(value, value - 1)
+            heap.decrease_key(value, value - 1)
+            assert verify_positions(packed_heap)
+        assert packed_heap.to_list() == heap.to_list()
+        assert list(packed_heap) == heap.to_list()
+        assert repr(packed_heap) == repr(heap)
+        assert packed_heap.get_min() == heap.get_min()
+        assert packed_heap.get_max() == heap.get_max()
+        # the buffer shares the packed values
+        with packed_heap.get_buffer() as view:
+            assert view.format == "d" and view.readonly
+            assert view.tolist() == heap.to_list()
+            with pytest.raises(TypeError):
+                view[0] = helper.get_float()
+            if hasattr(memoryview, "toreadonly"):
+                with pytest.raises(BufferError):
+                    packed_heap.insert(helper.get_float())
+            else:
+                # older versions get a snapshot of the values
+                value = helper.get_float()
+                packed_heap.insert(value)
+                assert view.tolist() == heap.to_list()
+                packed_heap.remove(value)
+        with pytest.raises(TypeError):
+            heap.get_buffer()
+        # same-typecode arrays and integer type codes
+        packed_heap = HeapClass.heapify(array.array("i", [3, 1, 2]))
+        assert sorted(packed_heap.to_list()) == [1, 2, 3]
+        packed_heap = HeapClass.heapify([3, 1, 2], typecode="i")
+        with pytest.raises(TypeError):
+            packed_heap.insert(helper.get_float())
+        with pytest.raises(OverflowError):
+            packed_heap.insert(2**40)
+        assert len(packed_heap) == 3
+        packed_heap.clear()
+        assert packed_heap.is_empty()
+        assert packed_heap._typecode == "i"
+        test_empty_heap(helper, HeapClass(typecode="d"))
@@ -1,4 +1,5 @@
 import pytest
+import random
 
 from extra.trees.radix_trie import TrieNode, RadixTrie
 
@@ -131,3 +132,81 @@ def test_radix_with_multi_words():
     assert rt.has_prefix("s")
     assert not rt.has_prefix("sloww")
     assert rt.has_prefix("slow")
+
+
+def test_radix_trie_against_set():
+    rng = random.Random(7)
+    words = {
+        "".join(rng.choice("abc") for _ in range(rng.randint(1, 8)))
+        for _ in range(200)
+    }
+    rt = RadixTrie()
+    for word in words:
+        rt.insert(word)
+    for _ in range(500):
+        query = "".join(rng.choice("abc") for _ in range(rng.randint(0, 9)))
+        assert (query in rt) == (query in words)
+        expected = sorted(w for w in words if w.startswith(query))
+        assert rt.has_prefix(query) == bool(expected)
+        assert sorted(rt.auto_complete(query)) == expected
+    for query in ["abcabcabc", "cab", "aaaaaaaaa", "x"]:
+        node, idx = rt._follow_path(query)
+        path = ""
+        while node is not rt._root:
+            path = node.get_data() + path
+            node = node.get_parent()
+        assert path == query[:idx]
+
+
+def test_radix_trie_top_k_auto_complete():
+    rt = RadixTrie()
+    rt.insert("test", 4)
+    rt.insert("toaster", 10)
+    rt.insert("toasting", 6)
+    rt.insert("slow", 8)
+    rt.insert("slowly", 1)
+    rt.insert("toast", 6)
+    assert rt.auto_complete(k=3) == ["toaster", "slow", "toast"]
+    assert rt.auto_complete("toa", k=2) == ["toaster", "toast"]
+    assert rt.auto_complete("slowl", k=5) == ["slowly"]
+    # splitting a node keeps the scores of the words below it
+    rt.insert("to", 5)
+    assert rt.auto_complete("t", k=5) == [
+        "toaster", "toast", "toasting", "to", "test"
+    ]
+    rt.remove("toaster")
+    rt.insert("toast", 0)
+    assert rt.auto_complete("t", k=2) == ["toasting", "to"]
+    # NaN can't be ranked
+    with pytest.raises(ValueError):
+        rt.insert("toast", float("nan"))
+    assert rt.auto_complete("t", k=2) == ["toasting", "to"]
+
+
+def test_radix_trie_iter_complete():
+    rt = RadixTrie()
+    for word in ["toasting", "test", "toaster", "slowly", "toast", "slow"]:
+        rt.insert(word)
+    assert list(rt.iter_complete()) == [
+        "slow", "slowly", "test", "toast", "toaster", "toasting"
+    ]
+    # the prefix ends in the middle of a node
+    assert list(rt.iter_complete("toaste")) == ["toaster"]
+    assert list(rt.iter_complete("to")) == ["toast", "toaster", "toasting"]
+    assert list(rt.iter_complete("tx")) == []
+    stream = rt.iter_complete("t")
+    assert next(stream) == "test"
+    stream.close()
+    assert list(rt.iter_complete("sl")) == ["slow", "slowly"]
+
+
+def test_radix_trie_search_fuzzy():
+    rt = RadixTrie()
+    for word in ["test", "toaster", "toasting", "slow", "slowly", "toast"]:
+        rt.insert(word)
+    assert rt.search_fuzzy("toast", 0) == [("toast", 0)]
+    assert rt.search_fuzzy("toasted", 2) == [("toaster", 1), ("toast", 2)]
+    assert rt.search_fuzzy("slo") == [("slow", 1)]
+    # the distance bound is hit in the middle of a node's data
+    assert rt.search_fuzzy("toastinf", 1) == [("toasting", 1)]
+    assert rt.search_fuzzy("tost", 2) == [("test", 1), ("toast", 1)]
@@ -602,3 +602,39 @@ def test_double_black_right_right_case(helper):
     assert rbtree._root.get_right().get_color() == Color.BLACK
     assert rbtree._root.get_right().get_left() is None
     assert rbtree._root.get_right().get_left() is None
+
+
+def verify_red_black_rules(rbtree):
+    # returns the black height if the rules hold, -1 if not
+    def black_height(node):
+        if node is None:
+            return 1
+        left_height = black_height(node.get_left())
+        right_height = black_height(node.get_right())
+        if left_height == -1 or left_height != right_height:
+            return -1
+        if node.get_color() == Color.RED and any(
+            child.get_color() == Color.RED for child in node.get_children()
+        ):
+            return -1
+        return left_height + (node.get_color() == Color.BLACK)
+
+    if rbtree._root is not None and rbtree._root.get_color() != Color.BLACK:
+        return -1
+    return black_height(rbtree._root)
+
+
+def test_red_black_tree_from_sorted(helper):
+    for length in range(1, 70):
+        lst = list(range(length))
+        rbtree = RedBlackTree.from_sorted(lst)
+        assert len(rbtree) == length
+        assert helper.verify_bst_rules(rbtree._root)
+        assert verify_red_black_rules(rbtree) != -1
+        assert rbtree.traverse() == lst
+    # inserting after bulk-loading keeps the rules
+    rbtree = RedBlackTree.from_sorted(list(range(0, 200, 2)))
+    for value in range(1, 200, 6):
+        rbtree.insert(value)
+        assert verify_red_black_rules(rbtree) != -1
+    assert helper.verify_bst_rules(rbtree._root)
@@ -1,4 +1,5 @@
 # import pytest
+import sys
 
 from extra.trees.bst import BSTNode
 from extra.trees.splay_tree import SplayTree
@@ -117,3 +118,17 @@ def test_splay_tree_example3(helper):
     stree.remove(30)
     assert stree._root.get_data() in {28, 35}
     assert helper.verify_bst_rules(stree._root)
+
+
+def test_degenerate_splay_tree(helper):
+    length = sys.getrecursionlimit() + 500
+    stree = SplayTree(range(length))
+    assert len(stree) == length
+    # the smallest value lies at the bottom of a left-only path
+    assert 0 in stree
+    assert stree._root.get_data() == 0
+    assert helper.verify_bst_rules(stree._root)
+    stree.remove(length // 2)
+    assert len(stree) == length - 1
+    assert stree.get_min() == 0
+    assert stree.get_max() == length - 1
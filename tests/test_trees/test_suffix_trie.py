@@ -1,6 +1,13 @@
+import os
+import random
+
 import pytest
 
-from extra.trees.suffix_trie import SuffixTrie
+from extra.trees.suffix_trie import (
+    get_suffix_array,
+    get_lcp_array,
+    SuffixTrie,
+)
 
 
 def test_lcs():
@@ -85,31 +92,222 @@ def test_count_pattern_occurrence():
     assert st.count_pattern_occurrences("bananab") == 0
 
 
-# def test_get_longest_palindrome():
-#     assert SuffixTrie("banana").get_longest_palindrome() == "anana"
-#     assert SuffixTrie("nonsense").get_longest_palindrome() == "non"
-#     assert (
-#         SuffixTrie("1234aba4321").get_longest_palindrome() == "1234aba4321"
-#     )
-#     assert SuffixTrie("xababayz").get_longest_palindrome() == "ababa"
-#     assert SuffixTrie("abacdfgdcaba").get_longest_palindrome() == "aba"
-#     assert SuffixTrie("pqrqpabcdfgdcba").get_longest_palindrome() == "pqrqp"
-#     assert SuffixTrie("pqqpabcdfghfdcba").get_longest_palindrome() == "pqqp"
-#     assert SuffixTrie("cabbaabb").get_longest_palindrome() == "bbaabb"
-#     assert (
-#         SuffixTrie("forgeeksskeegfor").get_longest_palindrome()
-#         == "geeksskeeg"
-#     )
-#     assert SuffixTrie("abcde").get_longest_palindrome() == "a"
-#     assert SuffixTrie("abcdae").get_longest_palindrome() == "a"
-#     assert SuffixTrie("abacd").get_longest_palindrome() == "aba"
-#     assert SuffixTrie("abcdc").get_longest_palindrome() == "cdc"
-#     assert SuffixTrie("abacdfgdcaba").get_longest_palindrome() == "aba"
-#     assert SuffixTrie("xyabacdfgdcaba").get_longest_palindrome() == "aba"
-#     assert SuffixTrie("xababayz").get_longest_palindrome() == "ababa"
-#     assert SuffixTrie("xabax").get_longest_palindrome() == "xabax"
+def test_get_longest_palindrome():
+    assert SuffixTrie("banana").get_longest_palindrome() == "anana"
+    assert SuffixTrie("nonsense").get_longest_palindrome() == "non"
+    assert (
+        SuffixTrie("1234aba4321").get_longest_palindrome() == "1234aba4321"
+    )
+    assert SuffixTrie("xababayz").get_longest_palindrome() == "ababa"
+    assert SuffixTrie("abacdfgdcaba").get_longest_palindrome() == "aba"
+    assert SuffixTrie("pqrqpabcdfgdcba").get_longest_palindrome() == "pqrqp"
+    assert SuffixTrie("pqqpabcdfghfdcba").get_longest_palindrome() == "pqqp"
+    assert SuffixTrie("cabbaabb").get_longest_palindrome() == "bbaabb"
+    assert (
+        SuffixTrie("forgeeksskeegfor").get_longest_palindrome()
+        == "geeksskeeg"
+    )
+    assert SuffixTrie("abcde").get_longest_palindrome() == "a"
+    assert SuffixTrie("abcdae").get_longest_palindrome() == "a"
+    assert SuffixTrie("abacd").get_longest_palindrome() == "aba"
+    assert SuffixTrie("abcdc").get_longest_palindrome() == "cdc"
+    assert SuffixTrie("abacdfgdcaba").get_longest_palindrome() == "aba"
+    assert SuffixTrie("xyabacdfgdcaba").get_longest_palindrome() == "aba"
+    assert SuffixTrie("xababayz").get_longest_palindrome() == "ababa"
+    assert SuffixTrie("xabax").get_longest_palindrome() == "xabax"
 
 
 def test_suffix_array():
     st = SuffixTrie("banana")
     assert st.to_suffix_array() == [6, 5, 3, 1, 0, 4, 2]
+
+
+def test_suffix_and_lcp_arrays():
+    assert get_suffix_array("") == [0]
+    assert get_suffix_array("banana") == [6, 5, 3, 1, 0, 4, 2]
+    assert get_lcp_array("banana", [6, 5, 3, 1, 0, 4, 2]) == [
+        0, 0, 1, 3, 0, 0, 2
+    ]
+    for _ in range(100):
+        word = "".join(
+            random.choice("ab c") for _ in range(random.randint(1, 50))
+        )
+        suffix_array = get_suffix_array(word)
+        assert suffix_array == [len(word)] + sorted(
+            range(len(word)), key=lambda idx: word[idx:]
+        )
+        lcp_array = get_lcp_array(word, suffix_array)
+        assert lcp_array[0] == 0
+        for i in range(1, len(suffix_array)):
+            assert lcp_array[i] == len(
+                os.path.commonprefix(
+                    [word[suffix_array[i - 1]:], word[suffix_array[i]:]]
+                )
+            )
+
+
+def test_suffix_array_engine():
+    with pytest.raises(ValueError):
+        SuffixTrie("banana", engine="suffix_tree!")
+    st = SuffixTrie("banana", engine="suffix_array")
+    assert st._rt is None
+    assert st.to_suffix_array() == [6, 5, 3, 1, 0, 4, 2]
+    assert st.has_substring("")
+    assert st.has_substring("nan")
+    assert not st.has_substring("nab")
+    assert not st.has_substring(1)
+    assert st.count_pattern_occurrences("") == 0
+    assert st.count_pattern_occurrences("ana") == 2
+    assert st.get_longest_repeated_substring() == ["ana"]
+    assert st.get_lowest_common_ancestor(1, 5) == "a"
+    assert st.get_lowest_common_ancestor(1, 6) == ""
+    # the trie is built only when needed
+    assert len(st) == 11
+    assert st._rt is not None
+    # both engines give the same answers
+    for _ in range(50):
+        word = "".join(
+            random.choice("abc") for _ in range(random.randint(1, 30))
+        )
+        rt_st = SuffixTrie(word)
+        sa_st = SuffixTrie(word, engine="suffix_array")
+        assert rt_st.to_suffix_array() == sa_st.to_suffix_array()
+        for _ in range(20):
+            pattern = "".join(
+                random.choice("abc") for _ in range(random.randint(0, 5))
+            )
+            assert rt_st.has_substring(pattern) == (pattern in word)
+            assert sa_st.has_substring(pattern) == (pattern in word)
+            assert rt_st.count_pattern_occurrences(
+                pattern
+            ) == sa_st.count_pattern_occurrences(pattern)
+            i = random.randint(0, len(word) - 1)
+            j = random.randint(0, len(word))
+            assert rt_st.get_lowest_common_ancestor(
+                i, j
+            ) == sa_st.get_lowest_common_ancestor(i, j)
+        # brute-force longest repeated substrings
+        repeated = {
+            word[i:j]
+            for i in range(len(word))
+            for j in range(i, len(word) + 1)
+            if word.find(word[i:j], i + 1) != -1
+        }
+        longest_length = max(len(substr) for substr in repeated)
+        expected = sorted(
+            substr for substr in repeated if len(substr) == longest_length
+        )
+        assert sorted(rt_st.get_longest_repeated_substring()) == expected
+        assert sorted(sa_st.get_longest_repeated_substring()) == expected
+
+
+def test_suffix_tree_engine():
+    st = SuffixTrie("banana", engine="suffix_tree")
+    assert st._rt is None
+    assert len(st) == 11
+    assert st.get_height() == 3
+    assert st.get_depth() == 0
+    assert st.count_leaf_nodes() == 7
+    assert st.has_substring("")
+    assert st.has_substring("anan")
+    assert not st.has_substring("ana$")
+    assert st.count_pattern_occurrences("") == 0
+    assert st.count_pattern_occurrences("a") == 3
+    assert st.count_pattern_occurrences("nab") == 0
+    assert st.get_longest_repeated_substring() == ["ana"]
+    assert st.get_lowest_common_ancestor(2, 4) == "na"
+    assert st.get_lowest_common_ancestor(1, 1) == "ana"
+    assert st.get_lowest_common_ancestor(0, 6) == ""
+    # edges are offsets into the word
+    for node in range(1, len(st)):
+        assert 0 <= st._starts[node] < st._ends[node] <= 7
+    # the trie is built only when needed
+    assert st.to_list() == SuffixTrie("banana").to_list()
+    # both engines give the same answers
+    for _ in range(50):
+        word = "".join(
+            random.choice("abc") for _ in range(random.randint(1, 30))
+        )
+        rt_st = SuffixTrie(word)
+        tree_st = SuffixTrie(word, engine="suffix_tree")
+        assert len(rt_st) == len(tree_st)
+        assert rt_st.get_height() == tree_st.get_height()
+        assert rt_st.count_leaf_nodes() == tree_st.count_leaf_nodes()
+        assert sorted(rt_st.get_longest_repeated_substring()) == sorted(
+            tree_st.get_longest_repeated_substring()
+        )
+        for _ in range(20):
+            pattern = "".join(
+                random.choice("abc") for _ in range(random.randint(0, 5))
+            )
+            assert tree_st.has_substring(pattern) == (pattern in word)
+            assert rt_st.count_pattern_occurrences(
+                pattern
+            ) == tree_st.count_pattern_occurrences(pattern)
+            i = random.randint(0, len(word) - 1)
+            j = random.randint(0, len(word))
+            assert rt_st.get_lowest_common_ancestor(
+                i, j
+            ) == tree_st.get_lowest_common_ancestor(i, j)
+
+
+def test_lcp():
+    st = SuffixTrie("banana")
+    assert st.lcp(1, 3) == 3
+    assert st.lcp(3, 1) == 3
+    assert st.lcp(2, 2) == 4
+    assert st.lcp(0, 6) == 0
+    with pytest.raises(TypeError):
+        st.lcp("1", 3)
+    with pytest.raises(ValueError):
+        st.lcp(-1, 3)
+    with pytest.raises(ValueError):
+        st.lcp(1, 7)
+    for engine in SuffixTrie.ENGINES:
+        for _ in range(20):
+            word = "".join(
+                random.choice("ab") for _ in range(random.randint(1, 40))
+            )
+            st = SuffixTrie(word, engine=engine)
+            for _ in range(20):
+                i = random.randint(0, len(word) - 1)
+                j = random.randint(0, len(word))
+                expected = os.path.commonprefix([word[i:], word[j:]])
+                assert st.lcp(i, j) == len(expected)
+                if i != j:
+                    assert st.get_lowest_common_ancestor(i, j) == expected
+
+
+def test_palindromes():
+    st = SuffixTrie("banana", engine="suffix_array")
+    assert st.count_palindromes() == 10
+    assert st.count_palindromes(min_len=3) == 4
+    assert list(st.iter_palindromes(min_len=3)) == [
+        (1, "ana"), (1, "anana"), (2, "nan"), (3, "ana")
+    ]
+    assert list(st.iter_palindromes(min_len=6)) == []
+    with pytest.raises(TypeError):
+        st.count_palindromes("1")
+    with pytest.raises(ValueError):
+        list(st.iter_palindromes(0))
+    for _ in range(100):
+        word = "".join(
+            random.choice("ab") for _ in range(random.randint(1, 30))
+        )
+        st = SuffixTrie(word, engine="suffix_array")
+        palindromes = [
+            (i, word[i:j])
+            for i in range(len(word))
+            for j in range(i + 1, len(word) + 1)
+            if word[i:j] == word[i:j][::-1]
+        ]
+        longest_length = max(len(p) for _, p in palindromes)
+        assert st.get_longest_palindrome() == min(
+            (i, p) for i, p in palindromes if len(p) == longest_length
+        )[1]
+        for min_len in range(1, 5):
+            expected = sorted(
+                (i, p) for i, p in palindromes if len(p) >= min_len
+            )
+            assert st.count_palindromes(min_len) == len(expected)
+            assert sorted(st.iter_palindromes(min_len)) == expected
@@ -1,3 +1,4 @@
+import random
 import pytest
 
 from extra.trees.treap import TreapNode, Treap
@@ -204,3 +205,25 @@ def test_treap_with_random_numbers(helper):
         assert item not in treap
     assert len(treap) == 1
     treap.remove(treap._root.get_data())
+
+
+def test_treap_from_sorted(helper):
+    lst = sorted({helper.get_int() for _ in range(500)})
+    treap = Treap.from_sorted(lst, seed="extra")
+    assert len(treap) == len(lst)
+    assert helper.verify_bst_rules(treap._root)
+    assert helper.verify_treap_priority(treap._root)
+    assert treap.is_balanced()
+    assert treap.traverse() == lst
+    # the same seed gives the same priorities
+    other_treap = Treap.from_sorted(lst, seed="extra")
+    assert treap._root.get_priority() == other_treap._root.get_priority()
+    # the treap keeps its rules afterwards
+    # every insertion adds a new value and every removal hits a stored one
+    new_values = random.sample(range(1001, 2001), 100)
+    for new_value, value in zip(new_values, random.sample(lst, 100)):
+        treap.insert(new_value)
+        treap.remove(value)
+    assert len(treap) == len(lst)
+    assert helper.verify_bst_rules(treap._root)
+    assert helper.verify_treap_priority(treap._root)
@@ -109,3 +109,56 @@ def test_invalid_path(helper):
     val = helper.get_string()
     with pytest.raises(ValueError):
         Tree.from_path(val)
+
+
+def test_cached_subtree_stats(helper):
+    def count_nodes(node):
+        return 1 + sum(count_nodes(child) for child in node.get_children())
+
+    def get_height(node):
+        return max(
+            (1 + get_height(child) for child in node.get_children()),
+            default=0,
+        )
+
+    def check(tree):
+        stack = [tree._root]
+        while stack:
+            node = stack.pop()
+            assert node._subtree_size == count_nodes(node)
+            assert node._subtree_height == get_height(node)
+            stack.extend(node.get_children())
+        assert len(tree) == count_nodes(tree._root)
+        assert tree.get_height() == get_height(tree._root)
+
+    # grow a random tree one child at a time
+    t = Tree()
+    t._root = TreeNode(helper.get_int())
+    nodes = [t._root]
+    for _ in range(200):
+        node = TreeNode(helper.get_int())
+        nodes[helper.get_pos_int(a=0, b=len(nodes) - 1)].set_child(node)
+        nodes.append(node)
+    check(t)
+    # attaching a subtree updates every ancestor
+    subtree = TreeNode(helper.get_int())
+    subtree.set_children([TreeNode(helper.get_int()) for _ in range(5)])
+    nodes[-1].set_child(subtree)
+    check(t)
+    # replacing children can shrink the height of the ancestors
+    for node in reversed(nodes[1:]):
+        node.set_children([])
+        check(t)
+    t._root.set_children([])
+    assert len(t) == 1
+    assert t.get_height() == 0
+    # a degenerate tree doesn't hit the recursion limit
+    t = Tree()
+    t._root = node = TreeNode(0)
+    for i in range(1, 5000):
+        child = TreeNode(i)
+        node.set_child(child)
+        node = child
+    assert len(t) == 5000
+    assert t.get_height() == 4999
+    assert t._get_depth(node) == 4999
@@ -1,4 +1,5 @@
 import pytest
+import random
 
 from extra.trees.trie import TrieNode, Trie
 
@@ -106,3 +107,125 @@ def test_trie_many_words():
     assert t.auto_complete("c") == ["car", "card", "cards", "cot", "cots"]
     assert t.auto_complete("tri") == ["trie", "tried", "tries"]
     assert t.auto_complete("caa") == []
+
+
+def test_trie_remove_last_word():
+    t = Trie()
+    t.insert("tre")
+    t.remove("tre")
+    assert t.is_empty()
+    assert t.auto_complete() == []
+
+
+def test_trie_top_k_auto_complete():
+    t = Trie()
+    t.insert("car", score=2)
+    t.insert("card", score=7)
+    t.insert("cards", score=1)
+    t.insert("cot", score=7)
+    t.insert("try", score=9)
+    assert t.auto_complete(k=3) == ["try", "card", "cot"]
+    assert t.auto_complete("c", k=2) == ["card", "cot"]
+    assert t.auto_complete("car", k=10) == ["card", "car", "cards"]
+    assert t.auto_complete("x", k=2) == []
+    assert t.auto_complete("c", k=0) == []
+    # updating and removing words updates the ranking
+    t.insert("card", score=0)
+    t.remove("cot")
+    assert t.auto_complete("c", k=2) == ["car", "cards"]
+    with pytest.raises(TypeError):
+        t.insert("cat", score="1")
+    # NaN can't be ranked
+    with pytest.raises(ValueError):
+        t.insert("cat", score=float("nan"))
+    assert "cat" not in t
+    assert "cat" not in t.freeze()
+    with pytest.raises(TypeError):
+        t.auto_complete("c", k=1.0)
+    with pytest.raises(ValueError):
+        t.auto_complete("c", k=-1)
+    # compare against sorting all words
+    rng = random.Random(0)
+    t, scores = Trie(), {}
+    for _ in range(500):
+        word = "".join(rng.choice("abc") for _ in range(rng.randint(1, 6)))
+        if scores and rng.random() < 0.2:
+            word = rng.choice(list(scores))
+            t.remove(word)
+            del scores[word]
+        else:
+            scores[word] = rng.randint(0, 50)
+            t.insert(word, scores[word])
+        prefix = "".join(rng.choice("abc") for _ in range(rng.randint(0, 2)))
+        expected = sorted(
+            (w for w in scores if w.startswith(prefix)),
+            key=lambda w: (-scores[w], w),
+        )
+        assert t.auto_complete(prefix, k=5) == expected[:5]
+
+
+def test_trie_iter_complete():
+    t = Trie()
+    for word in ["tries", "car", "try", "cards", "trie", "card", "cot"]:
+        t.insert(word)
+    assert list(t.iter_complete()) == [
+        "car", "card", "cards", "cot", "trie", "tries", "try"
+    ]
+    assert list(t.iter_complete("tri")) == ["trie", "tries"]
+    assert list(t.iter_complete("trx")) == []
+    stream = t.iter_complete("c")
+    assert next(stream) == "car"
+    assert next(stream) == "card"
+    stream.close()
+    assert list(t.iter_complete("ca")) == ["car", "card", "cards"]
+    with pytest.raises(TypeError):
+        t.iter_complete(1)
+
+
+def get_edit_distance(word1, word2):
+    row = list(range(len(word2) + 1))
+    for i, ch1 in enumerate(word1, 1):
+        next_row = [i]
+        for j, ch2 in enumerate(word2, 1):
+            next_row.append(
+                min(next_row[-1] + 1, row[j] + 1, row[j - 1] + (ch1 != ch2))
+            )
+        row = next_row
+    return row[-1]
+
+
+def test_trie_search_fuzzy():
+    t = Trie()
+    for word in ["car", "cart", "cast", "cat", "trie", "try"]:
+        t.insert(word)
+    assert t.search_fuzzy("cat", 0) == [("cat", 0)]
+    assert t.search_fuzzy("cat") == [
+        ("cat", 0), ("car", 1), ("cart", 1), ("cast", 1)
+    ]
+    assert t.search_fuzzy("tree") == [("trie", 1)]
+    assert t.search_fuzzy("", 3) == [("car", 3), ("cat", 3), ("try", 3)]
+    assert t.search_fuzzy("xyz") == []
+    with pytest.raises(TypeError):
+        t.search_fuzzy(1)
+    with pytest.raises(TypeError):
+        t.search_fuzzy("cat", 1.0)
+    with pytest.raises(ValueError):
+        t.search_fuzzy("cat", -1)
+    # compare against computing the edit distance of every word
+    rng = random.Random(0)
+    t, words = Trie(), set()
+    for _ in range(200):
+        word = "".join(rng.choice("abc") for _ in range(rng.randint(1, 6)))
+        t.insert(word)
+        words.add(word)
+    for _ in range(50):
+        query = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 6)))
+        max_distance = rng.randint(0, 3)
+        expected = [
+            (word, get_edit_distance(query, word)) for word in words
+        ]
+        expected = sorted(
+            (item for item in expected if item[1] <= max_distance),
+            key=lambda item: (item[1], item[0]),
+        )
+        assert t.search_fuzzy(query, max_distance) == expected